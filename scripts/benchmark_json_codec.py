@@ -0,0 +1,72 @@
+"""Compare the client's JSON codec against the standard library on large File/Block payloads.
+
+Usage: python scripts/benchmark_json_codec.py [num_files] [blocks_per_file]
+"""
+import json
+import sys
+import timeit
+
+from steamship import Block, File, Tag
+from steamship.utils import json_codec
+
+
+def build_payload(num_files: int, blocks_per_file: int) -> dict:
+    files = [
+        File(
+            id=f"file-{i}",
+            handle=f"file-{i}",
+            mime_type="text/plain",
+            tags=[Tag(id=f"file-tag-{i}", kind="source", name="benchmark", value={"i": i})],
+            blocks=[
+                Block(
+                    id=f"block-{i}-{j}",
+                    file_id=f"file-{i}",
+                    text="The quick brown fox jumps over the lazy dog. " * 8,
+                    tags=[
+                        Tag(
+                            id=f"tag-{i}-{j}",
+                            kind="token",
+                            name="word",
+                            start_idx=0,
+                            end_idx=9,
+                            value={"score": 0.5, "labels": ["a", "b", "c"]},
+                        )
+                    ],
+                )
+                for j in range(blocks_per_file)
+            ],
+        )
+        for i in range(num_files)
+    ]
+    return {"files": [file.dict(by_alias=True, exclude={"client": True}) for file in files]}
+
+
+def bench(label: str, fn, number: int) -> float:
+    seconds = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"{label:<28} {seconds * 1000:8.2f} ms")
+    return seconds
+
+
+def main():
+    num_files = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    blocks_per_file = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    payload = build_payload(num_files, blocks_per_file)
+    encoded = json.dumps(payload).encode("utf-8")
+    print(
+        f"{num_files} files x {blocks_per_file} blocks, {len(encoded) / 1e6:.1f} MB; "
+        f"codec backend: {json_codec.JSON_BACKEND}"
+    )
+
+    number = 5
+    stdlib_dumps = bench(
+        "encode (stdlib json)", lambda: json.dumps(payload).encode("utf-8"), number
+    )
+    codec_dumps = bench("encode (json_codec)", lambda: json_codec.dumps_bytes(payload), number)
+    stdlib_loads = bench("decode (stdlib json)", lambda: json.loads(encoded), number)
+    codec_loads = bench("decode (json_codec)", lambda: json_codec.loads(encoded), number)
+    print(f"encode speedup: {stdlib_dumps / codec_dumps:.1f}x")
+    print(f"decode speedup: {stdlib_loads / codec_loads:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare `filter_blocks_for_prompt_length` against its previous quadratic implementation on long chat histories.
+
+Tokens are counted as whitespace-separated words so that only the selection itself is measured (and so the
+benchmark does not need to download a tiktoken encoding). The legacy implementation takes minutes on 10k blocks, so
+it is timed on a smaller history of `legacy_blocks` blocks.
+
+Usage: python scripts/benchmark_prompt_length_filter.py [num_blocks] [legacy_blocks] [max_tokens]
+"""
+import logging
+import sys
+import timeit
+from typing import List
+
+from steamship import Block, SteamshipError
+from steamship.data.tags.tag_constants import RoleTag
+from steamship.utils import context_length
+
+
+class WordEncoding:
+    def encode(self, text: str) -> List[str]:
+        return text.split()
+
+
+def legacy_filter(max_tokens: int, blocks: List[Block]) -> List[int]:
+    """The implementation replaced in this release, re-tokenizing each block and testing retention by equality."""
+    encoding = WordEncoding()
+
+    def token_length(block: Block) -> int:
+        return len(encoding.encode(block.text))
+
+    retained_blocks = []
+    total_length = 0
+    for block in blocks:
+        if block.chat_role == RoleTag.SYSTEM:
+            retained_blocks.append(block)
+            total_length += token_length(block)
+    if total_length > max_tokens:
+        raise SteamshipError("system blocks too long")
+    num_system_blocks = len(retained_blocks)
+    for block in reversed(blocks):
+        if block.chat_role != RoleTag.SYSTEM and total_length < max_tokens:
+            block_length = token_length(block)
+            if block_length + total_length < max_tokens:
+                retained_blocks.append(block)
+                total_length += block_length
+    if len(retained_blocks) == num_system_blocks:
+        raise SteamshipError("no non-System blocks remained")
+    return [block.index_in_file for block in blocks if block in retained_blocks]
+
+
+def build_history(num_blocks: int) -> List[Block]:
+    blocks = []
+    for i in range(num_blocks):
+        role = RoleTag.SYSTEM if i == 0 else (RoleTag.USER if i % 2 else RoleTag.ASSISTANT)
+        # Distinct texts, so that a cold cache measures every block
+        text = f"message {i} " + " ".join(["word"] * (3 + i % 40))
+        block = Block(id=f"block-{i}", index_in_file=i, text=text)
+        block.set_chat_role(role)
+        blocks.append(block)
+    return blocks
+
+
+def bench(label: str, fn, number: int) -> float:
+    seconds = min(timeit.repeat(fn, number=number, repeat=3)) / number
+    print(f"{label:<28} {seconds * 1000:10.2f} ms")
+    return seconds
+
+
+def main():
+    num_blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    legacy_blocks = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    max_tokens = int(sys.argv[3]) if len(sys.argv) > 3 else 100000
+    logging.disable(logging.INFO)
+    context_length.get_encoding = lambda name="p50k_base": WordEncoding()
+
+    def current(blocks: List[Block]) -> List[int]:
+        return context_length.filter_blocks_for_prompt_length(max_tokens, blocks)
+
+    def cold(blocks: List[Block]) -> List[int]:
+        context_length.TOKEN_COUNT_CACHE.clear()
+        return current(blocks)
+
+    for size in sorted({legacy_blocks, num_blocks}):
+        blocks = build_history(size)
+        print(f"{size} blocks, {max_tokens} max tokens, {len(cold(blocks))} retained")
+        if size == legacy_blocks:
+            assert current(blocks) == legacy_filter(max_tokens, blocks)
+            legacy = bench("legacy", lambda: legacy_filter(max_tokens, blocks), 1)
+        current_cold = bench("current (cold token cache)", lambda: cold(blocks), 5)
+        current_warm = bench("current (warm token cache)", lambda: current(blocks), 5)
+        if size == legacy_blocks:
+            print(f"speedup (cold): {legacy / current_cold:.1f}x")
+            print(f"speedup (warm): {legacy / current_warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,7 +32,7 @@ from .data import (
     Workspace,
 )
 
-from .client import Steamship  # isort:skip
+from .client import AsyncSteamship, Steamship  # isort:skip
 
 SUPPORTED_PYTHON_VERSIONS = [(3, 10)]
 SUPPORTED_PYTHON_VERSION_NAMES = [f"{major}.{minor}" for major, minor in SUPPORTED_PYTHON_VERSIONS]
@@ -54,6 +54,7 @@ def is_supported_python_version() -> bool:
 
 __all__ = [
     "Steamship",
+    "AsyncSteamship",
     "Configuration",
     "SteamshipError",
     "MimeTypes",
@@ -93,15 +93,12 @@ Only use the functions you have been provided with."""
         return future_action
 
     def _function_calls_since_last_user_message(self, context: AgentContext) -> List[Block]:
-        function_calls = []
-        for block in context.chat_history.messages[::-1]:  # is this too inefficient at scale?
-            if block.chat_role == RoleTag.USER:
-                return reversed(function_calls)
-            if get_tag(block.tags, kind=TagKind.ROLE, name=RoleTag.FUNCTION):
-                function_calls.append(block)
-            elif get_tag(block.tags, kind=TagKind.FUNCTION_SELECTION):
-                function_calls.append(block)
-        return reversed(function_calls)
+        return [
+            block
+            for block in context.chat_history.messages_since_last(RoleTag.USER)
+            if get_tag(block.tags, kind=TagKind.ROLE, name=RoleTag.FUNCTION)
+            or get_tag(block.tags, kind=TagKind.FUNCTION_SELECTION)
+        ]
 
     def _to_openai_function_selection(self, action: Action) -> str:
         """NOTE: Temporary placeholder. Should be refactored"""
@@ -124,7 +121,7 @@ Only use the functions you have been provided with."""
             ),
             Tag(kind=TagKind.FUNCTION_SELECTION, name=action.tool),
         ]
-        context.chat_history.file.append_block(
+        context.chat_history.append_block(
             text=self._to_openai_function_selection(action), tags=tags, mime_type=MimeTypes.TXT
         )
 
@@ -149,7 +146,7 @@ Only use the functions you have been provided with."""
         # TODO(dougreid): I'm not convinced this is correct for tools that return multiple values.
         #                 It _feels_ like these should be named and inlined as a single message in history, etc.
         for block in action.output:
-            context.chat_history.file.append_block(
+            context.chat_history.append_block(
                 text=block.as_llm_input(exclude_block_wrapper=True),
                 tags=tags,
                 mime_type=block.mime_type,
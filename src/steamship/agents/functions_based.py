@@ -94,15 +94,12 @@ Only use the functions you have been provided with."""
         return future_action
 
     def _function_calls_since_last_user_message(self, context: AgentContext) -> Iterable[Block]:
-        function_calls = []
-        for block in context.chat_history.messages[::-1]:  # is this too inefficient at scale?
-            if block.chat_role == RoleTag.USER:
-                return reversed(function_calls)
-            if get_tag(block.tags, kind=TagKind.ROLE, name=RoleTag.FUNCTION):
-                function_calls.append(block)
-            elif get_tag(block.tags, kind=TagKind.FUNCTION_SELECTION):
-                function_calls.append(block)
-        return reversed(function_calls)
+        return [
+            block
+            for block in context.chat_history.messages_since_last(RoleTag.USER)
+            if get_tag(block.tags, kind=TagKind.ROLE, name=RoleTag.FUNCTION)
+            or get_tag(block.tags, kind=TagKind.FUNCTION_SELECTION)
+        ]
 
     def _record_function_invocation(
         self, invocation: FunctionCallingSupport.FunctionCallInvocation, context: AgentContext
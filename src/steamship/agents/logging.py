@@ -88,6 +88,13 @@ class StreamingOpts(BaseModel):
     are status messages logged in Tool code (ex: `GeneratorTool`).
     """
 
+    buffer_status_messages: bool = Field(default=False)
+    """Whether status messages should be appended to the ChatHistory by a background thread.
+
+    When enabled, logging a status message only queues it, so the agent is not blocked on a request per message.
+    Messages are appended in the order they were logged, and all are appended before the request is marked complete.
+    """
+
     @property
     def stream_intermediate_events(self):
         return (
@@ -258,6 +258,7 @@ class SlackTransport(Transport):
         self.bot_token = None
         self.agent_service = agent_service
         self.config = config
+        self._settings_kv: Optional[KeyValueStore] = None
 
     def instance_init(self):
         """Called when the owning AgentService initializes for the first time."""
@@ -561,9 +562,7 @@ class SlackTransport(Transport):
     @post("set_slack_access_token")
     def set_slack_access_token(self, token: str) -> InvocableResponse[str]:
         """Set the slack access token."""
-        kv = KeyValueStore(
-            client=self.agent_service.client, store_identifier=self.setting_store_key()
-        )
+        kv = self.settings_store()
         kv.set("slack_token", {"token": token})
         return InvocableResponse(string="OK")
 
@@ -571,9 +570,7 @@ class SlackTransport(Transport):
         """Return the Slack Access token, which permits the agent to post to Slack."""
         if self.bot_token:
             return self.bot_token
-        kv = KeyValueStore(
-            client=self.agent_service.client, store_identifier=self.setting_store_key()
-        )
+        kv = self.settings_store()
         v = kv.get("slack_token")
         if not v:
             return None
@@ -590,3 +587,13 @@ class SlackTransport(Transport):
 
     def setting_store_key(self):
         return f"{SETTINGS_KVSTORE_KEY}-{self.agent_service.context.invocable_instance_handle}"
+
+    def settings_store(self) -> KeyValueStore:
+        """Return the cached KeyValueStore that holds this transport's settings."""
+        if self._settings_kv is None:
+            self._settings_kv = KeyValueStore(
+                client=self.agent_service.client,
+                store_identifier=self.setting_store_key(),
+                cache=True,
+            )
+        return self._settings_kv
@@ -38,6 +38,7 @@ class TelegramTransport(Transport):
         super().__init__(client=client)
         self.config = config
         self.agent_service = agent_service
+        self._settings_kv: Optional[KeyValueStore] = None
         try:
             self.bot_token = self.get_telegram_access_token() or None
         except BaseException as e:
@@ -272,9 +273,7 @@ class TelegramTransport(Transport):
                 # other error relating to disconnecting would never be able to RE-connect to a new bot.
                 logging.error(e)
 
-        kv = KeyValueStore(
-            client=self.agent_service.client, store_identifier=self.setting_store_key()
-        )
+        kv = self.settings_store()
         kv.set("telegram_token", {"token": token})
 
         # Now attempt to modify the connection in Telegram
@@ -310,6 +309,16 @@ class TelegramTransport(Transport):
     def setting_store_key(self):
         return f"{SETTINGS_KVSTORE_KEY}-{self.agent_service.context.invocable_instance_handle}"
 
+    def settings_store(self) -> KeyValueStore:
+        """Return the cached KeyValueStore that holds this transport's settings."""
+        if self._settings_kv is None:
+            self._settings_kv = KeyValueStore(
+                client=self.agent_service.client,
+                store_identifier=self.setting_store_key(),
+                cache=True,
+            )
+        return self._settings_kv
+
     def get_telegram_access_token(self) -> Optional[str]:
         """Return the Telegram Access token, which permits the agent to post to Telegram."""
 
@@ -321,9 +330,7 @@ class TelegramTransport(Transport):
         _fallback_token = None
 
         # Prefer the dynamically set token if available
-        kv = KeyValueStore(
-            client=self.agent_service.client, store_identifier=self.setting_store_key()
-        )
+        kv = self.settings_store()
         v = kv.get("telegram_token")
         if v:
             _dynamically_set_token = v.get("token", None)
@@ -1,17 +1,32 @@
 import hashlib
 import json
 import logging
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Hashable, List, Optional, Tuple
 
 from steamship import Block, MimeTypes, Steamship
 from steamship.agents.schema.action import Action, FinishAction
 from steamship.utils.kv_store import KeyValueStore
+from steamship.utils.lru_cache import LRUCache
 
+DEFAULT_LOCAL_CACHE_SIZE = 1024
+DEFAULT_LOCAL_CACHE_TTL_S = 300.0
+DEFAULT_REHYDRATION_WORKERS = 8
 
-def _blocks_to_cache_dict(value: List[Block]) -> Dict[str, any]:
+ACTION_CACHE_LOCAL = LRUCache(maxsize=DEFAULT_LOCAL_CACHE_SIZE, ttl_s=DEFAULT_LOCAL_CACHE_TTL_S)
+"""In-process tier shared by every `ActionCache`, so lookups repeated within a warm worker skip the network."""
+
+LLM_CACHE_LOCAL = LRUCache(maxsize=DEFAULT_LOCAL_CACHE_SIZE, ttl_s=DEFAULT_LOCAL_CACHE_TTL_S)
+"""In-process tier shared by every `LLMCache`, so lookups repeated within a warm worker skip the network."""
+
+
+def _blocks_to_cache_dict(value: List[Block], inline: bool = False) -> Dict[str, any]:
     """Attempts to convert a list of blocks to key-store-safe dictionary.
 
     Convention: {'blocks':[{'id': <block_id>}, {'text': <some_text>}]}
+
+    With `inline`, persisted blocks are stored with their content as {'id': <block_id>, 'block': <block_json>} so
+    that they can be rehydrated without fetching them.
     """
 
     if not value:
@@ -20,7 +35,16 @@ def _blocks_to_cache_dict(value: List[Block]) -> Dict[str, any]:
         return {}
     blocks = []
     for block in value:
-        if block.id:
+        if block.id and inline:
+            blocks.append(
+                {
+                    "id": block.id,
+                    "block": json.loads(
+                        block.json(by_alias=True, exclude_none=True, exclude={"upload_bytes"})
+                    ),
+                }
+            )
+        elif block.id:
             blocks.append({"id": block.id})
         else:
             # TODO(dougreid): safe assumption about temporary blocks?
@@ -28,16 +52,39 @@ def _blocks_to_cache_dict(value: List[Block]) -> Dict[str, any]:
     return {"blocks": blocks}
 
 
-def _blocks_from_cache_dict(client: Steamship, value: Dict[str, any]) -> List[Block]:
+def _get_blocks(client: Steamship, block_ids: List[str], max_workers: int) -> Dict[str, Block]:
+    """Fetch each of `block_ids` once, with up to `max_workers` requests in flight."""
+    unique_ids = list(dict.fromkeys(block_ids))
+    if len(unique_ids) <= 1 or max_workers <= 1:
+        return {block_id: Block.get(client, _id=block_id) for block_id in unique_ids}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+        blocks = executor.map(lambda block_id: Block.get(client, _id=block_id), unique_ids)
+        return dict(zip(unique_ids, blocks))
+
+
+def _blocks_from_cache_dict(
+    client: Steamship, value: Dict[str, any], max_workers: int = DEFAULT_REHYDRATION_WORKERS
+) -> List[Block]:
     """Attempts to convert a key-store-safe dictionary to a list of blocks.
 
     Convention: {'blocks':[{'id': <block_id>}, {'text': <some_text>}]}
+
+    Blocks stored inline are rebuilt locally; the rest are fetched concurrently.
     """
     if block_list := value.get("blocks"):
+        fetched = _get_blocks(
+            client,
+            [b["id"] for b in block_list if b.get("id") and not b.get("block")],
+            max_workers,
+        )
         return_blocks = []
         for b in block_list:
-            if block_id := b.get("id"):
-                return_blocks.append(Block.get(client, _id=block_id))
+            if inline_block := b.get("block"):
+                block = Block.parse_obj(inline_block)
+                block.client = client
+                return_blocks.append(block)
+            elif block_id := b.get("id"):
+                return_blocks.append(fetched[block_id])
             else:
                 return_blocks.append(Block(text=b.get("text"), mime_type=MimeTypes.TXT))
         return return_blocks
@@ -45,29 +92,73 @@ def _blocks_from_cache_dict(client: Steamship, value: Dict[str, any]) -> List[Bl
     return []
 
 
+def _normalize_blocks(value: List[Block]) -> List[Block]:
+    """Return the blocks that `_blocks_from_cache_dict` would produce for `value`, without fetching anything."""
+    if not isinstance(value, list):
+        return []
+    return [
+        block if block.id else Block(text=block.text, mime_type=MimeTypes.TXT) for block in value
+    ]
+
+
+def _copy_blocks(blocks: List[Block], client: Optional[Steamship]) -> List[Block]:
+    """Copy `blocks`, bound to `client`.
+
+    The local tiers are shared by every request handled in the process, so blocks are bound to the client of the
+    request reading them rather than that of the request which cached them.
+    """
+    return [block.copy(update={"client": client}) for block in blocks]
+
+
+def _local_key(client: Steamship, key_value_store: KeyValueStore, cache_key: str) -> Tuple:
+    return client.config.workspace_id, key_value_store.store_identifier, cache_key
+
+
+def _in_store(key_value_store: KeyValueStore):
+    def predicate(local_key: Hashable) -> bool:
+        return local_key[1] == key_value_store.store_identifier
+
+    return predicate
+
+
 class ActionCache:
     """Provide persistent cache layer for AgentContext that allows lookups of output blocks from Actions.
 
-    Use this cache to eliminate calls to Tools.
+    Use this cache to eliminate calls to Tools. Cached blocks are fetched concurrently on a hit; with `inline_blocks`
+    their content is stored in the cache entry instead, so a hit needs no fetches at all.
+
+    Lookups are first served from `local_cache`, an in-process LRU shared by all instances in the process, and only
+    fall back to the persistent `key_value_store` on a miss.
 
     NOTE: EXPERIMENTAL.
     """
 
     client: Steamship
     key_value_store: KeyValueStore
-
-    def __init__(self, client: Steamship, key_value_store: KeyValueStore):
+    local_cache: LRUCache
+    inline_blocks: bool
+
+    def __init__(
+        self,
+        client: Steamship,
+        key_value_store: KeyValueStore,
+        local_cache: Optional[LRUCache] = None,
+        inline_blocks: bool = False,
+    ):
         self.client = client
         self.key_value_store = key_value_store
+        self.local_cache = local_cache if local_cache is not None else ACTION_CACHE_LOCAL
+        self.inline_blocks = inline_blocks
 
     @staticmethod
-    def get_or_create(client: Steamship, context_keys: Dict[str, str]):
+    def get_or_create(client: Steamship, context_keys: Dict[str, str], inline_blocks: bool = False):
         cache_handle = (
             f"actioncache-{hashlib.sha256(json.dumps(context_keys).encode('utf-8')).hexdigest()}"
         )
         return ActionCache(
             client=client,
             key_value_store=KeyValueStore(client=client, store_identifier=cache_handle),
+            inline_blocks=inline_blocks,
         )
 
     @staticmethod
@@ -86,51 +177,81 @@ class ActionCache:
 
     def lookup(self, key: Action) -> Optional[List[Block]]:
         cache_key = ActionCache._cache_key_for(key)
+        local_key = _local_key(self.client, self.key_value_store, cache_key)
+        if (blocks := self.local_cache.get(local_key)) is not None:
+            logging.debug(f"local cache hit for {cache_key}")
+            return _copy_blocks(blocks, self.client)
+
         value = self.key_value_store.get(key=cache_key) or None
         if value:
             logging.debug(f"cache hit for {cache_key}")
-            return _blocks_from_cache_dict(self.client, value)
+            blocks = _blocks_from_cache_dict(self.client, value)
+            self.local_cache.put(local_key, _copy_blocks(blocks, None))
+            return blocks
 
         logging.debug(f"cache miss for {cache_key}")
         return None
 
     def clear(self) -> None:
+        self.local_cache.clear(_in_store(self.key_value_store))
         self.key_value_store.reset()
 
     def update(self, key: Action, value: List[Block]):
         # TODO: should this be synchronous and wait?
+        cache_key = ActionCache._cache_key_for(key)
         self.key_value_store.set(
-            key=ActionCache._cache_key_for(key), value=_blocks_to_cache_dict(value)
+            key=cache_key, value=_blocks_to_cache_dict(value, inline=self.inline_blocks)
+        )
+        self.local_cache.put(
+            _local_key(self.client, self.key_value_store, cache_key),
+            _copy_blocks(_normalize_blocks(value), None),
         )
         return
 
     def delete(self, key: Action) -> bool:
-        return self.key_value_store.delete(key=ActionCache._cache_key_for(key))
+        cache_key = ActionCache._cache_key_for(key)
+        self.local_cache.pop(_local_key(self.client, self.key_value_store, cache_key))
+        return self.key_value_store.delete(key=cache_key)
 
 
 class LLMCache:
     """Provide persistent cache layer for AgentContext that allows lookups of Actions from LLM prompts.
 
-    Use this cache to eliminate calls to LLMs for Tool selection and direct responses.
+    Use this cache to eliminate calls to LLMs for Tool selection and direct responses. Cached blocks are fetched
+    concurrently on a hit; with `inline_blocks` their content is stored in the cache entry instead.
+
+    Lookups are first served from `local_cache`, an in-process LRU shared by all instances in the process, and only
+    fall back to the persistent `key_value_store` on a miss.
 
     NOTE: EXPERIMENTAL.
     """
 
     client: Steamship
     key_value_store: KeyValueStore
-
-    def __init__(self, client: Steamship, key_value_store: KeyValueStore):
+    local_cache: LRUCache
+    inline_blocks: bool
+
+    def __init__(
+        self,
+        client: Steamship,
+        key_value_store: KeyValueStore,
+        local_cache: Optional[LRUCache] = None,
+        inline_blocks: bool = False,
+    ):
         self.client = client
         self.key_value_store = key_value_store
+        self.local_cache = local_cache if local_cache is not None else LLM_CACHE_LOCAL
+        self.inline_blocks = inline_blocks
 
     @staticmethod
-    def get_or_create(client: Steamship, context_keys: Dict[str, str]):
+    def get_or_create(client: Steamship, context_keys: Dict[str, str], inline_blocks: bool = False):
         cache_handle = (
             f"llmcache-{hashlib.sha256(json.dumps(context_keys).encode('utf-8')).hexdigest()}"
         )
         return LLMCache(
             client=client,
             key_value_store=KeyValueStore(client=client, store_identifier=cache_handle),
+            inline_blocks=inline_blocks,
         )
 
     @staticmethod
@@ -160,28 +281,61 @@ class LLMCache:
 
         return Action(tool=value.get("tool"), input=input_blocks, output=output_blocks)
 
+    @staticmethod
+    def _copy_action(action: Action, client: Optional[Steamship]) -> Action:
+        return action.copy(
+            update={
+                "input": _copy_blocks(action.input, client),
+                "output": _copy_blocks(action.output or [], client),
+            }
+        )
+
     def lookup(self, key: List[Block]) -> Optional[Action]:
         cache_key = LLMCache._cache_key_for(key)
+        local_key = _local_key(self.client, self.key_value_store, cache_key)
+        if (action := self.local_cache.get(local_key)) is not None:
+            logging.debug(f"local cache hit for {cache_key}")
+            return LLMCache._copy_action(action, self.client)
+
         value = self.key_value_store.get(key=cache_key) or None
         if value:
             logging.debug(f"cache hit for {cache_key}")
-            return self._action_from_value(value)
+            action = self._action_from_value(value)
+            self.local_cache.put(local_key, LLMCache._copy_action(action, None))
+            return action
 
         logging.debug(f"cache miss for {cache_key}")
         return None
 
     def clear(self) -> None:
+        self.local_cache.clear(_in_store(self.key_value_store))
         self.key_value_store.reset()
 
     def update(self, key: List[Block], value: Action):
         # TODO: should this be synchronous and wait?
         action_dict = {
             "tool": value.tool,
-            "input": _blocks_to_cache_dict(value.input),
-            "output": _blocks_to_cache_dict(value.output),
+            "input": _blocks_to_cache_dict(value.input, inline=self.inline_blocks),
+            "output": _blocks_to_cache_dict(value.output, inline=self.inline_blocks),
         }
-        self.key_value_store.set(key=LLMCache._cache_key_for(key), value=action_dict)
+        cache_key = LLMCache._cache_key_for(key)
+        self.key_value_store.set(key=cache_key, value=action_dict)
+        self.local_cache.put(
+            _local_key(self.client, self.key_value_store, cache_key),
+            self._action_from_normalized(value),
+        )
         return
 
+    @staticmethod
+    def _action_from_normalized(value: Action) -> Action:
+        """The action that a lookup of `value` from the persistent store would produce, without fetching blocks."""
+        input_blocks = _copy_blocks(_normalize_blocks(value.input), None)
+        output_blocks = _copy_blocks(_normalize_blocks(value.output), None)
+        if value.tool == "Agent-FinishAction":
+            return FinishAction(input=input_blocks, output=output_blocks)
+        return Action(tool=value.tool, input=input_blocks, output=output_blocks)
+
     def delete(self, key: List[Block]) -> bool:
-        return self.key_value_store.delete(key=LLMCache._cache_key_for(key))
+        cache_key = LLMCache._cache_key_for(key)
+        self.local_cache.pop(_local_key(self.client, self.key_value_store, cache_key))
+        return self.key_value_store.delete(key=cache_key)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import logging
+import queue
+import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
 from logging import StreamHandler
-from typing import Dict, List, Optional, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 from fluent.handler import FluentRecordFormatter
 
@@ -17,6 +21,96 @@ from steamship.data.block import Block
 from steamship.data.plugin.index_plugin_instance import EmbeddingIndexPluginInstance, SearchResults
 from steamship.data.tags import Tag
 from steamship.data.tags.tag_constants import ChatTag, DocTag, RoleTag, TagValueKey
+from steamship.data.tags.tag_utils import get_tag_value_key
+
+
+def _block_signature(block: Block) -> tuple:
+    """The parts of a block that can change after it is created: its text while streaming, and its tags."""
+    return (
+        block.text,
+        block.stream_state,
+        block.mime_type,
+        block.public_data,
+        block.index_in_file,
+        tuple(tag.id for tag in block.tags or []),
+    )
+
+
+def _plain(value: Any) -> Any:
+    # str-valued Enums hash by name, not value, so keys are normalised to plain values.
+    return value.value if isinstance(value, Enum) else value
+
+
+class _MessageIndex:
+    """Positions of a ChatHistory's messages by chat role, tag kind, and tag kind and name.
+
+    The index follows `file.blocks` lazily: blocks appended to the same list since the last lookup are indexed
+    incrementally, and anything else (e.g. a refresh replacing the list) re-indexes from scratch, reusing the keys of
+    block objects that were seen before unless they are reported as `changed` or their tags have changed since.
+    """
+
+    def __init__(self):
+        self._blocks: Optional[List[Block]] = None
+        self._last: Optional[Block] = None
+        self._count = 0
+        self._positions: Dict[tuple, List[int]] = {}
+        self._keys: Dict[str, Tuple[Block, tuple, Tuple[tuple, ...]]] = {}
+
+    @staticmethod
+    def _keys_for(block: Block) -> Tuple[tuple, ...]:
+        role = get_tag_value_key(
+            block.tags, TagValueKey.STRING_VALUE, kind=DocTag.CHAT, name=ChatTag.ROLE
+        )
+        keys = {("role", _plain(role))} if role is not None else set()
+        for tag in block.tags or []:
+            keys.add(("kind", _plain(tag.kind)))
+            keys.add(("tag", _plain(tag.kind), _plain(tag.name)))
+        return tuple(keys)
+
+    @staticmethod
+    def _tags_signature(block: Block) -> tuple:
+        return tuple((tag.id, tag.kind, tag.name) for tag in block.tags or [])
+
+    def _add(
+        self, position: int, block: Block, previous_keys: Dict[str, Tuple[Block, tuple, Tuple]]
+    ):
+        known = previous_keys.get(block.id)
+        signature = _MessageIndex._tags_signature(block)
+        if known is not None and known[0] is block and known[1] == signature:
+            keys = known[2]
+        else:
+            keys = _MessageIndex._keys_for(block)
+        if block.id is not None:
+            self._keys[block.id] = (block, signature, keys)
+        for key in keys:
+            self._positions.setdefault(key, []).append(position)
+
+    def sync(self, blocks: List[Block], changed: Iterable[Block] = ()):
+        """Index `blocks`, re-reading the keys of the `changed` ones (e.g. those whose tags changed in place)."""
+        changed_ids = {block.id for block in changed}
+        if (
+            not changed_ids
+            and blocks is self._blocks
+            and len(blocks) >= self._count
+            and (self._count == 0 or blocks[self._count - 1] is self._last)
+        ):
+            start, previous_keys = self._count, self._keys
+        else:
+            start = 0
+            previous_keys = {
+                block_id: entry
+                for block_id, entry in self._keys.items()
+                if block_id not in changed_ids
+            }
+            self._positions, self._keys = {}, {}
+        for position in range(start, len(blocks)):
+            self._add(position, blocks[position], previous_keys)
+        self._blocks = blocks
+        self._count = len(blocks)
+        self._last = blocks[-1] if blocks else None
+
+    def positions(self, key: tuple) -> List[int]:
+        return self._positions.get(tuple(_plain(part) for part in key), [])
 
 
 class ChatHistory:
@@ -27,19 +121,36 @@ class ChatHistory:
     embedding_index: EmbeddingIndexPluginInstance
     text_splitter: TextSplitter
 
+    deferred_indexing: bool
+
     def __init__(
         self,
         file: File,
         embedding_index: Optional[EmbeddingIndexPluginInstance],
         text_splitter: TextSplitter = None,
+        deferred_indexing: bool = False,
     ):
-        """This init method is intended only for private use within the class. See `Chat.create()`"""
+        """This init method is intended only for private use within the class. See `Chat.create()`
+
+        With `deferred_indexing`, appended messages are embedded by a background thread rather than before the append
+        returns. Chunks queued while an insert is in flight are inserted together in the next batch. Searching waits
+        for the queue to be flushed first; call `flush_index` to do so explicitly (e.g. before a worker exits).
+        """
         self.file = file
         self.embedding_index = embedding_index
         if text_splitter is not None:
             self.text_splitter = text_splitter
         else:
             self.text_splitter = FixedSizeTextSplitter(chunk_size=300)
+        self.deferred_indexing = deferred_indexing
+        self._message_index = _MessageIndex()
+        self._index_queue: List[Tag] = []
+        self._index_lock = threading.Lock()
+        self._index_worker: Optional[Future] = None
+        self._index_executor: Optional[ThreadPoolExecutor] = None
+        # Appends from any thread (e.g. buffered status messages) and reads of `file.blocks` are serialized by this.
+        self._append_lock = threading.RLock()
+        self._status_handlers: List[ChatHistoryLoggingHandler] = []
 
     @staticmethod
     def _get_existing_file(client: Client, context_keys: Dict[str, str]) -> Optional[File]:
@@ -91,6 +202,7 @@ class ChatHistory:
         context_keys: Dict[str, str],
         tags: List[Tag] = None,
         searchable: bool = True,
+        deferred_indexing: bool = False,
     ) -> ChatHistory:
 
         file = ChatHistory._get_existing_file(client, context_keys)
@@ -123,7 +235,7 @@ class ChatHistory:
         else:
             embedding_index = None
 
-        return ChatHistory(file, embedding_index)
+        return ChatHistory(file, embedding_index, deferred_indexing=deferred_indexing)
 
     def append_message_with_role(
         self,
@@ -140,25 +252,146 @@ class ChatHistory:
             Tag(kind=TagKind.CHAT, name=ChatTag.ROLE, value={TagValueKey.STRING_VALUE: role})
         )
         tags.append(Tag(kind=TagKind.CHAT, name=ChatTag.MESSAGE))
-        block = self.file.append_block(
-            text=text, tags=tags, content=content, url=url, mime_type=mime_type
-        )
+
         # don't index status messages
-        if self.embedding_index is not None and role not in [
+        index_message = self.embedding_index is not None and role not in [
             RoleTag.AGENT,
             RoleTag.TOOL,
             RoleTag.LLM,
-        ]:
-            chunk_tags = self.text_splitter.chunk_text_to_tags(
-                block, kind=TagKind.CHAT, name=ChatTag.CHUNK
+        ]
+        # Plain text can be chunked before the block exists, so that its chunk tags are created along with it.
+        chunk_with_block = (
+            index_message
+            and text is not None
+            and text.strip() != ""
+            and content is None
+            and url is None
+            and mime_type in [None, MimeTypes.TXT]
+        )
+        if chunk_with_block:
+            tags.extend(
+                self.text_splitter.text_to_tags(text, kind=TagKind.CHAT, name=ChatTag.CHUNK)
             )
-            block.tags.extend(chunk_tags)
 
+        self._flush_status_messages()
+        with self._append_lock:
+            block = self.file.append_block(
+                text=text, tags=tags, content=content, url=url, mime_type=mime_type
+            )
+            if index_message and chunk_with_block:
+                chunk_tags = [
+                    tag
+                    for tag in block.tags
+                    if tag.kind == TagKind.CHAT and tag.name == ChatTag.CHUNK
+                ]
+                for tag in chunk_tags:
+                    tag.text = block.text[tag.start_idx : tag.end_idx]
+            elif index_message:
+                chunk_tags = self.text_splitter.chunk_text_to_tags(
+                    block, kind=TagKind.CHAT, name=ChatTag.CHUNK
+                )
+                block.tags.extend(chunk_tags)
+
+        if index_message:
             # Only embed tags that aren't empty space.
             non_empty_chunk_tags = [tag for tag in chunk_tags if tag.text.strip()]
-            self.embedding_index.insert(non_empty_chunk_tags)
+            if non_empty_chunk_tags and self.deferred_indexing:
+                self._queue_for_index(non_empty_chunk_tags)
+            elif non_empty_chunk_tags:
+                self.embedding_index.insert(non_empty_chunk_tags)
         return block
 
+    def append_block(
+        self,
+        text: str = None,
+        tags: List[Tag] = None,
+        content: Union[str, bytes] = None,
+        url: Optional[str] = None,
+        mime_type: Optional[MimeTypes] = None,
+    ) -> Block:
+        """Append a block to the history's File as it is, without chat tags or indexing.
+
+        Use this rather than `file.append_block`, so that the append is ordered after any buffered status messages
+        and cannot interleave with appends from other threads.
+        """
+        self._flush_status_messages()
+        with self._append_lock:
+            return self.file.append_block(
+                text=text, tags=tags, content=content, url=url, mime_type=mime_type
+            )
+
+    def _flush_status_messages(self):
+        """Append the status messages buffered by logging handlers before a message appended on another thread."""
+        for handler in list(self._status_handlers):
+            handler.flush()
+
+    def _queue_for_index(self, tags: List[Tag]):
+        with self._index_lock:
+            self._index_queue.extend(tags)
+            if self._index_worker is None:
+                self._start_index_worker()
+
+    def _start_index_worker(self) -> Future:
+        """Start draining the queue in the background. Must be called with `_index_lock` held."""
+        if self._index_executor is None:
+            self._index_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="chat-history-index"
+            )
+        self._index_worker = self._index_executor.submit(self._drain_index_queue)
+        return self._index_worker
+
+    def _drain_index_queue(self):
+        """Insert queued chunk tags, a batch at a time, until the queue is empty."""
+        while True:
+            with self._index_lock:
+                batch, self._index_queue = self._index_queue, []
+                if not batch:
+                    self._index_worker = None
+                    return
+            try:
+                self.embedding_index.insert(batch)
+            except Exception:
+                with self._index_lock:
+                    # Keep the batch so that a later flush retries it.
+                    self._index_queue = batch + self._index_queue
+                    self._index_worker = None
+                raise
+
+    def flush_index(self):
+        """Wait until every appended message has been inserted into the embedding index.
+
+        A failed background insert is retried once; if the retry fails too, its error is raised and its chunks remain
+        queued for the next flush.
+        """
+        failed = False
+        while True:
+            with self._index_lock:
+                worker = self._index_worker
+                if worker is None:
+                    if not self._index_queue:
+                        return
+                    worker = self._start_index_worker()
+            try:
+                worker.result()
+            except Exception as e:
+                if failed:
+                    raise
+                failed = True
+                logging.warning(f"Deferred chat history indexing failed; retrying. {e}")
+
+    def close(self):
+        """Flush the embedding index queue and stop the background indexing thread.
+
+        Messages appended afterwards start a new thread, so this may be called whenever the history is done with.
+        """
+        try:
+            self.flush_index()
+        finally:
+            with self._index_lock:
+                executor, self._index_executor = self._index_executor, None
+            if executor is not None:
+                executor.shutdown(wait=True)
+
     def append_user_message(
         self,
         text: str = None,
@@ -192,26 +425,45 @@ class ChatHistory:
         """Append a new block to this with content provided by the agent, i.e., results from the assistant."""
         return self.append_message_with_role(text, RoleTag.ASSISTANT, tags, content, url, mime_type)
 
+    def _positions(self, key: tuple) -> Tuple[List[Block], List[int]]:
+        """Return the messages, and the positions among them of those with `key`."""
+        with self._append_lock:
+            blocks = self.file.blocks
+            self._message_index.sync(blocks)
+            return blocks, self._message_index.positions(key)
+
+    def messages_with_role(self, role: RoleTag) -> List[Block]:
+        """Return the messages whose chat role is `role`, in order."""
+        blocks, positions = self._positions(("role", role))
+        return [blocks[position] for position in positions]
+
+    def messages_with_tag(self, kind: str, name: Optional[str] = None) -> List[Block]:
+        """Return the messages with a tag of the given kind (and name, if provided), in order."""
+        key = ("kind", kind) if name is None else ("tag", kind, name)
+        blocks, positions = self._positions(key)
+        return [blocks[position] for position in positions]
+
+    def last_message_with_role(self, role: RoleTag) -> Optional[Block]:
+        """Return the most recent message whose chat role is `role`."""
+        blocks, positions = self._positions(("role", role))
+        return blocks[positions[-1]] if positions else None
+
+    def messages_since_last(self, role: RoleTag) -> List[Block]:
+        """Return the messages after the most recent message whose chat role is `role`, or all of them if none has."""
+        blocks, positions = self._positions(("role", role))
+        return blocks[positions[-1] + 1 :] if positions else blocks[:]
+
     @property
     def last_user_message(self) -> Optional[Block]:
-        for block in self.file.blocks[::-1]:
-            if block.chat_role == RoleTag.USER:
-                return block
-        return None
+        return self.last_message_with_role(RoleTag.USER)
 
     @property
     def last_system_message(self) -> Optional[Block]:
-        for block in self.file.blocks[::-1]:
-            if block.chat_role == RoleTag.SYSTEM:
-                return block
-        return None
+        return self.last_message_with_role(RoleTag.SYSTEM)
 
     @property
     def last_agent_message(self) -> Optional[Block]:
-        for block in self.file.blocks[::-1]:
-            if block.chat_role == RoleTag.ASSISTANT:
-                return block
-        return None
+        return self.last_message_with_role(RoleTag.ASSISTANT)
 
     @property
     def initial_system_prompt(self) -> Optional[Block]:
@@ -221,7 +473,30 @@ class ChatHistory:
             return None
 
     def refresh(self):
-        self.file.refresh()
+        """Bring the history up to date with the File in Steamship, e.g. after messages were appended elsewhere."""
+        with self._append_lock:
+            changed = self._refresh_messages()
+            self._message_index.sync(self.file.blocks, changed)
+
+    def _refresh_messages(self) -> List[Block]:
+        """Refresh the history, returning the messages that are new or changed since they were last fetched.
+
+        Steamship returns the whole File, but messages already held locally that are unchanged are kept as they are,
+        so only new (or still streaming) messages are taken from the response.
+        """
+        refreshed = File.get(self.client, self.file.id)
+        known = {block.id: block for block in self.file.blocks or []}
+        blocks, changed = [], []
+        for block in refreshed.blocks:
+            existing = known.get(block.id)
+            if existing is not None and _block_signature(existing) == _block_signature(block):
+                blocks.append(existing)
+            else:
+                blocks.append(block)
+                changed.append(block)
+        refreshed.blocks = blocks
+        self.file._update_from(refreshed)
+        return changed
 
     @property
     def tags(self) -> List[Tag]:
@@ -239,44 +514,94 @@ class ChatHistory:
         return selector.get_messages(self.messages)
 
     def search(self, text: str, k=None) -> Task[SearchResults]:
+        """Search the history's messages for those most similar to `text`.
+
+        Deleting messages leaves their items in the embedding index. A result from a message that is not in the
+        history refreshes it (once), in case the message was appended elsewhere; results from messages that are still
+        missing were deleted, and are dropped. The index is searched more deeply if they would otherwise crowd out
+        the top `k`. See `reindex`.
+        """
         if len(text.strip()) == 0:
             return Task(output=SearchResults(), state="succeeded")
         if self.embedding_index is None:
             raise SteamshipError("This ChatHistory has no embedding index and is not searchable.")
-        return self.embedding_index.search(text, k)
+        self.flush_index()
+
+        wanted = k or 1
+        message_ids = {message.id for message in self.messages}
+        refreshed = False
+        depth = wanted
+        while True:
+            task = self.embedding_index.search(text, depth)
+            items = task.wait().items or []
+            block_ids = {item.tag.block_id for item in items if item.tag is not None}
+            if not refreshed and not block_ids.issubset(message_ids | {None}):
+                self.refresh()
+                message_ids = {message.id for message in self.messages}
+                refreshed = True
+            live_items = [
+                item
+                for item in items
+                if item.tag is None or item.tag.block_id is None or item.tag.block_id in message_ids
+            ]
+            if len(live_items) >= wanted or len(items) < depth:
+                break
+            depth *= 2
+        if len(live_items) < len(items):
+            task.output = SearchResults(items=live_items[:wanted])
+        return task
 
     def is_searchable(self) -> bool:
         return self.embedding_index is not None
 
-    def delete_messages(self, selector: MessageSelector):
+    def _chunk_tags(self) -> List[Tag]:
+        chunk_tags = []
+        for msg in self.messages:
+            for tag in msg.tags:
+                if tag.kind == TagKind.CHAT and tag.name == ChatTag.CHUNK:
+                    # TODO(dougreid): figure out why tag.text gets lost.
+                    if not tag.text:
+                        tag.text = msg.text[tag.start_idx : tag.end_idx]
+
+                    # Only embed it if we've managed to generate a string representation.
+                    if tag.text and tag.text.strip():
+                        chunk_tags.append(tag)
+        return chunk_tags
+
+    def reindex(self):
+        """Rebuild the embedding index from the current messages, with a single batched insert.
+
+        This drops the items of deleted messages, which are otherwise only filtered out of search results.
+        """
+        if not self.is_searchable():
+            return
+        self.flush_index()
+        self.embedding_index.reset()
+        if chunk_tags := self._chunk_tags():
+            self.embedding_index.insert(chunk_tags)
+
+    def delete_messages(self, selector: MessageSelector, reindex: bool = False):
         """Delete a set of selected messages from the ChatHistory.
 
         If `selector == None`, no messages will be deleted.
 
         NOTES:
-        - upon deletion, refresh() is called to ensure up-to-date history refs.
-        - causes a full re-index of chat history if the history is searchable.
+        - the deleted messages are removed from the local history refs; nothing else is re-fetched.
+        - the embedding index is left as it is; `search` ignores the deleted messages' items. Pass `reindex=True`
+          to rebuild the index without them (see `reindex`).
         """
         if selector:
-            selected_messages = selector.get_messages(self.messages)
+            selected_messages = list(selector.get_messages(self.messages))
             for msg in selected_messages:
                 msg.delete()
 
-            self.refresh()
-            if self.is_searchable():
-                self.embedding_index.reset()
-                for msg in self.messages:
-                    for tag in msg.tags:
-                        if tag.kind == TagKind.CHAT and tag.name == ChatTag.CHUNK:
-                            # TODO(dougreid): figure out why tag.text gets lost.
-                            if not tag.text:
-                                tag.text = msg.text[tag.start_idx : tag.end_idx]
-
-                            # Only embed it if we've managed to generate a string representation.
-                            if tag.text and tag.text.strip():
-                                self.embedding_index.insert(tag)
-
-        self.refresh()
+            deleted_ids = {msg.id for msg in selected_messages}
+            with self._append_lock:
+                self.file.blocks = [
+                    block for block in self.file.blocks if block.id not in deleted_ids
+                ]
+            if reindex:
+                self.reindex()
 
     def clear(self):
         """Deletes ALL messages from the ChatHistory (including system).
@@ -287,6 +612,8 @@ class ChatHistory:
             block.delete()
 
         if self.is_searchable():
+            # Let any in-flight insert land first so that it cannot repopulate the reset index.
+            self.flush_index()
             self.embedding_index.reset()
 
         self.refresh()
@@ -309,7 +636,7 @@ class ChatHistory:
                 value={TagValueKey.STRING_VALUE: role},
             )
         )
-        return self.file.append_block(
+        return self.append_block(
             text=text, tags=tags, content=content, url=url, mime_type=mime_type
         )
 
@@ -368,17 +695,25 @@ class ChatHistoryLoggingHandler(StreamHandler):
     """Logs messages emitted by Agents and Tools into a ChatHistory file.
 
     This is a basic mechanism for streaming status messages alongside generated content.
+
+    If `buffered`, `emit` only queues the message; a background thread appends queued messages in order. The queue
+    holds at most `max_queue_size` messages, beyond which `emit` waits for room. Call `flush` (or `close`) to wait
+    until every queued message has been appended. Messages appended to the ChatHistory on other threads flush the
+    queue first, so status messages are not appended after the answer they preceded.
     """
 
     chat_history: ChatHistory
     log_level: any
     streaming_opts: StreamingOpts
+    buffered: bool
 
     def __init__(
         self,
         chat_history: ChatHistory,
         log_level: any = logging.INFO,
         streaming_opts: Optional[StreamingOpts] = None,
+        buffered: Optional[bool] = None,
+        max_queue_size: int = 1000,
     ):
         StreamHandler.__init__(self)
         formatter = FluentRecordFormatter(LOGGING_FORMAT, fill_missing_fmt_key=True)
@@ -389,6 +724,15 @@ class ChatHistoryLoggingHandler(StreamHandler):
             self.streaming_opts = streaming_opts
         else:
             self.streaming_opts = StreamingOpts()
+        if buffered is None:
+            buffered = self.streaming_opts.buffer_status_messages
+        self.buffered = buffered
+        self._queue: "queue.Queue[Optional[Tuple[logging.LogRecord, dict, str]]]" = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._worker: Optional[threading.Thread] = None
+        # Anything logged while the worker appends a message must not be queued behind it.
+        self.addFilter(lambda record: threading.current_thread() is not self._worker)
 
     def emit(self, record):
         if record.levelno < self.log_level:
@@ -396,18 +740,64 @@ class ChatHistoryLoggingHandler(StreamHandler):
             return
 
         message_dict = cast(dict, self.format(record))
+        author_kind = self._author_kind(message_dict)
+        if author_kind is None:
+            return
 
-        is_agent_message = message_dict.get(AgentLogging.MESSAGE_AUTHOR, None) == AgentLogging.AGENT
-        if self.streaming_opts.include_agent_messages and is_agent_message:
-            return self._append_message(message_dict, AgentLogging.AGENT)
-
-        is_tool_message = message_dict.get(AgentLogging.MESSAGE_AUTHOR, None) == AgentLogging.TOOL
-        if self.streaming_opts.include_tool_messages and is_tool_message:
-            return self._append_message(message_dict, AgentLogging.TOOL)
+        if not self.buffered:
+            return self._append_message(message_dict, author_kind)
+
+        if self._worker is None:
+            with self.lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._drain, name="chat-history-logging", daemon=True
+                    )
+                    self._worker.start()
+                    self.chat_history._status_handlers.append(self)
+        self._queue.put((record, message_dict, author_kind))
+
+    def _author_kind(self, message_dict: dict) -> Optional[str]:
+        author = message_dict.get(AgentLogging.MESSAGE_AUTHOR, None)
+        if self.streaming_opts.include_agent_messages and author == AgentLogging.AGENT:
+            return AgentLogging.AGENT
+        if self.streaming_opts.include_tool_messages and author == AgentLogging.TOOL:
+            return AgentLogging.TOOL
+        if self.streaming_opts.include_llm_messages and author == AgentLogging.LLM:
+            return AgentLogging.LLM
+        return None
 
-        is_llm_message = message_dict.get(AgentLogging.MESSAGE_AUTHOR, None) == AgentLogging.LLM
-        if self.streaming_opts.include_llm_messages and is_llm_message:
-            return self._append_message(message_dict, AgentLogging.LLM)
+    def _drain(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                record, message_dict, author_kind = item
+                try:
+                    self._append_message(message_dict, author_kind)
+                except Exception:
+                    self.handleError(record)
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Wait until every queued status message has been appended to the ChatHistory."""
+        worker = self._worker
+        if worker is not None and threading.current_thread() is not worker:
+            self._queue.join()
+        super().flush()
+
+    def close(self):
+        """Append any queued status messages and stop the background thread."""
+        worker = self._worker
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+            self._worker = None
+            if self in self.chat_history._status_handlers:
+                self.chat_history._status_handlers.remove(self)
+        super().close()
 
     def _append_message(self, message_dict: dict, author_kind: str):
         message = message_dict.get("message", None)
@@ -72,6 +72,7 @@ class AgentContext:
         use_action_cache: Optional[bool] = False,
         streaming_opts: Optional[StreamingOpts] = None,
         initial_system_message: Optional[str] = None,
+        deferred_indexing: bool = False,
     ):
         """Get the AgentContext that corresponds to the parameters supplied.
 
@@ -86,13 +87,16 @@ class AgentContext:
             use_action_cache(bool): Determines if an Action Cache should be created for a new context
             streaming_opts(StreamingOpts): Determines how status messages are appended to the context's ChatHistory
             initial_system_message(str): System message used to initialize the context's ChatHistory. If one already exists, this will be ignored.
+            deferred_indexing(bool): Whether the ContextHistory should embed appended messages in the background. Pending embeddings are flushed when the context exits.
         """
         from steamship.agents.schema.chathistory import ChatHistory
 
         if streaming_opts is None:
             streaming_opts = StreamingOpts()
 
-        history = ChatHistory.get_or_create(client, context_keys, tags, searchable=searchable)
+        history = ChatHistory.get_or_create(
+            client, context_keys, tags, searchable=searchable, deferred_indexing=deferred_indexing
+        )
         context = AgentContext(streaming_opts=streaming_opts)
         context.chat_history = history
         context.client = client
@@ -131,8 +135,15 @@ class AgentContext:
         if self._chat_history_logger:
             logger = logging.getLogger()
             logger.removeHandler(self._chat_history_logger)
+            # Buffered status messages must all be appended before the request complete block below.
+            self._chat_history_logger.close()
             self._chat_history_logger = None
 
+        # Make sure messages embedded in the background are searchable before the request is marked complete.
+        chat_history = getattr(self, "chat_history", None)
+        if chat_history is not None and getattr(chat_history, "deferred_indexing", False):
+            chat_history.close()
+
         # Here we append a final request complete block, which will have no text, but hold a special tag
         # NOTE: This **MUST** happen as the absolute last thing in the AgentService run. If chat history
         # is updated **outside** of `run_agent`, then this will signal a request completion **before** it happens.
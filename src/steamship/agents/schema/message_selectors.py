@@ -1,12 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import List
 
-import tiktoken
 from pydantic.main import BaseModel
 
 from steamship import Block
 from steamship.data.tags.tag_constants import RoleTag, TagKind
 from steamship.data.tags.tag_utils import get_tag
+from steamship.utils.context_length import token_length
 
 
 class MessageSelector(BaseModel, ABC):
@@ -84,9 +84,7 @@ class MessageWindowMessageSelector(MessageSelector):
 
 
 def tokens(block: Block) -> int:
-    enc = tiktoken.get_encoding("p50k_base")
-    tokenized_text = enc.encode(block.text)
-    return len(tokenized_text)
+    return token_length(block, "p50k_base")
 
 
 class TokenWindowMessageSelector(MessageSelector):
@@ -0,0 +1,187 @@
+"""An in-process cache of LLM-selected Actions, matched by embedding similarity rather than exact input text."""
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional, Sequence, Tuple
+
+from steamship import Block, Steamship, SteamshipError
+from steamship.agents.schema.action import Action
+from steamship.agents.schema.cache import LLMCache
+from steamship.data.plugin.plugin_instance import PluginInstance
+from steamship.data.tags.tag_constants import TagKind, TagValueKey
+
+EmbedFunc = Callable[[str], Sequence[float]]
+"""Maps a prompt to its embedding vector."""
+
+DEFAULT_EMBEDDER_HANDLE = "openai-embedder"
+DEFAULT_EMBEDDER_INSTANCE_HANDLE = "text-embedding-ada-002"
+DEFAULT_EMBEDDER_CONFIG = {"model": "text-embedding-ada-002", "dimensionality": 1536}
+
+
+def _normalized(vector: Sequence[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        raise SteamshipError(message="Unable to cache a prompt with a zero-length embedding.")
+    return [x / norm for x in vector]
+
+
+class _VectorIndex:
+    """A bounded set of unit vectors searched by cosine similarity, evicting the least recently matched entry.
+
+    Each entry belongs to a scope, and searches only consider entries of one scope.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Hashable, Hashable], List[float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(
+        self, scope: Hashable, key: Hashable, vector: List[float]
+    ) -> List[Tuple[Hashable, Hashable]]:
+        """Add (or replace) `key` in `scope`, returning the `(scope, key)` pairs evicted to make room for it."""
+        self._entries[(scope, key)] = vector
+        self._entries.move_to_end((scope, key))
+        evicted = []
+        while len(self._entries) > self.maxsize:
+            evicted.append(self._entries.popitem(last=False)[0])
+        return evicted
+
+    def touch(self, scope: Hashable, key: Hashable):
+        """Mark `key` in `scope` as the most recently matched entry."""
+        self._entries.move_to_end((scope, key))
+
+    def nearest(self, scope: Hashable, vector: List[float]) -> Optional[tuple]:
+        """Return `(key, similarity)` of the entry in `scope` most similar to `vector`, or None if there is none."""
+        candidates = [
+            (key, sum(a * b for a, b in zip(entry, vector)))
+            for (entry_scope, key), entry in self._entries.items()
+            if entry_scope == scope
+        ]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda pair: pair[1])
+
+
+class SemanticLLMCache:
+    """Provide an in-process cache for AgentService that allows lookups of Actions from prompts similar to ones seen
+    before.
+
+    Unlike `LLMCache`, which only matches identical input blocks, this embeds the text of the input and reuses the
+    Action of the most similar cached input if their cosine similarity is at least `threshold`. Inputs containing
+    non-text blocks are never cached. Entries are only matched within the `scope` they were cached under (AgentService
+    uses the id of the context), so Actions chosen for one conversation are not reused in another.
+
+    NOTE: EXPERIMENTAL.
+    """
+
+    embed: EmbedFunc
+    threshold: float
+    maxsize: int
+    hits: int
+    misses: int
+
+    def __init__(self, embed: EmbedFunc, threshold: float = 0.95, maxsize: int = 1024):
+        """Create a new SemanticLLMCache.
+
+        Args:
+            embed (EmbedFunc): Function returning the embedding of a prompt. See `with_embedder`.
+            threshold (float): Minimum cosine similarity for a cached Action to be reused.
+            maxsize (int): Maximum number of cached Actions; the least recently matched are evicted first.
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._index = _VectorIndex(maxsize)
+        self._actions = {}
+        self._lock = threading.Lock()
+        # The most recent lookup's embedding, which an update following a miss can reuse.
+        self._last_embedding: Optional[tuple] = None
+
+    @staticmethod
+    def with_embedder(
+        client: Steamship,
+        embedder: Optional[PluginInstance] = None,
+        threshold: float = 0.95,
+        maxsize: int = 1024,
+    ) -> "SemanticLLMCache":
+        """Create a SemanticLLMCache which embeds prompts with an embedder plugin instance.
+
+        If no `embedder` is provided, the workspace's `openai-embedder` instance is used (and created if needed).
+        """
+        if embedder is None:
+            embedder = client.use_plugin(
+                plugin_handle=DEFAULT_EMBEDDER_HANDLE,
+                instance_handle=DEFAULT_EMBEDDER_INSTANCE_HANDLE,
+                config=DEFAULT_EMBEDDER_CONFIG,
+                fetch_if_exists=True,
+            )
+
+        def embed(text: str) -> List[float]:
+            task = embedder.tag(doc=text)
+            task.wait()
+            for block in task.output.file.blocks:
+                for tag in block.tags or []:
+                    if tag.kind == TagKind.EMBEDDING:
+                        return tag.value[TagValueKey.VECTOR_VALUE]
+            raise SteamshipError(message=f"Embedder {embedder.handle} returned no embedding.")
+
+        return SemanticLLMCache(embed=embed, threshold=threshold, maxsize=maxsize)
+
+    @staticmethod
+    def _prompt_for(inputs: List[Block]) -> Optional[str]:
+        if not inputs or not all(block.is_text() for block in inputs):
+            return None
+        return "\n".join(block.text for block in inputs)
+
+    def _vector_for(self, prompt: str) -> List[float]:
+        last = self._last_embedding
+        if last is not None and last[0] == prompt:
+            return last[1]
+        vector = _normalized(self.embed(prompt))
+        self._last_embedding = (prompt, vector)
+        return vector
+
+    def lookup(self, key: List[Block], scope: Hashable = None) -> Optional[Action]:
+        prompt = SemanticLLMCache._prompt_for(key)
+        if prompt is None:
+            return None
+        vector = self._vector_for(prompt)
+
+        with self._lock:
+            match = self._index.nearest(scope, vector)
+            if match is not None and match[1] >= self.threshold:
+                self._index.touch(scope, match[0])
+                self.hits += 1
+                logging.debug(f"semantic cache hit (similarity {match[1]:.3f})")
+                # Bind the Action to the client of the request looking it up, like the prompt's blocks are.
+                client = next((block.client for block in key if block.client is not None), None)
+                return LLMCache._copy_action(self._actions[(scope, match[0])], client)
+            self.misses += 1
+
+        logging.debug("semantic cache miss")
+        return None
+
+    def update(self, key: List[Block], value: Action, scope: Hashable = None):
+        prompt = SemanticLLMCache._prompt_for(key)
+        if prompt is None:
+            return
+        vector = self._vector_for(prompt)
+        with self._lock:
+            for evicted in self._index.add(scope, prompt, vector):
+                del self._actions[evicted]
+            self._actions[(scope, prompt)] = LLMCache._copy_action(value, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index = _VectorIndex(self.maxsize)
+            self._actions = {}
+            self._last_embedding = None
+
+    def __len__(self) -> int:
+        return len(self._index)
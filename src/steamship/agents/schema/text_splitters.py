@@ -10,25 +10,41 @@ class TextSplitter(ABC):
         """Split the incoming text into strings"""
         raise NotImplementedError()
 
+    def text_to_tags(self, text: str, kind: str, name: str = None) -> List[Tag]:
+        """Split the incoming text into strings, and describe each with an (unsaved) Tag spanning it.
+
+        The tags can be passed to `Block.create` or `File.append_block` along with the text, so that they are created
+        with the block in a single request."""
+        start_index = 0
+        result = []
+        for text_split in self.split_text(text):
+            tag = Tag(
+                kind=kind,
+                name=name,
+                start_idx=start_index,
+                end_idx=start_index + len(text_split),
+                text=text_split,
+            )
+            result.append(tag)
+            start_index += len(text_split)
+        return result
+
     def chunk_text_to_tags(self, block: Block, kind: str, name: str = None) -> List[Tag]:
         """Split the incoming text into strings, and then wrap those strings in Tags"""
         if block.is_text() and block.text is not None and block.text.strip() != "":
-            text_splits = self.split_text(block.text)
-            start_index = 0
             result = []
-            for text_split in text_splits:
+            for chunk in self.text_to_tags(block.text, kind=kind, name=name):
                 tag = Tag.create(
                     client=block.client,
                     file_id=block.file_id,
                     block_id=block.id,
                     kind=kind,
                     name=name,
-                    start_idx=start_index,
-                    end_idx=start_index + len(text_split),
+                    start_idx=chunk.start_idx,
+                    end_idx=chunk.end_idx,
                 )
-                tag.text = text_split
+                tag.text = chunk.text
                 result.append(tag)
-                start_index += len(text_split)
             return result
         else:
             return []
@@ -8,9 +8,10 @@ from steamship.agents.llms.openai import OpenAI
 from steamship.agents.logging import AgentLogging, StreamingOpts
 from steamship.agents.schema import Action, Agent, FinishAction
 from steamship.agents.schema.context import AgentContext, EmitFunc, Metadata
+from steamship.agents.schema.semantic_cache import SemanticLLMCache
 from steamship.agents.utils import with_llm
 from steamship.data import TagKind
-from steamship.data.tags.tag_constants import ChatTag
+from steamship.data.tags.tag_constants import ChatTag, RoleTag
 from steamship.invocable import PackageService, post
 from steamship.invocable.invocable_response import StreamingResponse
 
@@ -58,6 +59,12 @@ class AgentService(PackageService):
     use_action_cache: bool
     """Whether or not to cache agent Actions (for tool runs) by default."""
 
+    semantic_llm_cache: Optional[SemanticLLMCache]
+    """An optional cache of tool selections matched by prompt similarity, consulted when the LLM cache misses.
+
+    Only the user's prompts are matched (not tool outputs), and only against prompts of the same chat history.
+    See `SemanticLLMCache.with_embedder`."""
+
     max_actions_per_run: int
     """The maximum number of actions to permit while the agent is reasoning.
 
@@ -79,10 +86,12 @@ class AgentService(PackageService):
         max_actions_per_run: Optional[int] = 5,
         max_actions_per_tool: Optional[Dict[str, int]] = None,
         agent: Optional[Agent] = None,
+        semantic_llm_cache: Optional[SemanticLLMCache] = None,
         **kwargs,
     ):
         self.use_llm_cache = use_llm_cache
         self.use_action_cache = use_action_cache
+        self.semantic_llm_cache = semantic_llm_cache
         self.max_actions_per_run = max_actions_per_run
         self.agent = agent
         self.max_actions_per_tool = max_actions_per_tool or {}
@@ -92,10 +101,23 @@ class AgentService(PackageService):
     # Tool selection / execution
     ###############################################
 
+    def _semantic_cache_scope(
+        self, input_blocks: List[Block], context: AgentContext
+    ) -> Optional[str]:
+        """Return the scope to consult the semantic cache under, or None if these inputs should not be cached."""
+        if not self.semantic_llm_cache or context.chat_history is None:
+            return None
+        if not input_blocks or any(block.chat_role != RoleTag.USER for block in input_blocks):
+            return None
+        return context.id
+
     def next_action(self, agent: Agent, input_blocks: List[Block], context: AgentContext) -> Action:
         action: Action = None
+        semantic_cache_scope = self._semantic_cache_scope(input_blocks, context)
         if context.llm_cache:
             action = context.llm_cache.lookup(key=input_blocks)
+        if not action and semantic_cache_scope:
+            action = self.semantic_llm_cache.lookup(key=input_blocks, scope=semantic_cache_scope)
         if action:
             logging.info(
                 f"Using cached tool selection: calling {action.tool}.",
@@ -117,6 +139,10 @@ class AgentService(PackageService):
             action = agent.next_action(context=context)
             if context.llm_cache:
                 context.llm_cache.update(key=input_blocks, value=action)
+            if semantic_cache_scope:
+                self.semantic_llm_cache.update(
+                    key=input_blocks, value=action, scope=semantic_cache_scope
+                )
 
         logging.info(
             f"Selected next action: {action.tool}",
@@ -59,8 +59,8 @@ class GeneratorTool(Tool):
         #
         # It's unclear to me (ted) if this is something we leave as an exercise for implementors or build in
         # as universally handled.
+        Task.wait_all(tasks)
         for task in tasks:
-            task.wait()
             task_blocks = self.post_process(task, context)
             for block in task_blocks:
                 output_blocks.append(block)
@@ -159,8 +159,8 @@ class ScrapeAndBlockifyTool(Tool):
         #
         # It's unclear to me (ted) if this is something we leave as an exercise for implementors or build in
         # as universally handled.
+        Task.wait_all(tasks)
         for task in tasks:
-            task.wait()
             task_blocks = self.post_process(task, context)
             for block in task_blocks:
                 output_blocks.append(block)
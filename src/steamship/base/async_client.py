@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional, Type, Union
+
+import aiohttp
+from aiohttp import ClientTimeout
+from pydantic import PrivateAttr
+
+from steamship.base.client import Client, T
+from steamship.base.mime_types import MimeTypes
+from steamship.base.request import Request
+from steamship.base.tasks import Task
+from steamship.base.transport import TransportConfig
+from steamship.utils import json_codec
+from steamship.utils.url import Verb
+
+
+class _AsyncSession:
+    """Lazily-created `aiohttp.ClientSession` shared by a client and all of its copies.
+
+    Pydantic shallow-copies the client into every model it is attached to; holding the session in this
+    mutable container keeps those copies on a single connection pool instead of each opening its own.
+    """
+
+    def __init__(self, transport: TransportConfig):
+        self.transport = transport
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    def get(self) -> aiohttp.ClientSession:
+        # aiohttp sessions must be created from within a running event loop, hence the lazy construction.
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.transport.pool_maxsize,
+                force_close=not self.transport.keep_alive,
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+
+def _query_params(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Encode query parameters the way `requests` does: drop `None` values and stringify everything else."""
+    return {
+        key: value if isinstance(value, str) else str(value)
+        for key, value in (data or {}).items()
+        if value is not None
+    }
+
+
+class AsyncClient(Client):
+    """A Steamship client whose `call`, `post` and `get` are coroutines backed by aiohttp.
+
+    Requests are built and responses are parsed exactly as in `Client`, so any data-model method that returns
+    `client.post(...)` (e.g. `File.get`, `Block.create`, `PluginInstance.generate`, `EmbeddingIndex.search`,
+    `PackageInstance.invoke`) may be awaited when given an `AsyncClient`. Returned `Task` objects can be awaited
+    with `Task.wait_async`.
+
+    The workspace is resolved with a single blocking request when the client is constructed. Of the
+    `TransportConfig`, the pool size and keep-alive settings apply here; retries apply to the blocking transport only.
+    """
+
+    _async_session: _AsyncSession = PrivateAttr()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._async_session = _AsyncSession(self.config.transport)
+
+    async def close(self):
+        """Close the underlying HTTP session. The client may still be used afterwards; a new one will be opened."""
+        await self._async_session.close()
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @staticmethod
+    def _prepare_form_data(data: dict, file: Any) -> aiohttp.FormData:
+        form = aiohttp.FormData()
+        for key, (filename, value, content_type) in Client._prepare_multipart_data(
+            data, file
+        ).items():
+            if not isinstance(value, (bytes, str)) and not hasattr(value, "read"):
+                value = str(value)
+            form.add_field(key, value, filename=filename, content_type=content_type)
+        return form
+
+    @staticmethod
+    async def _async_response_data(resp: aiohttp.ClientResponse, raw_response: bool = False):
+        if raw_response:
+            return await resp.read()
+
+        if resp.headers:
+            ct = resp.headers.get("Content-Type")
+            if ct is not None:
+                ct = ct.split(";")[0]  # application/json; charset=utf-8
+                if ct in [MimeTypes.TXT, MimeTypes.MKD, MimeTypes.HTML]:
+                    return await resp.text()
+                elif ct == MimeTypes.JSON:
+                    return json_codec.loads(await resp.read())
+                else:
+                    return await resp.read()
+
+    async def call(  # noqa: C901
+        self,
+        verb: Verb,
+        operation: str,
+        payload: Union[Request, dict, bytes] = None,
+        file: Any = None,
+        expect: Type[T] = None,
+        debug: bool = False,
+        raw_response: bool = False,
+        is_package_call: bool = False,
+        package_owner: str = None,
+        package_id: str = None,
+        package_instance_id: str = None,
+        as_background_task: bool = False,
+        wait_on_tasks: List[Union[str, Task]] = None,
+        timeout_s: Optional[float] = None,
+        task_delay_ms: Optional[int] = None,
+    ) -> Union[Any, Task]:
+        """Asynchronously perform a Steamship API call. See `Client.call`."""
+        url, headers, data = self._prepare_call(
+            operation=operation,
+            payload=payload,
+            is_package_call=is_package_call,
+            package_owner=package_owner,
+            package_id=package_id,
+            package_instance_id=package_instance_id,
+            as_background_task=as_background_task,
+            wait_on_tasks=wait_on_tasks,
+            task_delay_ms=task_delay_ms,
+        )
+
+        logging.debug(
+            f"Making {verb} to {url} in workspace {self.config.workspace_handle}/{self.config.workspace_id}"
+        )
+        request_kwargs: Dict[str, Any] = {"headers": headers}
+        if timeout_s is not None:
+            request_kwargs["timeout"] = ClientTimeout(total=timeout_s)
+
+        if verb == Verb.POST:
+            if file is not None:
+                request_kwargs["data"] = self._prepare_form_data(data, file)
+            elif isinstance(data, bytes):
+                request_kwargs["data"] = data
+            else:
+                request_kwargs["data"] = json_codec.dumps_bytes(data)
+                request_kwargs["headers"] = {**headers, "Content-Type": MimeTypes.JSON.value}
+        elif verb == Verb.GET:
+            request_kwargs["params"] = _query_params(data)
+        else:
+            raise Exception(f"Unsupported verb: {verb}")
+
+        session = self._async_session.get()
+        async with session.request(verb.value, url, **request_kwargs) as resp:
+            logging.debug(f"From {verb} to {url} got HTTP {resp.status}")
+
+            if debug is True:
+                logging.debug(f"Got response {resp}")
+
+            response_data = await self._async_response_data(resp, raw_response=raw_response)
+            ok, status_code = resp.ok, resp.status
+            retry_after_s = self._retry_after_s(resp.headers)
+
+        return self._process_response(
+            response_data,
+            ok=ok,
+            expect=expect,
+            is_package_call=is_package_call,
+            retry_after_s=retry_after_s,
+            status_code=status_code,
+        )
+
+    async def post(
+        self,
+        operation: str,
+        payload: Union[Request, dict, bytes] = None,
+        file: Any = None,
+        expect: Any = None,
+        debug: bool = False,
+        raw_response: bool = False,
+        is_package_call: bool = False,
+        package_owner: str = None,
+        package_id: str = None,
+        package_instance_id: str = None,
+        as_background_task: bool = False,
+        wait_on_tasks: List[Union[str, Task]] = None,
+        timeout_s: Optional[float] = None,
+        task_delay_ms: Optional[int] = None,
+    ) -> Union[Any, Task]:
+        return await self.call(
+            verb=Verb.POST,
+            operation=operation,
+            payload=payload,
+            file=file,
+            expect=expect,
+            debug=debug,
+            raw_response=raw_response,
+            is_package_call=is_package_call,
+            package_owner=package_owner,
+            package_id=package_id,
+            package_instance_id=package_instance_id,
+            as_background_task=as_background_task,
+            wait_on_tasks=wait_on_tasks,
+            timeout_s=timeout_s,
+            task_delay_ms=task_delay_ms,
+        )
+
+    async def get(
+        self,
+        operation: str,
+        payload: Union[Request, dict] = None,
+        file: Any = None,
+        expect: Any = None,
+        debug: bool = False,
+        raw_response: bool = False,
+        is_package_call: bool = False,
+        package_owner: str = None,
+        package_id: str = None,
+        package_instance_id: str = None,
+        as_background_task: bool = False,
+        wait_on_tasks: List[Union[str, Task]] = None,
+        timeout_s: Optional[float] = None,
+        task_delay_ms: Optional[int] = None,
+    ) -> Union[Any, Task]:
+        return await self.call(
+            verb=Verb.GET,
+            operation=operation,
+            payload=payload,
+            file=file,
+            expect=expect,
+            debug=debug,
+            raw_response=raw_response,
+            is_package_call=is_package_call,
+            package_owner=package_owner,
+            package_id=package_id,
+            package_instance_id=package_instance_id,
+            as_background_task=as_background_task,
+            wait_on_tasks=wait_on_tasks,
+            timeout_s=timeout_s,
+            task_delay_ms=task_delay_ms,
+        )
+
+    async def logs(
+        self,
+        offset: int = 0,
+        number: int = 50,
+        invocable_handle: Optional[str] = None,
+        instance_handle: Optional[str] = None,
+        invocable_version_handle: Optional[str] = None,
+        path: Optional[str] = None,
+        field_values: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Return generated logs for a client. See `Client.logs`."""
+        return await super().logs(
+            offset=offset,
+            number=number,
+            invocable_handle=invocable_handle,
+            instance_handle=instance_handle,
+            invocable_version_handle=invocable_version_handle,
+            path=path,
+            field_values=field_values,
+        )
@@ -15,8 +15,12 @@ from steamship.base.configuration import Configuration
 from steamship.base.error import SteamshipError
 from steamship.base.mime_types import MimeTypes
 from steamship.base.model import CamelModel, to_camel
+from steamship.base.multipart import MultipartStream
+from steamship.base.polling import PollingStrategy
 from steamship.base.request import Request
 from steamship.base.tasks import Task, TaskState
+from steamship.base.transport import TransportConfig, create_session
+from steamship.utils import json_codec
 from steamship.utils.url import Verb, is_local
 
 T = TypeVar("T")  # TODO (enias): Do we need this?
@@ -47,6 +51,89 @@ def _multipart_name(path: str, val: Any) -> List[Tuple[Optional[str], str, Optio
     return ret
 
 
+class _ClientInjectionPlan:
+    """Precomputed knowledge of where, in a response decoded as `expect`, the client must be attached.
+
+    Plans are built once per type (see `_injection_plan`) so that the type hints of `expect`, and the mapping of
+    camelCase response keys onto them, are not recomputed for every object of every response.
+    """
+
+    def __init__(self, expect: Any):
+        typing_parameters = typing.get_args(expect)
+        self.element_type = typing_parameters[0] if typing_parameters else None
+        self.is_model = bool(expect and isclass(expect) and issubclass(expect, BaseModel))
+        self.wrapper_keys = frozenset()
+        self.key_to_type = None
+        self._children: Dict[str, Optional[_ClientInjectionPlan]] = {}
+
+        if self.is_model:
+            # TODO (enias): Hack since the engine responds with incosistent formats e.g. {"plugin" : {plugin_fields}}
+            self.wrapper_keys = frozenset(
+                (
+                    to_camel(expect.__name__),
+                    to_camel(expect.__name__).replace("package", "invocable"),
+                    # Hack since engine uses "App" instead of "Package"
+                    "index",
+                    "pluginInstance",  # Inlined here since `expect` may be a subclass of pluginInstance
+                )
+            )
+            try:
+                self.key_to_type = typing.get_type_hints(expect)
+            except NameError:
+                # typing.get_type_hints fails for Workspace
+                pass
+
+    @property
+    def is_noop(self) -> bool:
+        return not self.is_model and self.element_type is None
+
+    def child(self, key: str) -> Optional[_ClientInjectionPlan]:
+        """The plan for the value under response key `key`, or None if that value never needs the client."""
+        if key not in self._children:
+            plan = _injection_plan(self.key_to_type.get(inflection.underscore(key)))
+            self._children[key] = None if plan.is_noop else plan
+        return self._children[key]
+
+    def apply(self, client: Client, response_data: Any):
+        if isinstance(response_data, dict):
+            if self.is_model:
+                self._apply_to_object(client, response_data)
+        elif isinstance(response_data, list) and self.element_type is not None:
+            element_plan = _injection_plan(self.element_type)
+            if not element_plan.is_noop:
+                for el in response_data:
+                    element_plan.apply(client, el)
+
+    def _apply_to_object(self, client: Client, response_data: dict):
+        if len(response_data) == 1 and next(iter(response_data)) in self.wrapper_keys:
+            for v in response_data.values():
+                self.apply(client, v)
+            return
+        response_data["client"] = client
+        if self.key_to_type is None:
+            return
+        for k, v in response_data.items():
+            if isinstance(v, (dict, list)):
+                plan = self.child(k)
+                if plan is not None:
+                    plan.apply(client, v)
+
+
+_INJECTION_PLANS: Dict[Any, _ClientInjectionPlan] = {}
+
+
+def _injection_plan(expect: Any) -> _ClientInjectionPlan:
+    """Return the (cached) `_ClientInjectionPlan` for responses decoded as `expect`."""
+    try:
+        return _INJECTION_PLANS[expect]
+    except KeyError:
+        plan = _INJECTION_PLANS[expect] = _ClientInjectionPlan(expect)
+        return plan
+    except TypeError:
+        # Unhashable type annotations cannot be cached
+        return _ClientInjectionPlan(expect)
+
+
 class Client(CamelModel, ABC):
     """Client model.py class.
 
@@ -68,17 +155,21 @@ class Client(CamelModel, ABC):
         config_file: str = None,
         config: Configuration = None,
         trust_workspace_config: bool = False,  # For use by lambda_handler; don't fetch the workspace
+        transport: TransportConfig = None,
+        polling: PollingStrategy = None,
         **kwargs,
     ):
         """Create a new client.
 
         If `workspace` is provided, it will anchor the client in a workspace by that name, creating it if necessary.
         Otherwise the `default` workspace will be used.
+
+        If `transport` is provided, it overrides the connection pooling and retry policy of `config`.
+        If `polling` is provided, it overrides the default schedule on which this client's waiters poll for status.
         """
         if config is not None and not isinstance(config, Configuration):
             config = Configuration.parse_obj(config)
 
-        self._session = Session()
         config = config or Configuration(
             api_key=api_key,
             api_base=api_base,
@@ -88,7 +179,12 @@ class Client(CamelModel, ABC):
             profile=profile,
             config_file=config_file,
         )
+        if transport is not None:
+            config.transport = transport
+        if polling is not None:
+            config.polling = polling
 
+        self._session = create_session(config.transport)
         super().__init__(config=config)
         # The lambda_handler will pass in the workspace via the workspace_id, so we need to plumb this through to make sure
         # that the workspace switch performed doesn't mistake `workspace=None` as a request for the default workspace
@@ -142,6 +238,8 @@ class Client(CamelModel, ABC):
             return_id = workspace_id
             return_handle = workspace_handle
         else:
+            # Workspace resolution is invoked non-virtually: subclasses with a non-blocking transport (see
+            # `AsyncClient`) still need it to complete synchronously during construction.
             try:
                 if workspace_handle is not None and workspace_id is not None:
                     get_params = {
@@ -149,16 +247,16 @@ class Client(CamelModel, ABC):
                         "id": workspace_id,
                         "fetchIfExists": False,
                     }
-                    workspace = self.post("workspace/get", get_params)
+                    workspace = Client.call(self, Verb.POST, "workspace/get", get_params)
                 elif workspace_handle is not None:
                     get_params = {
                         "handle": workspace_handle,
                         "fetchIfExists": not fail_if_workspace_exists,
                     }
-                    workspace = self.post("workspace/create", get_params)
+                    workspace = Client.call(self, Verb.POST, "workspace/create", get_params)
                 elif workspace_id is not None:
                     get_params = {"id": workspace_id}
-                    workspace = self.post("workspace/get", get_params)
+                    workspace = Client.call(self, Verb.POST, "workspace/get", get_params)
 
             except SteamshipError as e:
                 self.config.workspace_handle = old_workspace_handle
@@ -348,10 +446,21 @@ class Client(CamelModel, ABC):
                 if ct in [MimeTypes.TXT, MimeTypes.MKD, MimeTypes.HTML]:
                     return resp.text
                 elif ct == MimeTypes.JSON:
-                    return resp.json()
+                    return json_codec.loads(resp.content)
                 else:
                     return resp.content
 
+    @staticmethod
+    def _retry_after_s(headers: Any) -> Optional[float]:
+        """Parse a `Retry-After` header given in seconds; HTTP-date values are ignored."""
+        value = headers.get("Retry-After") if headers else None
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+
     @staticmethod
     def _prepare_multipart_data(data, file):
         # Note: requests seems to have a bug passing boolean (and maybe numeric?)
@@ -372,39 +481,9 @@ class Client(CamelModel, ABC):
         return result
 
     def _add_client_to_response(self, expect: Type, response_data: Any):
-        if isinstance(response_data, dict):
-            self._add_client_to_object(expect, response_data)
-        elif isinstance(response_data, list):
-            for el in response_data:
-                typing_parameters = typing.get_args(expect)
-                self._add_client_to_response(
-                    typing_parameters[0] if typing_parameters else None, el
-                )
-
+        _injection_plan(expect).apply(self, response_data)
         return response_data
 
-    def _add_client_to_object(self, expect, response_data):
-        if expect and isclass(expect):
-            if len(response_data.keys()) == 1 and list(response_data.keys())[0] in (
-                to_camel(expect.__name__),
-                to_camel(expect.__name__).replace("package", "invocable"),
-                # Hack since engine uses "App" instead of "Package"
-                "index",
-                "pluginInstance",  # Inlined here since `expect` may be a subclass of pluginInstance
-            ):
-                # TODO (enias): Hack since the engine responds with incosistent formats e.g. {"plugin" : {plugin_fields}}
-                for _, v in response_data.items():
-                    self._add_client_to_response(expect, v)
-            elif issubclass(expect, BaseModel):
-                response_data["client"] = self
-                try:
-                    key_to_type = typing.get_type_hints(expect)
-                    for k, v in response_data.items():
-                        self._add_client_to_response(key_to_type.get(inflection.underscore(k)), v)
-                except NameError:
-                    # typing.get_type_hints fails for Workspace
-                    pass
-
     def call(  # noqa: C901
         self,
         verb: Verb,
@@ -440,13 +519,9 @@ class Client(CamelModel, ABC):
         if the `error` field is filled in.
         """
         # TODO (enias): Review this codebase
-        url = self._url(
-            is_package_call=is_package_call,
-            package_owner=package_owner,
+        url, headers, data = self._prepare_call(
             operation=operation,
-        )
-
-        headers = self._headers(
+            payload=payload,
             is_package_call=is_package_call,
             package_owner=package_owner,
             package_id=package_id,
@@ -456,20 +531,33 @@ class Client(CamelModel, ABC):
             task_delay_ms=task_delay_ms,
         )
 
-        data = self._prepare_data(payload=payload)
-
         logging.debug(
             f"Making {verb} to {url} in workspace {self.config.workspace_handle}/{self.config.workspace_id}"
         )
         if verb == Verb.POST:
             if file is not None:
                 files = self._prepare_multipart_data(data, file)
-                resp = self._session.post(url, files=files, headers=headers, timeout=timeout_s)
+                if MultipartStream.is_streamable(files):
+                    # Stream file-like content from disk rather than assembling the whole body in memory.
+                    body = MultipartStream(files)
+                    resp = self._session.post(
+                        url,
+                        data=body,
+                        headers={**headers, "Content-Type": body.content_type},
+                        timeout=timeout_s,
+                    )
+                else:
+                    resp = self._session.post(url, files=files, headers=headers, timeout=timeout_s)
             else:
                 if isinstance(data, bytes):
                     resp = self._session.post(url, data=data, headers=headers, timeout=timeout_s)
                 else:
-                    resp = self._session.post(url, json=data, headers=headers, timeout=timeout_s)
+                    resp = self._session.post(
+                        url,
+                        data=json_codec.dumps_bytes(data),
+                        headers={**headers, "Content-Type": MimeTypes.JSON.value},
+                        timeout=timeout_s,
+                    )
         elif verb == Verb.GET:
             resp = self._session.get(url, params=data, headers=headers, timeout=timeout_s)
         else:
@@ -482,6 +570,62 @@ class Client(CamelModel, ABC):
 
         response_data = self._response_data(resp, raw_response=raw_response)
 
+        return self._process_response(
+            response_data,
+            ok=resp.ok,
+            expect=expect,
+            is_package_call=is_package_call,
+            retry_after_s=self._retry_after_s(resp.headers),
+            status_code=resp.status_code,
+        )
+
+    def _prepare_call(
+        self,
+        operation: str,
+        payload: Union[Request, dict, bytes] = None,
+        is_package_call: bool = False,
+        package_owner: str = None,
+        package_id: str = None,
+        package_instance_id: str = None,
+        as_background_task: bool = False,
+        wait_on_tasks: List[Union[str, Task]] = None,
+        task_delay_ms: Optional[int] = None,
+    ) -> Tuple[str, Dict[str, str], Any]:
+        """Resolve the URL, headers and request body of an API call, independent of the HTTP stack used to send it."""
+        url = self._url(
+            is_package_call=is_package_call,
+            package_owner=package_owner,
+            operation=operation,
+        )
+
+        headers = self._headers(
+            is_package_call=is_package_call,
+            package_owner=package_owner,
+            package_id=package_id,
+            package_instance_id=package_instance_id,
+            as_background_task=as_background_task,
+            wait_on_tasks=wait_on_tasks,
+            task_delay_ms=task_delay_ms,
+        )
+
+        data = self._prepare_data(payload=payload)
+        return url, headers, data
+
+    def _process_response(  # noqa: C901
+        self,
+        response_data: Any,
+        ok: bool,
+        expect: Type[T] = None,
+        is_package_call: bool = False,
+        retry_after_s: Optional[float] = None,
+        status_code: Optional[int] = None,
+    ) -> Union[Any, Task]:
+        """Unwrap a decoded API response into its `data`, a `Task`, or a raised `SteamshipError`.
+
+        `ok` reports whether the HTTP status of the response indicated success. `retry_after_s` is the server's
+        suggested delay before polling again, which is recorded on any returned `Task`. `status_code`, the HTTP status
+        of the response, is recorded on any raised `SteamshipError`.
+        """
         logging.debug(f"Response JSON {response_data}")
 
         task = None
@@ -493,6 +637,7 @@ class Client(CamelModel, ABC):
                     task = Task.parse_obj(
                         {**response_data["status"], "client": self, "expect": expect}
                     )
+                    task.retry_after_s = retry_after_s
                     if "state" in response_data["status"]:
                         if response_data["status"]["state"] == "failed":
                             error = SteamshipError.from_dict(response_data["status"])
@@ -534,12 +679,15 @@ class Client(CamelModel, ABC):
 
         if error is not None:
             logging.warning(f"Client received error from server: {error}", exc_info=error)
+            error.http_status = status_code
             raise error
 
-        if not resp.ok:
-            raise SteamshipError(
+        if not ok:
+            error = SteamshipError(
                 f"API call did not complete successfully.  Server returned: {response_data}"
             )
+            error.http_status = status_code
+            raise error
 
         elif task is not None:
             return task
@@ -9,6 +9,8 @@ import inflection
 from pydantic import AnyHttpUrl, SecretStr
 
 from steamship.base.model import CamelModel, to_camel
+from steamship.base.polling import PollingStrategy
+from steamship.base.transport import TransportConfig
 from steamship.cli.login import login
 from steamship.utils.utils import format_uri
 
@@ -44,6 +46,8 @@ class Configuration(CamelModel):
     workspace_id: str = None
     workspace_handle: str = None
     profile: Optional[str] = None
+    transport: TransportConfig = TransportConfig()
+    polling: PollingStrategy = PollingStrategy()
 
     # For use in deployed packages and plugins for tracing. Do not set manually
     request_id: Optional[str] = None
@@ -12,6 +12,8 @@ class SteamshipError(Exception):
     suggestion: str = None
     code: str = None
     error: str = None
+    http_status: int = None
+    """The HTTP status of the response this error was raised from, if it was raised from one."""
 
     def __init__(
         self,
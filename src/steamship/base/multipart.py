@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import io
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+"""Called as `(bytes_sent, total_bytes)` while an upload is in progress. `total_bytes` is None if unknown."""
+
+
+def stream_length(stream: Any) -> Optional[int]:
+    """Return the number of bytes left to read from `stream`, or None if it cannot be determined without reading."""
+    try:
+        position = stream.tell()
+        if hasattr(stream, "__len__"):
+            return len(stream) - position
+        end = stream.seek(0, io.SEEK_END)
+        stream.seek(position)
+        return end - position
+    except (AttributeError, OSError, TypeError, ValueError):
+        return None
+
+
+class ProgressReader(io.RawIOBase):
+    """Wraps a binary stream, reporting the number of bytes read from it to a `ProgressCallback`.
+
+    Seeking (e.g. rewinding the body to retry a request) moves the reported progress along with the stream.
+    """
+
+    def __init__(self, stream: BinaryIO, on_progress: ProgressCallback):
+        super().__init__()
+        self.stream = stream
+        self.on_progress = on_progress
+        self.total = stream_length(stream)
+        self.bytes_read = 0
+        try:
+            self._start = stream.tell()
+        except (AttributeError, OSError):
+            self._start = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self.stream.seekable()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        position = self.stream.seek(offset, whence)
+        self.bytes_read = max(0, position - self._start)
+        return position
+
+    def tell(self) -> int:
+        return self.stream.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.stream.read(size)
+        if chunk:
+            self.bytes_read += len(chunk)
+            self.on_progress(self.bytes_read, self.total)
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
+class MultipartStream(io.RawIOBase):
+    """A `multipart/form-data` request body that is produced lazily as it is read.
+
+    Encodes the same parts, byte for byte, as `requests` does for its `files=` argument, but reads file-like part
+    values in chunks as the body is sent instead of copying them into memory. The total length is known up front so
+    the upload is sent with a `Content-Length` rather than chunked transfer encoding.
+    """
+
+    def __init__(
+        self,
+        files: Dict[str, Tuple[Optional[str], Any, Optional[str]]],
+        boundary: Optional[str] = None,
+    ):
+        super().__init__()
+        self.boundary = boundary or choose_boundary()
+        self._segments: List[Union[bytes, Tuple[Any, int]]] = []
+        self._length = 0
+
+        for name, (filename, value, content_type) in files.items():
+            if value is None:
+                continue
+            field = RequestField(name=name, data=b"", filename=filename)
+            field.make_multipart(content_type=content_type)
+            self._add(f"--{self.boundary}\r\n".encode("utf-8"))
+            self._add(field.render_headers().encode("utf-8"))
+            if hasattr(value, "read"):
+                length = stream_length(value)
+                if length is None:
+                    raise ValueError(f"Unable to stream multipart field {name}: length unknown")
+                self._segments.append((value, length))
+                self._length += length
+            else:
+                if isinstance(value, int):
+                    value = str(value)
+                self._add(value.encode("utf-8") if isinstance(value, str) else bytes(value))
+            self._add(b"\r\n")
+        self._add(f"--{self.boundary}--\r\n".encode("utf-8"))
+
+        self._segment_index = 0
+        self._segment_offset = 0
+        self._position = 0
+
+    @staticmethod
+    def is_streamable(files: Dict[str, Tuple[Optional[str], Any, Optional[str]]]) -> bool:
+        """Whether any part is a file-like object of known length, which is worth streaming."""
+        return any(
+            hasattr(value, "read") and stream_length(value) is not None
+            for _, value, _ in files.values()
+        )
+
+    def _add(self, data: bytes):
+        self._segments.append(data)
+        self._length += len(data)
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def tell(self) -> int:
+        return self._position
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length - self._position
+        chunks = []
+        while size > 0 and self._segment_index < len(self._segments):
+            segment = self._segments[self._segment_index]
+            if isinstance(segment, bytes):
+                chunk = segment[self._segment_offset : self._segment_offset + size]
+                remaining = len(segment) - self._segment_offset - len(chunk)
+            else:
+                stream, length = segment
+                chunk = stream.read(min(size, length - self._segment_offset))
+                if not chunk and length > self._segment_offset:
+                    raise ValueError("Multipart field stream ended before its declared length")
+                remaining = length - self._segment_offset - len(chunk)
+            chunks.append(chunk)
+            size -= len(chunk)
+            if remaining > 0:
+                self._segment_offset += len(chunk)
+            else:
+                self._segment_index += 1
+                self._segment_offset = 0
+        data = b"".join(chunks)
+        self._position += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
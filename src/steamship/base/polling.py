@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from steamship.base.model import CamelModel
+
+
+class PollingStrategy(CamelModel):
+    """The schedule on which waiters (e.g. `Task.wait`, `PluginInstance.wait_for_init`) poll for status.
+
+    The first poll happens almost immediately so that short operations return quickly; the delay then grows
+    geometrically up to `max_delay_s` so that long-running operations only cost a handful of requests.
+    """
+
+    initial_delay_s: float = 0.05
+    """Delay before the first status check."""
+
+    backoff_factor: float = 2.0
+    """Multiplier applied to the delay after each status check. A factor of 1 polls on a fixed interval."""
+
+    max_delay_s: float = 10.0
+    """Upper bound on the delay between status checks, unless the server asks for a longer one."""
+
+    @staticmethod
+    def fixed(delay_s: float) -> PollingStrategy:
+        """A strategy which polls on a constant `delay_s` interval."""
+        return PollingStrategy(initial_delay_s=delay_s, backoff_factor=1, max_delay_s=delay_s)
+
+    def next_delay(self, delay_s: Optional[float] = None, hint_s: Optional[float] = None) -> float:
+        """Return the delay before the next status check.
+
+        Parameters
+        ----------
+        delay_s : Optional[float]
+            The previous delay, or None before the first check.
+        hint_s : Optional[float]
+            A server-suggested delay (e.g. from a `Retry-After` header). The returned delay is never shorter.
+        """
+        if delay_s is None:
+            next_delay_s = self.initial_delay_s
+        else:
+            next_delay_s = min(self.max_delay_s, delay_s * self.backoff_factor)
+        if hint_s is not None:
+            next_delay_s = max(next_delay_s, hint_s)
+        return next_delay_s
+
+
+def resolve_polling_strategy(
+    client: Any = None,
+    polling: Optional[PollingStrategy] = None,
+    retry_delay_s: Optional[float] = None,
+) -> PollingStrategy:
+    """Pick the strategy for one wait: an explicit `polling`, then a fixed `retry_delay_s`, then the client's default."""
+    if polling is not None:
+        return polling
+    if retry_delay_s is not None:
+        return PollingStrategy.fixed(retry_delay_s)
+    config = getattr(client, "config", None)
+    if config is not None and config.polling is not None:
+        return config.polling
+    return PollingStrategy()
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import Any, Callable, Dict, Generic, List, Optional, Set, Type, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Set, Type, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from steamship.base.error import SteamshipError
 from steamship.base.model import CamelModel, GenericCamelModel
+from steamship.base.polling import PollingStrategy, resolve_polling_strategy
 from steamship.base.request import DeleteRequest, IdentifierRequest, ListRequest, Request, SortOrder
 from steamship.utils.metadata import metadata_to_str, str_to_metadata
 
@@ -184,6 +187,14 @@ class Task(GenericCamelModel, Generic[T]):
     max_retries: int = None  # The maximum number of retries allowed for this task
     retries: int = None  # The number of retries already used.
 
+    # Note: The Field object prevents this from being serialized into JSON
+    retry_after_s: Optional[float] = Field(
+        None, exclude=True
+    )  # Server-suggested delay before the next status check, from the `Retry-After` header.
+
+    # Applied, in order, to each output received once the task has succeeded. See `map_output`.
+    _output_projections: List[Callable[[Any], Any]] = PrivateAttr(default_factory=list)
+
     def as_error(self) -> SteamshipError:
         return SteamshipError(
             message=self.status_message, suggestion=self.status_suggestion, code=self.status_code
@@ -211,6 +222,20 @@ class Task(GenericCamelModel, Generic[T]):
         other = other or Task()
         for k, v in other.__dict__.items():
             self.__dict__[k] = v
+        if self.state == TaskState.succeeded and self.output is not None:
+            for projection in self._output_projections:
+                self.output = projection(self.output)
+
+    def map_output(self, projection: Callable[[Any], Any]) -> Task:
+        """Transform the output of this task with `projection` once it is available, returning this task.
+
+        This does not wait for the task: if it has already succeeded, its output is transformed now; otherwise the
+        output is transformed when a status check (e.g. in `wait`) finds that it has succeeded.
+        """
+        self._output_projections.append(projection)
+        if self.state == TaskState.succeeded and self.output is not None:
+            self.output = projection(self.output)
+        return self
 
     def add_comment(
         self,
@@ -238,8 +263,9 @@ class Task(GenericCamelModel, Generic[T]):
     def wait(
         self,
         max_timeout_s: float = 180,
-        retry_delay_s: float = 1,
+        retry_delay_s: Optional[float] = None,
         on_each_refresh: "Optional[Callable[[int, float, Task], None]]" = None,
+        polling: Optional[PollingStrategy] = None,
     ):
         """Polls and blocks until the task has succeeded or failed (or timeout reached).
 
@@ -248,23 +274,28 @@ class Task(GenericCamelModel, Generic[T]):
         max_timeout_s : int
             Max timeout in seconds. Default: 180s. After this timeout, an exception will be thrown.
             A timeout of -1 is equivalent to no timeout.
-        retry_delay_s : float
-            Delay between status checks. Default: 1s.
+        retry_delay_s : Optional[float]
+            Fixed delay between status checks. By default, the client's `PollingStrategy` is used instead.
         on_each_refresh : Optional[Callable[[int, float, Task], None]]
             Optional call back you can get after each refresh is made, including success state refreshes.
             The signature represents: (refresh #, total elapsed time, task)
 
             WARNING: Do not pass a long-running function to this variable. It will block the update polling.
+        polling : Optional[PollingStrategy]
+            Schedule of status checks for this call, overriding the client's default.
         """
+        polling = resolve_polling_strategy(self.client, polling, retry_delay_s)
         t0 = time.perf_counter()
         refresh_count = 0
+        delay_s = None
         while (
             (max_timeout_s == -1) or (time.perf_counter() - t0 < max_timeout_s)
         ) and self.state not in (
             TaskState.succeeded,
             TaskState.failed,
         ):
-            time.sleep(retry_delay_s)
+            delay_s = polling.next_delay(delay_s, hint_s=self.retry_after_s)
+            time.sleep(delay_s)
             self.refresh()
             refresh_count += 1
 
@@ -281,27 +312,125 @@ class Task(GenericCamelModel, Generic[T]):
 
     def wait_until_completed(
         self,
-        retry_delay_s: float = 1,
+        retry_delay_s: Optional[float] = None,
         on_each_refresh: "Optional[Callable[[int, float, Task], None]]" = None,
+        polling: Optional[PollingStrategy] = None,
     ):
         """Polls and blocks until the task has succeeded or failed. No timeout on waiting is applied.
 
         Parameters
         ----------
-        retry_delay_s : float
-            Delay between status checks. Default: 1s.
+        retry_delay_s : Optional[float]
+            Fixed delay between status checks. By default, the client's `PollingStrategy` is used instead.
         on_each_refresh : Optional[Callable[[int, float, Task], None]]
             Optional call back you can get after each refresh is made, including success state refreshes.
             The signature represents: (refresh #, total elapsed time, task)
 
             WARNING: Do not pass a long-running function to this variable. It will block the update polling.
+        polling : Optional[PollingStrategy]
+            Schedule of status checks for this call, overriding the client's default.
         """
         return self.wait(
             max_timeout_s=-1,  # Indicates to not apply a timeout
             retry_delay_s=retry_delay_s,
             on_each_refresh=on_each_refresh,
+            polling=polling,
         )
 
+    @staticmethod
+    def as_completed(
+        tasks: List[Task],
+        max_timeout_s: float = 180,
+        retry_delay_s: Optional[float] = None,
+        max_workers: int = 8,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Iterator[Task]:
+        """Polls a set of tasks together, yielding each one as soon as it has succeeded or failed.
+
+        All pending tasks are refreshed concurrently on each tick, and the whole set shares a single poll schedule,
+        which backs off only while none of the tasks complete. Tasks which are already complete are yielded without
+        being polled.
+
+        Parameters
+        ----------
+        tasks : List[Task]
+            The tasks to wait on. They must have been created by a blocking `Client`.
+        max_timeout_s : float
+            Max timeout in seconds for the whole set. Default: 180s. After this timeout, an exception will be thrown.
+            A timeout of -1 is equivalent to no timeout.
+        retry_delay_s : Optional[float]
+            Fixed delay between status checks. By default, the client's `PollingStrategy` is used instead.
+        max_workers : int
+            Maximum number of status requests in flight at once. Default: 8.
+        polling : Optional[PollingStrategy]
+            Schedule of status checks for this call, overriding the client's default.
+        """
+        t0 = time.perf_counter()
+        delay_s = None
+        progressed = False
+        pending = []
+        for task in tasks:
+            if task.state in (TaskState.succeeded, TaskState.failed):
+                yield task
+            else:
+                pending.append(task)
+
+        if not pending:
+            return
+
+        polling = resolve_polling_strategy(pending[0].client, polling, retry_delay_s)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+            while pending and ((max_timeout_s == -1) or (time.perf_counter() - t0 < max_timeout_s)):
+                hints = [task.retry_after_s for task in pending if task.retry_after_s is not None]
+                hint_s = max(hints, default=None)
+                if progressed:
+                    # Hold the current interval rather than backing off further while tasks are completing.
+                    delay_s = max(delay_s, hint_s or 0)
+                else:
+                    delay_s = polling.next_delay(delay_s, hint_s=hint_s)
+                time.sleep(delay_s)
+                # Refresh the whole set at once; surface the first failed status request, as `wait` would.
+                for _ in executor.map(lambda t: t.refresh(), pending):
+                    pass
+
+                still_pending = []
+                for task in pending:
+                    if task.state in (TaskState.succeeded, TaskState.failed):
+                        yield task
+                    else:
+                        still_pending.append(task)
+
+                progressed = len(still_pending) < len(pending)
+                pending = still_pending
+
+        if pending:
+            task_ids = ", ".join(str(task.task_id) for task in pending)
+            raise SteamshipError(
+                message=f"Tasks {task_ids} did not complete within requested timeout of {max_timeout_s}s. The tasks are still running on the server. You can retrieve their status via Task.get() or try waiting again."
+            )
+
+    @staticmethod
+    def wait_all(
+        tasks: List[Task],
+        max_timeout_s: float = 180,
+        retry_delay_s: Optional[float] = None,
+        max_workers: int = 8,
+        polling: Optional[PollingStrategy] = None,
+    ) -> List[Any]:
+        """Polls and blocks until every task has succeeded or failed (or timeout reached).
+
+        Returns the outputs of the tasks, in the order the tasks were given. Parameters are as in `as_completed`.
+        """
+        for _ in Task.as_completed(
+            tasks,
+            max_timeout_s=max_timeout_s,
+            retry_delay_s=retry_delay_s,
+            max_workers=max_workers,
+            polling=polling,
+        ):
+            pass
+        return [task.output for task in tasks]
+
     def refresh(self):
         if self.task_id is None:
             raise SteamshipError(message="Unable to refresh task because `task_id` is None")
@@ -313,6 +442,50 @@ class Task(GenericCamelModel, Generic[T]):
         resp = self.client.post("task/status", payload=req, expect=self.expect)
         self.update(resp)
 
+    async def wait_async(
+        self,
+        max_timeout_s: float = 180,
+        retry_delay_s: Optional[float] = None,
+        on_each_refresh: "Optional[Callable[[int, float, Task], None]]" = None,
+        polling: Optional[PollingStrategy] = None,
+    ):
+        """Polls without blocking the event loop until the task has succeeded or failed (or timeout reached).
+
+        For use with tasks returned by an `AsyncClient`. Parameters are as in `wait`.
+        """
+        polling = resolve_polling_strategy(self.client, polling, retry_delay_s)
+        t0 = time.perf_counter()
+        refresh_count = 0
+        delay_s = None
+        while (
+            (max_timeout_s == -1) or (time.perf_counter() - t0 < max_timeout_s)
+        ) and self.state not in (
+            TaskState.succeeded,
+            TaskState.failed,
+        ):
+            delay_s = polling.next_delay(delay_s, hint_s=self.retry_after_s)
+            await asyncio.sleep(delay_s)
+            await self.refresh_async()
+            refresh_count += 1
+
+            if on_each_refresh:
+                on_each_refresh(refresh_count, time.perf_counter() - t0, self)
+
+        if self.state not in (TaskState.succeeded, TaskState.failed):
+            raise SteamshipError(
+                message=f"Task {self.task_id} did not complete within requested timeout of {max_timeout_s}s. The task is still running on the server. You can retrieve its status via Task.get() or try waiting again with wait_async()."
+            )
+        return self.output
+
+    async def refresh_async(self):
+        """Refresh this task's status through an `AsyncClient`."""
+        if self.task_id is None:
+            raise SteamshipError(message="Unable to refresh task because `task_id` is None")
+
+        req = TaskStatusRequest(taskId=self.task_id)
+        resp = await self.client.post("task/status", payload=req, expect=self.expect)
+        self.update(resp)
+
 
 from .client import Client  # noqa: E402
 
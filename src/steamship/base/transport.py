@@ -0,0 +1,92 @@
+import random
+from typing import List
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from steamship.base.model import CamelModel
+
+DEFAULT_RETRY_STATUS_CODES = [429, 502, 503, 504]
+DEFAULT_RETRY_METHODS = ["DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"]
+
+
+class TransportConfig(CamelModel):
+    """Connection pooling, keep-alive and retry behavior of the HTTP transport used by a `Client`."""
+
+    pool_connections: int = 10
+    """Number of per-host connection pools to cache."""
+
+    pool_maxsize: int = 10
+    """Maximum number of connections kept open to any single host."""
+
+    pool_block: bool = False
+    """Whether to wait for a free connection instead of opening (and discarding) an extra one when the pool is full."""
+
+    keep_alive: bool = True
+    """Whether to reuse connections across requests. Disabling sends `Connection: close` on every request."""
+
+    max_retries: int = 3
+    """Maximum number of retries for a failed request. Set to 0 to disable retries."""
+
+    retry_status_codes: List[int] = DEFAULT_RETRY_STATUS_CODES
+    """HTTP status codes which cause a request to be retried."""
+
+    retry_methods: List[str] = DEFAULT_RETRY_METHODS
+    """HTTP verbs which are safe to retry. Most Steamship API calls are POSTs, which are not retried by default."""
+
+    backoff_factor: float = 0.5
+    """Retries sleep for `backoff_factor * 2 ** (retry - 1)` seconds."""
+
+    backoff_jitter: float = 0.5
+    """Upper bound, in seconds, of the random delay added to each backoff to de-synchronize retrying clients."""
+
+
+class JitteredRetry(Retry):
+    """A urllib3 `Retry` that adds a random delay to its exponential backoff."""
+
+    def __init__(self, backoff_jitter: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.backoff_jitter = backoff_jitter
+
+    def new(self, **kw) -> "JitteredRetry":
+        retry = super().new(**kw)
+        retry.backoff_jitter = self.backoff_jitter
+        return retry
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff > 0 and self.backoff_jitter > 0:
+            backoff = min(
+                self.DEFAULT_BACKOFF_MAX, backoff + random.uniform(0, self.backoff_jitter)
+            )
+        return backoff
+
+
+def create_session(transport: TransportConfig) -> Session:
+    """Create a `requests.Session` with the pooling and retry policy described by `transport`."""
+    retry = JitteredRetry(
+        total=transport.max_retries,
+        connect=transport.max_retries,
+        read=transport.max_retries,
+        status=transport.max_retries,
+        status_forcelist=transport.retry_status_codes,
+        allowed_methods=frozenset(method.upper() for method in transport.retry_methods),
+        backoff_factor=transport.backoff_factor,
+        backoff_jitter=transport.backoff_jitter,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # Hand the final response back so the client can surface the server's error.
+    )
+    adapter = HTTPAdapter(
+        pool_connections=transport.pool_connections,
+        pool_maxsize=transport.pool_maxsize,
+        pool_block=transport.pool_block,
+        max_retries=retry,
+    )
+
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not transport.keep_alive:
+        session.headers["Connection"] = "close"
+    return session
@@ -1,3 +1,4 @@
+from .async_steamship import AsyncSteamship
 from .steamship import Steamship
 
-__all__ = ["Steamship"]
+__all__ = ["Steamship", "AsyncSteamship"]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import List
+
+from steamship.base.async_client import AsyncClient
+from steamship.base.configuration import Configuration
+from steamship.data.embeddings import EmbedAndSearchRequest, QueryResults
+
+
+class AsyncSteamship(AsyncClient):
+    """Steamship Python Client for use from an asyncio event loop.
+
+    Every API call is a coroutine, so many calls can be in flight at once from a single thread:
+
+    ```python
+    async with AsyncSteamship(workspace="my-workspace") as client:
+        files = await asyncio.gather(*[File.get(client, _id=file_id) for file_id in file_ids])
+    ```
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        api_base: str = None,
+        app_base: str = None,
+        web_base: str = None,
+        workspace: str = None,
+        fail_if_workspace_exists: bool = False,
+        profile: str = None,
+        config_file: str = None,
+        config: Configuration = None,
+        trust_workspace_config: bool = False,  # For use by lambda_handler; don't fetch the workspace
+        **kwargs,
+    ):
+        super().__init__(
+            api_key=api_key,
+            api_base=api_base,
+            app_base=app_base,
+            web_base=web_base,
+            workspace=workspace,
+            fail_if_workspace_exists=fail_if_workspace_exists,
+            profile=profile,
+            config_file=config_file,
+            config=config,
+            trust_workspace_config=trust_workspace_config,
+            **kwargs,
+        )
+
+    async def embed_and_search(
+        self,
+        query: str,
+        docs: List[str],
+        plugin_instance: str,
+        k: int = 1,
+    ) -> QueryResults:
+        req = EmbedAndSearchRequest(query=query, docs=docs, plugin_instance=plugin_instance, k=k)
+        return await self.post(
+            "plugin/instance/embeddingSearch",
+            req,
+            expect=QueryResults,
+        )
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
-from typing import Any, Dict, List, Optional, Type, Union
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Type, Union
 
+import aiohttp
+import requests
 from pydantic import BaseModel, Field
 
 from steamship import SteamshipError
@@ -16,6 +23,30 @@ from steamship.utils.metadata import metadata_to_str
 
 MAX_RECOMMENDED_ITEM_LENGTH = 5000
 
+MAX_INSERT_BATCH_ITEMS = 1000
+"""The most items `EmbeddingIndex.insert_many` sends in a single request."""
+
+MAX_INSERT_BATCH_BYTES = 4 * 1024 * 1024
+"""The (estimated) largest request body `EmbeddingIndex.insert_many` sends in a single request."""
+
+DEFAULT_INSERT_WORKERS = 4
+
+TRANSIENT_INSERT_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    aiohttp.ClientConnectionError,
+    asyncio.TimeoutError,
+)
+"""Errors sending an insert request which `EmbeddingIndex.insert_many` may retry."""
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed insert may succeed if sent again: a connection failure, a timeout, a 429 or a 5xx."""
+    if isinstance(error, TRANSIENT_INSERT_ERRORS):
+        return True
+    status = getattr(error, "http_status", None) if isinstance(error, SteamshipError) else None
+    return status is not None and (status == 429 or status >= 500)
+
 
 class EmbedAndSearchRequest(Request):
     query: str
@@ -97,6 +128,31 @@ class IndexInsertResponse(Response):
     item_ids: List[IndexItemId] = None
 
 
+class PartialInsertError(SteamshipError):
+    """Raised by `EmbeddingIndex.insert_many` when a batch fails after other batches were inserted."""
+
+    inserted_items: List[int]
+    """The positions, within the items passed to `insert_many`, of the items that were inserted."""
+
+    item_ids: List[IndexItemId]
+    """The ids of the inserted items, in the order of `inserted_items`."""
+
+    def __init__(
+        self,
+        message: str,
+        inserted_items: List[int],
+        item_ids: List[IndexItemId],
+        error: Exception,
+    ):
+        super().__init__(
+            message=message,
+            suggestion="Insert the items not listed in `inserted_items` again, then reindex.",
+            error=error,
+        )
+        self.inserted_items = inserted_items
+        self.item_ids = item_ids
+
+
 class IndexEmbedRequest(Request):
     id: str
 
@@ -194,30 +250,177 @@ class EmbeddingIndex(CamelModel):
                                 f"Inserted item {i} of length {len(item.value)} exceeded maximum recommended length of {MAX_RECOMMENDED_ITEM_LENGTH} characters. You may insert it anyway by passing allow_long_records=True."
                             )
 
+    @staticmethod
+    def _estimated_size(item: EmbeddedItem) -> int:
+        """A cheap upper-bound-ish estimate of the bytes an item adds to an insert request."""
+        size = 256  # field names and punctuation
+        for value in (item.value, item.metadata, item.external_id, item.external_type):
+            if isinstance(value, str):
+                size += len(value)
+        if item.embedding:
+            size += 24 * len(item.embedding)
+        return size
+
+    @staticmethod
+    def _batches(
+        items: List[EmbeddedItem], max_items: int, max_bytes: int
+    ) -> Iterator[List[EmbeddedItem]]:
+        batch, batch_bytes = [], 0
+        for item in items:
+            item_bytes = EmbeddingIndex._estimated_size(item)
+            if batch and (len(batch) >= max_items or batch_bytes + item_bytes > max_bytes):
+                yield batch
+                batch, batch_bytes = [], 0
+            batch.append(item)
+            batch_bytes += item_bytes
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _combined_response(
+        batches: List[List[EmbeddedItem]], outcomes: List[Union[IndexInsertResponse, Exception]]
+    ) -> IndexInsertResponse:
+        """Combine the responses to `batches`, or raise a PartialInsertError listing the items that were inserted.
+
+        `outcomes` holds the response or error of each batch sent; batches beyond it were not sent.
+        """
+        inserted_items, item_ids, error = [], [], None
+        start = 0
+        for batch, outcome in zip(batches, outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                error = error or outcome
+            else:
+                inserted_items.extend(range(start, start + len(batch)))
+                item_ids.extend(outcome.item_ids or [])
+            start += len(batch)
+        if error is None and len(outcomes) == len(batches):
+            return IndexInsertResponse(item_ids=item_ids)
+        if not inserted_items:
+            raise error
+
+        total = sum(len(batch) for batch in batches)
+        raise PartialInsertError(
+            message=f"Inserted {len(inserted_items)} of {total} items before a batch failed; the index was not rebuilt. {error}",
+            inserted_items=inserted_items,
+            item_ids=item_ids,
+            error=error,
+        )
+
+    def _insert_batch(
+        self, items: List[EmbeddedItem], reindex: bool, retries: int
+    ) -> IndexInsertResponse:
+        req = IndexInsertRequest(index_id=self.id, items=items, reindex=reindex)
+        backoff_factor = self.client.config.transport.backoff_factor
+        for attempt in range(retries + 1):
+            try:
+                return self.client.post(
+                    "embedding-index/item/create",
+                    req,
+                    expect=IndexInsertResponse,
+                )
+            except Exception as e:
+                if attempt == retries or not _is_transient(e):
+                    raise
+                logging.warning(
+                    f"Inserting a batch of {len(items)} items failed; retrying (attempt {attempt + 2}). {e}"
+                )
+                time.sleep(backoff_factor * 2**attempt)
+
+    async def _insert_batch_async(
+        self, items: List[EmbeddedItem], reindex: bool, retries: int, semaphore: asyncio.Semaphore
+    ) -> IndexInsertResponse:
+        req = IndexInsertRequest(index_id=self.id, items=items, reindex=reindex)
+        backoff_factor = self.client.config.transport.backoff_factor
+        async with semaphore:
+            for attempt in range(retries + 1):
+                try:
+                    return await self.client.post(
+                        "embedding-index/item/create",
+                        req,
+                        expect=IndexInsertResponse,
+                    )
+                except Exception as e:
+                    if attempt == retries or not _is_transient(e):
+                        raise
+                    logging.warning(
+                        f"Inserting a batch of {len(items)} items failed; retrying (attempt {attempt + 2}). {e}"
+                    )
+                    await asyncio.sleep(backoff_factor * 2**attempt)
+
+    async def _insert_batches_async(
+        self, batches: List[List[EmbeddedItem]], reindex: bool, max_workers: int, retries: int
+    ) -> IndexInsertResponse:
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+        *leading, last = batches
+        outcomes = list(
+            await asyncio.gather(
+                *[self._insert_batch_async(batch, False, retries, semaphore) for batch in leading],
+                return_exceptions=True,
+            )
+        )
+        if not any(isinstance(outcome, BaseException) for outcome in outcomes):
+            try:
+                outcomes.append(await self._insert_batch_async(last, reindex, retries, semaphore))
+            except Exception as e:
+                outcomes.append(e)
+        return EmbeddingIndex._combined_response(batches, outcomes)
+
     def insert_many(
         self,
         items: List[Union[EmbeddedItem, str]],
         reindex: bool = True,
         allow_long_records=False,
+        max_batch_items: int = MAX_INSERT_BATCH_ITEMS,
+        max_batch_bytes: int = MAX_INSERT_BATCH_BYTES,
+        max_workers: int = DEFAULT_INSERT_WORKERS,
+        batch_retries: int = 0,
     ) -> IndexInsertResponse:
-        new_items = []
-        for item in items:
-            if isinstance(item, str):
-                new_items.append(EmbeddedItem(value=item))
-            else:
-                new_items.append(item)
+        """Insert items into the index.
+
+        Items are sent in batches of at most `max_batch_items` items and (an estimated) `max_batch_bytes` bytes, up
+        to `max_workers` batches at a time. A batch that fails transiently (a connection error, a timeout, a 429 or
+        a 5xx) may be retried up to `batch_retries` times. Inserts are not idempotent: a batch that was written before
+        its request failed (e.g. with a 5xx or a timeout) is then inserted twice, so retries are off by default. If `reindex`, the index is rebuilt
+        once, with the last batch, after all the others have been inserted. The ids of all inserted items are
+        returned in the order of `items`.
 
+        If a batch still fails, the batches already inserted are kept, the index is not rebuilt, and a
+        `PartialInsertError` lists the items that were inserted.
+
+        With an `AsyncClient`, the batches are sent concurrently on the event loop and the result must be awaited.
+        """
         req = IndexInsertRequest(
             index_id=self.id,
-            items=[item.clone_for_insert() for item in new_items],
+            items=[
+                (EmbeddedItem(value=item) if isinstance(item, str) else item).clone_for_insert()
+                for item in items
+            ],
             reindex=reindex,
         )
         self._check_input(req, allow_long_records)
-        return self.client.post(
-            "embedding-index/item/create",
-            req,
-            expect=IndexInsertResponse,
-        )
+
+        batches = list(EmbeddingIndex._batches(req.items, max_batch_items, max_batch_bytes)) or [[]]
+        if inspect.iscoroutinefunction(self.client.post):
+            return self._insert_batches_async(batches, reindex, max_workers, batch_retries)
+
+        if len(batches) == 1:
+            return self._insert_batch(batches[0], reindex, batch_retries)
+
+        *leading, last = batches
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                executor.submit(self._insert_batch, batch, False, batch_retries)
+                for batch in leading
+            ]
+        outcomes = [future.exception() or future.result() for future in futures]
+        if not any(isinstance(outcome, BaseException) for outcome in outcomes):
+            try:
+                outcomes.append(self._insert_batch(last, reindex, batch_retries))
+            except Exception as e:
+                outcomes.append(e)
+        return EmbeddingIndex._combined_response(batches, outcomes)
 
     def insert(
         self,
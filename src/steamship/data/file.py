@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import inspect
 import io
 import mimetypes
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, BinaryIO, List, Optional, Type, Union
 
 from pydantic import BaseModel, Field
 
 from steamship import MimeTypes, SteamshipError
 from steamship.base.client import Client
 from steamship.base.model import CamelModel
+from steamship.base.multipart import ProgressCallback, ProgressReader
 from steamship.base.request import GetRequest, IdentifierRequest, ListRequest, Request, SortOrder
 from steamship.base.response import ListResponse, Response
 from steamship.base.tasks import Task
@@ -115,13 +117,20 @@ class File(CamelModel):
     @staticmethod
     def create(
         client: Client,
-        content: Union[str, bytes] = None,
+        content: Union[str, bytes, BinaryIO] = None,
         mime_type: MimeTypes = None,
         handle: str = None,
         blocks: List[Block] = None,
         tags: List[Tag] = None,
         public_data: bool = False,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> File:
+        """Create a new Steamship File.
+
+        `content` may be a binary file-like object (e.g. an open file), in which case it is streamed to Steamship in
+        chunks rather than read into memory. If provided, `on_progress` is called with `(bytes_sent, total_bytes)`
+        as the content is uploaded.
+        """
 
         req = {
             "handle": handle,
@@ -157,6 +166,13 @@ class File(CamelModel):
                 tag.dict(by_alias=True, exclude_unset=True, exclude_none=True) for tag in tags or []
             ]
 
+        if on_progress is not None and upload_type == FileUploadType.FILE:
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            if isinstance(content, bytes):
+                content = io.BytesIO(content)
+            content = ProgressReader(content, on_progress)
+
         file_data = (
             ("file-part", content, "multipart/form-data")
             if upload_type == FileUploadType.FILE
@@ -207,11 +223,20 @@ class File(CamelModel):
 
     def refresh(self) -> File:
         refreshed = File.get(self.client, self.id)
-        self.__init__(**refreshed.dict())
-        self.client = refreshed.client
+        self._update_from(refreshed)
+        return self
+
+    def _update_from(self, other: File):
+        """Adopt the fields of `other`, a File fetched from Steamship.
+
+        The fields are taken as they are rather than round-tripped through `__init__`: they have just been validated,
+        and validating every block and tag of a long file again costs more than parsing it did.
+        """
+        for name in self.__fields__:
+            setattr(self, name, getattr(other, name))
+        object.__setattr__(self, "__fields_set__", set(other.__fields_set__))
         for block in self.blocks:
             block.client = self.client
-        return self
 
     @staticmethod
     def query(
@@ -360,7 +385,9 @@ class File(CamelModel):
             mime_type=mime_type,
             public_data=public_data,
         )
-        if (
+        if not self.blocks and block.index_in_file == 0:
+            self.blocks = [block]
+        elif (
             self.blocks is not None
             and len(self.blocks) > 0
             and block.index_in_file == self.blocks[-1].index_in_file + 1
@@ -389,12 +416,14 @@ class File(CamelModel):
         handle: str = None,
         tags: List[Tag] = None,
         public_data: bool = False,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> Any:
         """Loads a local file into a Steamship File.
 
         NOTE: the `file_path` should be relative to where the call to `from_local` is happening.
 
-        Loaded files will automatically be tagged with a provenance tag.
+        Loaded files will automatically be tagged with a provenance tag. The file is streamed from disk, so its size
+        is not limited by available memory.
 
         Args:
             client: Steamship client for the workspace
@@ -403,6 +432,7 @@ class File(CamelModel):
             handle: Intended handle (for lookups, etc.) for Steamship File
             tags: Metadata to add to the Steamship File
             public_data: Whether to make the Steamship File publicly-accessible
+            on_progress: Optional callback, called with `(bytes_sent, total_bytes)` as the file is uploaded
         """
         full_path = Path(file_path).resolve()
 
@@ -418,15 +448,36 @@ class File(CamelModel):
         if tags:
             _tags.extend(tags)
 
-        with full_path.open("rb") as file:
-            return File.create(
+        file = full_path.open("rb")
+        try:
+            result = File.create(
                 client=client,
-                content=file.read(),
+                content=file,
                 mime_type=mime_type,
                 handle=handle,
                 tags=_tags,
                 public_data=public_data,
+                on_progress=on_progress,
             )
+        except BaseException:
+            file.close()
+            raise
+        return _close_when_done(result, file)
+
+
+def _close_when_done(result: Any, stream: BinaryIO) -> Any:
+    """Close `stream` once `result` is complete; with an `AsyncClient`, that is when the returned call is awaited."""
+    if not inspect.isawaitable(result):
+        stream.close()
+        return result
+
+    async def _await_and_close():
+        try:
+            return await result
+        finally:
+            stream.close()
+
+    return _await_and_close()
 
 
 class FileQueryResponse(Response):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import inspect
 import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Type
@@ -9,6 +10,7 @@ from pydantic import BaseModel, Field
 from steamship import SteamshipError, Task
 from steamship.base.client import Client
 from steamship.base.model import CamelModel
+from steamship.base.polling import PollingStrategy, resolve_polling_strategy
 from steamship.base.request import DeleteRequest, IdentifierRequest, ListRequest, Request, SortOrder
 from steamship.base.response import ListResponse
 from steamship.data.block import Block
@@ -139,13 +141,37 @@ class PackageInstance(CamelModel):
             "package/instance/get", IdentifierRequest(handle=handle), expect=PackageInstance
         )
 
+    async def _load_missing_workspace_handle_async(self):
+        if (
+            self.client is not None
+            and self.workspace_handle is None
+            and self.workspace_id is not None
+        ):
+            workspace = await Workspace.get(self.client, id_=self.workspace_id)
+            if workspace:
+                self.workspace_handle = workspace.handle
+
+    async def _invoke_async(self, path: str, verb: Verb, timeout_s: Optional[float], kwargs: dict):
+        await self._load_missing_workspace_handle_async()
+        return await self._call(path, verb, timeout_s, kwargs)
+
     def invoke(
         self, path: str, verb: Verb = Verb.POST, timeout_s: Optional[float] = None, **kwargs
     ):
-        self.load_missing_workspace_handle()
+        """Invoke a method of this package instance.
+
+        With an `AsyncClient`, this returns a coroutine which may be awaited for the result.
+        """
         if path[0] == "/":
             path = path[1:]
 
+        if self.client is not None and inspect.iscoroutinefunction(self.client.call):
+            return self._invoke_async(path, verb, timeout_s, kwargs)
+
+        self.load_missing_workspace_handle()
+        return self._call(path, verb, timeout_s, kwargs)
+
+    def _call(self, path: str, verb: Verb, timeout_s: Optional[float], kwargs: dict):
         return self.client.call(
             verb=verb,
             operation=f"/{self.workspace_handle or '_'}/{self.handle or '_'}/{path}",
@@ -189,7 +215,8 @@ class PackageInstance(CamelModel):
     def wait_for_init(
         self,
         max_timeout_s: float = 180,
-        retry_delay_s: float = 1,
+        retry_delay_s: Optional[float] = None,
+        polling: Optional[PollingStrategy] = None,
     ):
         """Polls and blocks until the init has succeeded or failed (or timeout reached).
 
@@ -197,15 +224,20 @@ class PackageInstance(CamelModel):
         ----------
         max_timeout_s : int
             Max timeout in seconds. Default: 180s. After this timeout, an exception will be thrown.
-        retry_delay_s : float
-            Delay between status checks. Default: 1s.
+        retry_delay_s : Optional[float]
+            Fixed delay between status checks. By default, the client's `PollingStrategy` is used instead.
+        polling : Optional[PollingStrategy]
+            Schedule of status checks for this call, overriding the client's default.
         """
+        polling = resolve_polling_strategy(self.client, polling, retry_delay_s)
         t0 = time.perf_counter()
+        delay_s = None
         while (
             time.perf_counter() - t0 < max_timeout_s
             and self.init_status == InvocableInitStatus.INITIALIZING
         ):
-            time.sleep(retry_delay_s)
+            delay_s = polling.next_delay(delay_s)
+            time.sleep(delay_s)
             self.refresh_init_status()
 
         # If the task did not complete within the timeout, throw an error
@@ -165,7 +165,8 @@ class EmbeddingIndexPluginInstance(PluginInstance):
     def search(self, query: str, k: Optional[int] = None) -> Task[SearchResults]:
         """Search the embedding index.
 
-        This wrapper implementation simply projects the `Hit` data structure into a `Tag`
+        This wrapper implementation simply projects the `Hit` data structure into a `Tag`. The returned task may
+        still be running; call `wait()` for its results.
         """
         if query is None or len(query.strip()) == 0:
             raise SteamshipError(message="Query field must be non-empty.")
@@ -173,15 +174,15 @@ class EmbeddingIndexPluginInstance(PluginInstance):
         # Metadata will always be included; this is the equivalent of Tag.value
         wrapped_result = self.index.search(query, k=k, include_metadata=True)
 
-        # For now, we'll have to do this synchronously since we're trying to avoid changing things on the engine.
-        wrapped_result.wait()
-
-        # We're going to do a switcheroo on the output type of Task here.
-        search_results = SearchResults.from_query_results(wrapped_result.output, client=self.client)
-        wrapped_result.output = search_results
-
-        # Return the index's search result, but projected into the data structure of Tags
-        return cast(Task[SearchResults], wrapped_result)
+        # The index's search results are projected into the data structure of Tags when they arrive, so the task
+        # is returned without waiting for it; several searches may be in flight at once (see `Task.wait_all`).
+        client = self.client
+        return cast(
+            Task[SearchResults],
+            wrapped_result.map_output(
+                lambda output: SearchResults.from_query_results(output, client=client)
+            ),
+        )
 
     @staticmethod
     def create(
@@ -9,6 +9,7 @@ from steamship import SteamshipError
 from steamship.base import Task
 from steamship.base.client import Client
 from steamship.base.model import CamelModel
+from steamship.base.polling import PollingStrategy, resolve_polling_strategy
 from steamship.base.request import DeleteRequest, IdentifierRequest, Request
 from steamship.data.block import Block
 from steamship.data.file import File
@@ -204,7 +205,8 @@ class PluginInstance(CamelModel):
     def wait_for_init(
         self,
         max_timeout_s: float = 180,
-        retry_delay_s: float = 1,
+        retry_delay_s: Optional[float] = None,
+        polling: Optional[PollingStrategy] = None,
     ):
         """Polls and blocks until the init has succeeded or failed (or timeout reached).
 
@@ -212,16 +214,21 @@ class PluginInstance(CamelModel):
         ----------
         max_timeout_s : int
             Max timeout in seconds. Default: 180s. After this timeout, an exception will be thrown.
-        retry_delay_s : float
-            Delay between status checks. Default: 1s.
+        retry_delay_s : Optional[float]
+            Fixed delay between status checks. By default, the client's `PollingStrategy` is used instead.
+        polling : Optional[PollingStrategy]
+            Schedule of status checks for this call, overriding the client's default.
         """
+        polling = resolve_polling_strategy(self.client, polling, retry_delay_s)
         t0 = time.perf_counter()
+        delay_s = None
         refresh_count = 0
         while (
             time.perf_counter() - t0 < max_timeout_s
             and self.init_status == InvocableInitStatus.INITIALIZING
         ):
-            time.sleep(retry_delay_s)
+            delay_s = polling.next_delay(delay_s)
+            time.sleep(delay_s)
             self.refresh_init_status()
             refresh_count += 1
 
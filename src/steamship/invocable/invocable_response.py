@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import io
-import json
 import logging
 from typing import Any, Dict, Generic, Optional, TypeVar, Union
 
@@ -14,6 +13,7 @@ from steamship.base.client import Client
 from steamship.base.error import DEFAULT_ERROR_MESSAGE
 from steamship.base.mime_types import ContentEncodings
 from steamship.base.model import CamelModel
+from steamship.utils import json_codec
 from steamship.utils.binary_utils import flexi_create
 
 
@@ -226,7 +226,7 @@ class InvocableResponse(GenericModel, Generic[T]):
 
         if self.data is not None:
             # This object itself should always be the output of the Training Task object.
-            task.output = json.dumps(self.data)
+            task.output = json_codec.dumps(self.data)
             update_fields.add("output")
 
         task.post_update(fields=update_fields)
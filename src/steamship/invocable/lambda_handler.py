@@ -17,6 +17,7 @@ from steamship.base import SteamshipError
 from steamship.client import Steamship
 from steamship.data.workspace import SignedUrl
 from steamship.invocable import Invocable, InvocableRequest, InvocableResponse, InvocationContext
+from steamship.utils import json_codec
 from steamship.utils.signed_urls import upload_to_signed_url
 
 
@@ -210,9 +211,9 @@ def handler(  # noqa: C901
 
     result = response.dict(by_alias=True, exclude={"client"})
     # When created with data > 4MB, data is uploaded to a bucket.
-    # This is a very ugly way to get the deep size of this object
-    data = json.dumps(result.get("data", None)).encode("UTF-8")
-    data_size = sys.getsizeof(data)
+    # This is a very ugly way to get the deep size of this object. It is measured as the Lambda runtime will
+    # serialize it (with the standard library, which escapes non-ASCII text), not as it is uploaded below.
+    data_size = sys.getsizeof(json.dumps(result.get("data", None)).encode("UTF-8"))
     logging.info(f"Response data size {data_size}")
     if data_size > 4e6 and invocation_context.invocable_type == "plugin":
         logging.info("Response data size >4MB, must upload to bucket")
@@ -232,7 +233,7 @@ def handler(  # noqa: C901
 
         logging.info(f"Got signed url for writing: {signed_url}")
 
-        upload_to_signed_url(signed_url, data)
+        upload_to_signed_url(signed_url, json_codec.dumps_bytes(result["data"]))
 
         # Now remove raw data and replace with bucket
         del result["data"]
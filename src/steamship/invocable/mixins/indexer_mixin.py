@@ -6,7 +6,7 @@ from steamship.data.plugin.index_plugin_instance import EmbeddingIndexPluginInst
 from steamship.invocable import post
 from steamship.invocable.package_mixin import PackageMixin
 from steamship.utils.file_tags import update_file_status
-from steamship.utils.text_chunker import chunk_text
+from steamship.utils.text_chunker import chunk_text, chunk_text_by_tokens
 
 DEFAULT_EMBEDDING_INDEX_CONFIG = {
     "embedder": {
@@ -26,6 +26,7 @@ class IndexerMixin(PackageMixin):
     client: Steamship
     context_window_size: int
     context_window_overlap: int
+    chunk_by_tokens: bool
     embedding_index_config: dict
 
     def __init__(
@@ -34,10 +35,17 @@ class IndexerMixin(PackageMixin):
         embedder_config: dict = None,
         context_window_size: int = 200,
         context_window_overlap: int = 50,
+        chunk_by_tokens: bool = False,
     ):
+        """Create an IndexerMixin.
+
+        If `chunk_by_tokens`, the context window size and overlap are measured in tokens rather than characters, and
+        chunks end at sentence boundaries.
+        """
         self.client = client
         self.context_window_size = context_window_size
         self.context_window_overlap = context_window_overlap
+        self.chunk_by_tokens = chunk_by_tokens
         self.embedding_indexes = {}
         self.embedding_index_config = embedder_config or DEFAULT_EMBEDDING_INDEX_CONFIG
 
@@ -78,11 +86,17 @@ class IndexerMixin(PackageMixin):
         - index_handle (uses your default index if blank)
         - metadata (returned on embedding results for source attribution)
         """
-        tags = []
-        for chunk in chunk_text(
-            text, chunk_size=self.context_window_size, chunk_overlap=self.context_window_overlap
-        ):
-            tags.append(Tag(text=chunk, value=metadata))
+        if self.chunk_by_tokens:
+            chunks = chunk_text_by_tokens(
+                text,
+                max_tokens=self.context_window_size,
+                overlap_tokens=self.context_window_overlap,
+            )
+        else:
+            chunks = chunk_text(
+                text, chunk_size=self.context_window_size, chunk_overlap=self.context_window_overlap
+            )
+        tags = [Tag(text=chunk, value=metadata) for chunk in chunks]
         self._get_index(index_handle).insert(tags)
         return True
 
@@ -92,7 +92,9 @@ class ModelCheckpoint(CamelModel):
             raise SteamshipError(
                 message=f"Received empty Signed URL for model download of '{self.handle}."
             )
-        download_from_signed_url(download_resp.signed_url, to_file=self.archive_path_on_disk())
+        download_from_signed_url(
+            download_resp.signed_url, to_file=self.archive_path_on_disk(), max_workers=4
+        )
         unzip_folder(self.archive_path_on_disk(), into_folder=self.folder_path_on_disk())
         return self.folder_path_on_disk()
 
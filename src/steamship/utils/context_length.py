@@ -1,56 +1,135 @@
+import functools
+import hashlib
 import logging
-from typing import List
+from typing import Callable, List, Tuple
 
 import tiktoken
 
 from steamship import Block, SteamshipError
 from steamship.data.tags.tag_constants import RoleTag
+from steamship.utils.lru_cache import LRUCache
+
+TOKEN_COUNT_CACHE = LRUCache(maxsize=10000)
+"""Token counts of recently measured texts, keyed by encoder and a BLAKE2b digest of the text.
+
+Held at module level so that counts are reused across requests handled by the same worker."""
+
+
+@functools.lru_cache(maxsize=None)
+def get_encoding(tiktoken_encoder: str = "p50k_base") -> tiktoken.Encoding:
+    """Return the named tiktoken encoding, loading it only the first time it is requested."""
+    return tiktoken.get_encoding(tiktoken_encoder)
 
 
 def token_length(block: Block, tiktoken_encoder: str = "p50k_base") -> int:
-    """Calculate num tokens with tiktoken package."""
-    # create a GPT-3 encoder instance
-    enc = tiktoken.get_encoding(tiktoken_encoder)
-    # encode the text using the GPT-3 encoder
-    tokenized_text = enc.encode(block.text)
-    # calculate the number of tokens in the encoded text
-    return len(tokenized_text)
+    """Calculate num tokens with tiktoken package.
 
+    Counts are cached in `TOKEN_COUNT_CACHE` by a digest of the text, so a block whose text changes (e.g. while
+    streaming) is measured again, and blocks with the same text share a count.
+    """
+    text = block.text
+    if text is None:
+        # Left to the encoder, which rejects it.
+        return len(get_encoding(tiktoken_encoder).encode(text))
+    key = (tiktoken_encoder, hashlib.blake2b(text.encode("utf-8")).digest())
+    length = TOKEN_COUNT_CACHE.get(key)
+    if length is None:
+        length = len(get_encoding(tiktoken_encoder).encode(text))
+        TOKEN_COUNT_CACHE.put(key, length)
+    return length
 
-# TODO: abstract this into one of N possible strategies
-def filter_blocks_for_prompt_length(max_tokens: int, blocks: List[Block]) -> List[int]:
 
-    retained_blocks = []
-    total_length = 0
+BlockRetentionStrategy = Callable[[int, List[Block], Callable[[Block], int]], Tuple[List[int], int]]
+"""Chooses which blocks fit into a prompt.
 
-    # Keep all system blocks
-    for block in blocks:
-        if block.chat_role == RoleTag.SYSTEM:
-            retained_blocks.append(block)
-            total_length += token_length(block)
+Called with `(max_tokens, blocks, token_length)`, returns the positions within `blocks` of the blocks to retain and
+their total token length. Raises a SteamshipError if no acceptable selection exists."""
+
+
+def _retain_system_blocks(
+    max_tokens: int, blocks: List[Block], length: Callable[[Block], int]
+) -> Tuple[List[int], int]:
+    retained = [i for i, block in enumerate(blocks) if block.chat_role == RoleTag.SYSTEM]
+    total_length = sum(length(blocks[i]) for i in retained)
 
     # If system blocks are too long, throw error
     if total_length > max_tokens:
         raise SteamshipError(
             f"Plugin attempted to filter input to fit into {max_tokens} tokens, but the total size of system blocks was {total_length}"
         )
+    return retained, total_length
 
-    # Now work backwards and keep as many blocks as we can
-    num_system_blocks = len(retained_blocks)
-    for block in reversed(blocks):
-        if block.chat_role != RoleTag.SYSTEM and total_length < max_tokens:
-            block_length = token_length(block)
-            if block_length + total_length < max_tokens:
-                retained_blocks.append(block)
-                total_length += block_length
-                logging.info(f"Adding block {block.index_in_file} of token length {block_length}")
 
+def _check_non_system_retained(max_tokens: int, retained: List[int], num_system_blocks: int):
     # If we didn't add any non-system blocks, throw error
-    if len(retained_blocks) == num_system_blocks:
+    if len(retained) == num_system_blocks:
         raise SteamshipError(
             f"Plugin attempted to filter input to fit into {max_tokens} tokens, but no non-System blocks remained."
         )
 
-    block_indices = [block.index_in_file for block in blocks if block in retained_blocks]
+
+def retain_system_and_most_recent(
+    max_tokens: int, blocks: List[Block], length: Callable[[Block], int]
+) -> Tuple[List[int], int]:
+    """Keep all system blocks, then work backwards keeping every block that still fits.
+
+    A block too long to fit is skipped, and older (shorter) blocks may still be kept after it.
+    """
+    retained, total_length = _retain_system_blocks(max_tokens, blocks, length)
+    num_system_blocks = len(retained)
+
+    for i in range(len(blocks) - 1, -1, -1):
+        if total_length >= max_tokens:
+            break
+        block = blocks[i]
+        if block.chat_role != RoleTag.SYSTEM:
+            block_length = length(block)
+            if block_length + total_length < max_tokens:
+                retained.append(i)
+                total_length += block_length
+                logging.info(f"Adding block {block.index_in_file} of token length {block_length}")
+
+    _check_non_system_retained(max_tokens, retained, num_system_blocks)
+    return retained, total_length
+
+
+def retain_system_and_recent_suffix(
+    max_tokens: int, blocks: List[Block], length: Callable[[Block], int]
+) -> Tuple[List[int], int]:
+    """Keep all system blocks, then the longest run of most recent blocks that fits, without gaps.
+
+    Unlike `retain_system_and_most_recent`, no older block is kept once a newer one has been dropped, so the
+    retained conversation is contiguous.
+    """
+    retained, total_length = _retain_system_blocks(max_tokens, blocks, length)
+    num_system_blocks = len(retained)
+
+    for i in range(len(blocks) - 1, -1, -1):
+        block = blocks[i]
+        if block.chat_role == RoleTag.SYSTEM:
+            continue
+        block_length = length(block)
+        if block_length + total_length >= max_tokens:
+            break
+        retained.append(i)
+        total_length += block_length
+
+    _check_non_system_retained(max_tokens, retained, num_system_blocks)
+    return retained, total_length
+
+
+def filter_blocks_for_prompt_length(
+    max_tokens: int,
+    blocks: List[Block],
+    strategy: BlockRetentionStrategy = retain_system_and_most_recent,
+) -> List[int]:
+    """Return the `index_in_file` of each block to keep so that the prompt fits into `max_tokens`, in input order.
+
+    Which blocks are kept is decided by `strategy`; by default, all system blocks plus as many of the most recent
+    blocks as fit. Each block is tokenized at most once (and counts are cached across calls, see `token_length`).
+    """
+    retained, total_length = strategy(max_tokens, blocks, token_length)
+
+    block_indices = [blocks[i].index_in_file for i in sorted(retained)]
     logging.info(f"Filtered input.  Total tokens {total_length} Block indices: {block_indices}")
     return block_indices
@@ -0,0 +1,37 @@
+"""JSON encoding and decoding for Steamship HTTP traffic.
+
+Uses `orjson <https://github.com/ijl/orjson>`_ when it is installed (``pip install orjson``), falling back to the
+standard library otherwise. Anything orjson refuses to encode (e.g. integers wider than 64 bits) is retried with the
+standard library, so the fast path never changes which payloads can be sent.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode `obj` as compact UTF-8 JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Encode `obj` as a compact JSON string."""
+    return dumps_bytes(obj).decode("utf-8")
+
+
+def loads(s: Union[bytes, bytearray, str]) -> Any:
+    """Decode a JSON document. Raises a `json.JSONDecodeError` if `s` is not valid JSON."""
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
@@ -1,11 +1,16 @@
 """A simple key-value store implemented atop Files and Tags."""
 
-from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
-from steamship import Block, File, Steamship, Tag
+from steamship import Block, File, Steamship, SteamshipError, Tag
 
 KV_STORE_MARKER = "__init__"
 
+T = TypeVar("T")
+
 
 class KeyValueStore:
     """A simple key value store implemented in Steamship.
@@ -20,6 +25,10 @@ class KeyValueStore:
 
     Note that the value is always saved as a dict object. To save a string or int, wrap it in a dict.
 
+    A store created with `shards > 1` spreads its keys across that many Files by a stable hash of the key, so that
+    reading or writing a key only transfers the tags of its shard. The number of shards is part of the store's
+    layout: every instance of a store must use the same value.
+
     WARNING:
 
     This is essentially a clever hack atop Steamship's tag system to provide mutable key-value storage. It is in the
@@ -30,86 +39,279 @@ class KeyValueStore:
 
     client: Steamship
     store_identifier: str
+    shards: int
+    cache: bool
+    cache_ttl_s: Optional[float]
+    max_workers: int
 
-    def __init__(self, client: Steamship, store_identifier: str = "KeyValueStore"):
+    def __init__(
+        self,
+        client: Steamship,
+        store_identifier: str = "KeyValueStore",
+        cache: bool = False,
+        cache_ttl_s: Optional[float] = None,
+        shards: int = 1,
+        max_workers: int = 8,
+    ):
         """Create a new KeyValueStore instance.
 
         Args:
             client (Steamship): The Steamship client.
             store_identifier (str): The store_identifier which identifies this KeyValueStore instance. You can have multiple, separate KeyValueStore instances in a workspace using this implementation.
+            cache (bool): Keep the store's file and entries in memory, so reads are local lookups and writes are a single tag create (plus a delete when overwriting). Writes made by other KeyValueStore instances are not seen until the cache expires or `invalidate` is called.
+            cache_ttl_s (Optional[float]): How long, in seconds, cached entries are trusted before being re-fetched. Defaults to no expiry.
+            shards (int): The number of Files the entries are spread across. The default of 1 keeps every entry in a single File.
+            max_workers (int): The maximum number of concurrent requests made by the batch operations (`get_many`, `set_many`, `delete_many`, `items` and `reset`).
         """
+        if shards < 1:
+            raise SteamshipError(message=f"A KeyValueStore needs at least one shard; got {shards}.")
         self.client = client
         self.store_identifier = f"kv-store-{store_identifier}"
+        self.shards = shards
+        self.cache = cache
+        self.cache_ttl_s = cache_ttl_s
+        self.max_workers = max_workers
+        self._cached_file_ids: Dict[int, Optional[str]] = {}
+        self._cached_entries: Dict[int, Dict[str, List[Tag]]] = {}
+        self._cached_at: Dict[int, float] = {}
+
+    def invalidate(self):
+        """Drop any cached entries, so that the next operation re-fetches them from Steamship."""
+        self._cached_file_ids = {}
+        self._cached_entries = {}
+        self._cached_at = {}
+
+    def _shard_kind(self, shard: int) -> str:
+        """The tag kind of the given shard's file and entries. An unsharded store keeps its original layout."""
+        if self.shards == 1:
+            return self.store_identifier
+        return f"{self.store_identifier}-shard-{shard}-of-{self.shards}"
 
-    def _get_file(self, or_create: bool = False) -> Optional[File]:
-        status_files = File.query(self.client, f'filetag and kind "{self.store_identifier}"').files
+    def _shard_of(self, key: str) -> int:
+        if self.shards == 1:
+            return 0
+        # Python's hash() is salted per process; the shard of a key must be the same everywhere.
+        digest = hashlib.md5(key.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % self.shards
+
+    def _by_shard(self, keys: Iterable[str]) -> Dict[int, List[str]]:
+        shards: Dict[int, List[str]] = {}
+        for key in keys:
+            shards.setdefault(self._shard_of(key), []).append(key)
+        return shards
+
+    def _map(self, fn: Callable[..., T], *iterables: Iterable) -> List[T]:
+        """Apply `fn` across `iterables` using up to `max_workers` concurrent requests."""
+        args = list(zip(*iterables))
+        if len(args) <= 1 or self.max_workers <= 1:
+            return [fn(*arg) for arg in args]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(args))) as executor:
+            return list(executor.map(lambda arg: fn(*arg), args))
+
+    def _get_file(self, or_create: bool = False, shard: int = 0) -> Optional[File]:
+        kind = self._shard_kind(shard)
+        status_files = File.query(self.client, f'filetag and kind "{kind}"').files
         if len(status_files) == 0:
             if not or_create:
                 return None
             return File.create(
                 self.client,
                 blocks=[Block(text="")],
-                tags=[Tag(kind=self.store_identifier, name=KV_STORE_MARKER)],
+                tags=[Tag(kind=kind, name=KV_STORE_MARKER)],
             )
         else:
             return status_files[0]
 
+    def _cache_is_fresh(self, shard: int) -> bool:
+        return shard in self._cached_entries and (
+            self.cache_ttl_s is None or time.monotonic() - self._cached_at[shard] < self.cache_ttl_s
+        )
+
+    def _entries(
+        self, or_create: bool = False, shard: int = 0
+    ) -> Tuple[Optional[str], Dict[str, List[Tag]]]:
+        """Return the id of the shard's file and its entries, indexed by key."""
+        if (
+            self.cache
+            and self._cache_is_fresh(shard)
+            and (self._cached_file_ids[shard] or not or_create)
+        ):
+            return self._cached_file_ids[shard], self._cached_entries[shard]
+
+        file = self._get_file(or_create=or_create, shard=shard)
+        return self._index_file(file, shard)
+
+    def _index_file(
+        self, file: Optional[File], shard: int
+    ) -> Tuple[Optional[str], Dict[str, List[Tag]]]:
+        kind = self._shard_kind(shard)
+        entries: Dict[str, List[Tag]] = {}
+        for tag in file.tags if file is not None else []:
+            if tag.kind == kind:
+                entries.setdefault(tag.name, []).append(tag)
+
+        file_id = file.id if file is not None else None
+        if self.cache:
+            self._cached_file_ids[shard], self._cached_entries[shard] = file_id, entries
+            self._cached_at[shard] = time.monotonic()
+        return file_id, entries
+
+    def _retry_stale(self, fn: Callable[[], T]) -> T:
+        try:
+            return fn()
+        except SteamshipError:
+            if not self.cache:
+                raise
+            # The cached file may have been deleted by another instance (e.g. via `reset`); refresh and retry once.
+            self.invalidate()
+            return fn()
+
     def get(self, key: str) -> Optional[Dict]:
         """Get the value represented by `key`."""
-        file = self._get_file()
+        _, entries = self._entries(shard=self._shard_of(key))
+        tags = entries.get(key)
+        return tags[0].value if tags else None
+
+    def get_many(self, keys: List[str]) -> Dict[str, Optional[Dict]]:
+        """Get the values represented by `keys`, fetching each shard involved once.
 
-        if file is None:
-            return None
+        Returns a dict from each of `keys` to its value, or None if it is not set."""
+        by_shard = self._by_shard(keys)
+        fetched = self._map(lambda shard: self._entries(shard=shard)[1], by_shard.keys())
+        result: Dict[str, Optional[Dict]] = {}
+        for shard_keys, entries in zip(by_shard.values(), fetched):
+            for key in shard_keys:
+                tags = entries.get(key)
+                result[key] = tags[0].value if tags else None
+        return result
 
-        for tag in file.tags:
-            if tag.kind == self.store_identifier and tag.name == key:
-                return tag.value
+    def _forget(self, shards: Iterable[int]):
+        """Drop the cached entries of `shards`, which may no longer match their files."""
+        for shard in shards:
+            self._cached_file_ids.pop(shard, None)
+            self._cached_entries.pop(shard, None)
+            self._cached_at.pop(shard, None)
 
     def delete(self, key: str) -> bool:
         """Delete the entry represented by `key`"""
-        file = self._get_file()
-
-        if file is None:
-            return False
-
-        deleted = False
-        for tag in file.tags:
-            if tag.kind == self.store_identifier and tag.name == key:
+        shard = self._shard_of(key)
+        _, entries = self._entries(shard=shard)
+        tags = entries.get(key, [])
+        try:
+            for tag in tags:
                 tag.delete()
-                deleted = True
+        except Exception:
+            self._forget([shard])
+            raise
+        entries.pop(key, None)
+        return len(tags) > 0
+
+    def delete_many(self, keys: List[str]) -> Dict[str, bool]:
+        """Delete the entries represented by `keys`, fetching each shard involved once and deleting concurrently.
 
-        return deleted
+        Returns a dict from each of `keys` to whether it was present."""
+        by_shard = self._by_shard(keys)
+        fetched = self._map(lambda shard: self._entries(shard=shard)[1], by_shard.keys())
+        result: Dict[str, bool] = {}
+        doomed: List[Tag] = []
+        for shard_keys, entries in zip(by_shard.values(), fetched):
+            for key in shard_keys:
+                tags = entries.get(key, [])
+                result[key] = result.get(key, False) or len(tags) > 0
+                doomed.extend(tags)
+        try:
+            self._map(Tag.delete, doomed)
+        except Exception:
+            self._forget(by_shard.keys())
+            raise
+        for shard_keys, entries in zip(by_shard.values(), fetched):
+            for key in shard_keys:
+                entries.pop(key, None)
+        return result
 
     def set(self, key: str, value: Dict[str, Any]):
         """Set the entry (key, value)."""
+        return self._retry_stale(lambda: self._set(key, value))
+
+    def _set(self, key: str, value: Dict[str, Any]) -> Tag:
+        shard = self._shard_of(key)
+        file_id, entries = self._entries(or_create=True, shard=shard)
+
+        try:
+            # First delete it if it exists to avoid duplicate tags.
+            for tag in entries.get(key, []):
+                tag.delete()
+            entries.pop(key, None)
 
-        # First delete it if it exists to avoid duplicate tags.
-        self.delete(key)
+            req = Tag(file_id=file_id, kind=self._shard_kind(shard), name=key, value=value)
+            tag = self.client.post("tag/create", req, expect=Tag)
+        except Exception:
+            self._forget([shard])
+            raise
+        entries[key] = [tag]
+        return tag
 
-        # Now get/create the file
-        file = self._get_file(or_create=True)
+    def set_many(self, items: Dict[str, Dict[str, Any]]):
+        """Set many entries at once.
 
-        req = Tag(file_id=file.id, kind=self.store_identifier, name=key, value=value)
-        return self.client.post("tag/create", req, expect=Tag)
+        Each shard involved is fetched once. A shard whose file does not exist yet is created together with its
+        entries in a single request; otherwise replaced entries are deleted and new ones created concurrently."""
+        by_shard = self._by_shard(items.keys())
+        self._retry_stale(
+            lambda: self._map(
+                lambda shard, keys: self._set_shard(shard, {key: items[key] for key in keys}),
+                by_shard.keys(),
+                by_shard.values(),
+            )
+        )
+
+    def _set_shard(self, shard: int, items: Dict[str, Dict[str, Any]]):
+        kind = self._shard_kind(shard)
+        file_id, entries = self._entries(shard=shard)
+        if file_id is None:
+            file = File.create(
+                self.client,
+                blocks=[Block(text="")],
+                tags=[Tag(kind=kind, name=KV_STORE_MARKER)]
+                + [Tag(kind=kind, name=key, value=value) for key, value in items.items()],
+            )
+            self._index_file(file, shard)
+            return
+
+        reqs = [
+            Tag(file_id=file_id, kind=kind, name=key, value=value) for key, value in items.items()
+        ]
+        try:
+            self._map(Tag.delete, [tag for key in items for tag in entries.get(key, [])])
+            for key in items:
+                entries.pop(key, None)
+            tags = self._map(lambda req: self.client.post("tag/create", req, expect=Tag), reqs)
+        except Exception:
+            self._forget([shard])
+            raise
+        for tag in tags:
+            entries[tag.name] = [tag]
 
     def items(self, filter_keys: Optional[List[str]] = None) -> List[Tuple[str, Dict[str, Any]]]:
         """Return all key-value entries as a list of (key, value) tuples.
 
-        If `filter_keys` is provided, only returns keys within that list."""
-
-        file = self._get_file(or_create=True)
+        If `filter_keys` is provided, only returns keys within that list, and only the shards holding them are
+        fetched."""
+        if filter_keys is None:
+            shards: Iterable[int] = range(self.shards)
+        else:
+            shards = self._by_shard(filter_keys).keys()
+        fetched = self._map(lambda shard: self._entries(shard=shard)[1], shards)
         return [
-            (tag.name, tag.value)
-            for tag in file.tags
-            if (
-                tag.kind == self.store_identifier
-                and tag.name != KV_STORE_MARKER
-                and (filter_keys is None or tag.name in filter_keys)
-            )
+            (key, tag.value)
+            for entries in fetched
+            for key, tags in entries.items()
+            for tag in tags
+            if (key != KV_STORE_MARKER and (filter_keys is None or key in filter_keys))
         ]
 
     def reset(self):
         """Delete all key-values."""
-        file = self._get_file()
-        if file is not None:
-            file.delete()
+        self.invalidate()
+        files = self._map(lambda shard: self._get_file(shard=shard), range(self.shards))
+        self._map(File.delete, [file for file in files if file is not None])
@@ -0,0 +1,91 @@
+"""A small, thread-safe, in-process LRU cache with optional expiry."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    """A bounded mapping which evicts the least recently used entry once `maxsize` is reached.
+
+    Entries older than `ttl_s` (if set) are treated as absent. Hit, miss, eviction and expiry counts are kept so that
+    the effectiveness of the cache can be monitored; see `stats`.
+    """
+
+    maxsize: int
+    ttl_s: Optional[float]
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+    def __init__(self, maxsize: int = 1024, ttl_s: Optional[float] = None):
+        """Create a new LRUCache.
+
+        Args:
+            maxsize (int): The maximum number of entries held. A size of 0 disables the cache.
+            ttl_s (Optional[float]): How long, in seconds, an entry remains valid after it is stored. Defaults to no expiry.
+        """
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value stored for `key`, marking it as recently used, or `default` if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if self.ttl_s is None or time.monotonic() - stored_at < self.ttl_s:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any):
+        """Store `value` for `key`, evicting the least recently used entry if the cache is full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> bool:
+        """Remove `key`, returning whether it was present."""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self, predicate: Optional[Callable[[Hashable], bool]] = None):
+        """Remove every entry, or only those whose key satisfies `predicate`."""
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counters describing the cache's use so far."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
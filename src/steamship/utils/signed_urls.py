@@ -1,13 +1,23 @@
+import hashlib
+import io
 import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import requests
 
 from steamship import SteamshipError
+from steamship.base.multipart import ProgressCallback, ProgressReader
+from steamship.base.transport import TransportConfig, create_session
 from steamship.utils.url import apply_localstack_url_fix
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_PART_SIZE = 16 * 1024 * 1024
+
 
 def url_to_json(url: str) -> any:
     """
@@ -35,60 +45,276 @@ def url_to_bytes(url: str) -> bytes:
 
     resp = requests.get(url)
     if resp.status_code != 200:
-        # TODO: At least Localstack send to reply with HTTP 200 even if the file isn't found!
-        # The full response contains:
-        # <Error>
-        #     <Code>NoSuchKey</Code>
-        #
-        # So we **could** check the response text even in the event of 200 but that seems wrong..
-        if "<Code>NoSuchKey</Code>" in resp.text:
-            raise SteamshipError(
-                message=f"The file at signed URL {url} did not exist. HTTP {resp.status_code}. Content: {resp.text}"
-            )
-        else:
-            raise SteamshipError(
-                message=f"There was an error downloading from the signed url: {url}. HTTP {resp.status_code}. Content: {resp.text}"
-            )
+        _raise_download_error(url, resp)
     return resp.content
 
 
-def download_from_signed_url(url: str, to_file: Path = None) -> Path:
+def _raise_download_error(url: str, resp: requests.Response):
+    # TODO: At least Localstack send to reply with HTTP 200 even if the file isn't found!
+    # The full response contains:
+    # <Error>
+    #     <Code>NoSuchKey</Code>
+    #
+    # So we **could** check the response text even in the event of 200 but that seems wrong..
+    if "<Code>NoSuchKey</Code>" in resp.text:
+        raise SteamshipError(
+            message=f"The file at signed URL {url} did not exist. HTTP {resp.status_code}. Content: {resp.text}"
+        )
+    else:
+        raise SteamshipError(
+            message=f"There was an error downloading from the signed url: {url}. HTTP {resp.status_code}. Content: {resp.text}"
+        )
+
+
+class _DownloadProgress:
+    """Thread-safe byte counter which forwards progress to an optional callback."""
+
+    def __init__(
+        self, total: Optional[int], on_progress: Optional[ProgressCallback], done: int = 0
+    ):
+        self.total = total
+        self.done = done
+        self.on_progress = on_progress
+        self._lock = threading.Lock()
+
+    def add(self, n: int):
+        with self._lock:
+            self.done += n
+            if self.on_progress is not None:
+                self.on_progress(self.done, self.total)
+
+
+def _total_size(resp: requests.Response, offset: int = 0) -> Optional[int]:
+    """The full size of the object behind `resp`, from its `Content-Range` or `Content-Length` header."""
+    content_range = resp.headers.get("Content-Range")
+    if content_range and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        if total.isdigit():
+            return int(total)
+    content_length = resp.headers.get("Content-Length")
+    if resp.headers.get("Content-Encoding", "identity") != "identity":
+        # `requests` decodes the body, so the encoded Content-Length says nothing about the size on disk.
+        return None
+    if content_length and content_length.isdigit():
+        return offset + int(content_length)
+    return None
+
+
+def _stream_to_file(
+    resp: requests.Response, f: BinaryIO, chunk_size: int, progress: _DownloadProgress
+) -> int:
+    written = 0
+    for chunk in resp.iter_content(chunk_size=chunk_size):
+        f.write(chunk)
+        written += len(chunk)
+        progress.add(len(chunk))
+    return written
+
+
+def _download_range(
+    url: str, path: Path, start: int, end: int, chunk_size: int, progress: _DownloadProgress
+):
+    with requests.get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True) as resp:
+        if resp.status_code != 206:
+            _raise_download_error(url, resp)
+        with open(path, "r+b") as f:
+            f.seek(start)
+            written = _stream_to_file(resp, f, chunk_size, progress)
+    if written != end - start + 1:
+        raise SteamshipError(
+            message=f"Download of bytes {start}-{end} from signed url {url} ended after {written} bytes."
+        )
+
+
+def _download_ranges(
+    url: str,
+    path: Path,
+    total: int,
+    part_size: int,
+    max_workers: int,
+    chunk_size: int,
+    progress: _DownloadProgress,
+):
+    with open(path, "wb") as f:
+        f.truncate(total)
+    ranges = [(start, min(start + part_size, total) - 1) for start in range(0, total, part_size)]
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_download_range, url, path, start, end, chunk_size, progress)
+                for start, end in ranges
+            ]
+            for future in futures:
+                future.result()
+    except BaseException:
+        # A partially filled file is already full-sized, so it cannot be resumed: start over next time.
+        path.unlink(missing_ok=True)
+        raise
+
+
+def _file_checksum(path: Path, algorithm: str, chunk_size: int) -> str:
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def download_from_signed_url(  # noqa: C901
+    url: str,
+    to_file: Path = None,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    max_workers: int = 1,
+    part_size: int = DOWNLOAD_PART_SIZE,
+    resume: bool = False,
+    expected_size: Optional[int] = None,
+    expected_checksum: Optional[str] = None,
+    checksum_algorithm: str = "md5",
+    on_progress: Optional[ProgressCallback] = None,
+) -> Path:
     """
     Downloads the Signed URL to the filename `desired_filename` in a temporary directory on disk.
-    """
-    content = url_to_bytes(url)
 
+    The download is streamed to disk in chunks of `chunk_size` bytes, so it never needs to fit in memory. It is
+    written to `<to_file>.part` and only moved to `to_file` once complete and verified. Parallel downloads are written
+    to `<to_file>.ranges.part` instead, and are not resumable.
+
+    Parameters
+    ----------
+    url : str
+        The signed URL to download.
+    to_file : Path
+        Where to save the download.
+    chunk_size : int
+        Number of bytes read from the connection and written to disk at a time.
+    max_workers : int
+        If greater than 1, and the object is larger than `part_size`, it is fetched as that many parallel HTTP Range
+        requests of `part_size` bytes each.
+    part_size : int
+        Size of each Range request in a parallel download.
+    resume : bool
+        Continue a previous, interrupted download from the end of its `.part` file instead of starting over.
+    expected_size : Optional[int]
+        If provided, the download fails unless it is exactly this many bytes.
+    expected_checksum : Optional[str]
+        If provided, the download fails unless the hex digest of its contents matches.
+    checksum_algorithm : str
+        The `hashlib` algorithm used to compute the checksum. Default: md5, which is the S3 ETag of objects uploaded
+        in a single part.
+    on_progress : Optional[ProgressCallback]
+        Called with `(bytes_downloaded, total_bytes)` as the download progresses.
+    """
+    url = apply_localstack_url_fix(url)
+    to_file = Path(to_file)
     if not to_file.parent.exists():
         to_file.parent.mkdir(parents=True, exist_ok=True)
+    part_file = to_file.with_name(f"{to_file.name}.part")
+
+    offset = part_file.stat().st_size if resume and part_file.exists() else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
 
-    with open(to_file, "wb") as f:
-        logging.debug(f"Got contents of: {url}")
-        f.write(content)
-        logging.debug(f"Wrote contents of: {url} to {to_file}")
+    with requests.get(url, headers=headers, stream=True) as resp:
+        if offset and resp.status_code == 416:
+            # The range starts at the end of the object: the previous download had already finished.
+            total = _total_size(resp)
+            if total != offset:
+                _raise_download_error(url, resp)
+            logging.debug(f"Download of {url} to {part_file} was already complete")
+        elif offset and resp.status_code == 206:
+            total = _total_size(resp, offset)
+            logging.debug(f"Resuming download of {url} to {part_file} at byte {offset}")
+            with open(part_file, "ab") as f:
+                _stream_to_file(resp, f, chunk_size, _DownloadProgress(total, on_progress, offset))
+        elif resp.status_code == 200:
+            total = _total_size(resp)
+            progress = _DownloadProgress(total, on_progress)
+            if (
+                max_workers > 1
+                and total is not None
+                and total > part_size
+                and resp.headers.get("Accept-Ranges") == "bytes"
+            ):
+                resp.close()
+                logging.debug(f"Downloading {url} as {max_workers} parallel range requests")
+                # Ranges are written into a pre-sized file, which is only complete once every range is in. It has
+                # its own name so that a crash part way cannot leave it where `resume` would take it as finished.
+                ranges_file = to_file.with_name(f"{to_file.name}.ranges.part")
+                _download_ranges(
+                    url, ranges_file, total, part_size, max_workers, chunk_size, progress
+                )
+                ranges_file.replace(part_file)
+            else:
+                with open(part_file, "wb") as f:
+                    _stream_to_file(resp, f, chunk_size, progress)
+        else:
+            _raise_download_error(url, resp)
+
+    size = part_file.stat().st_size
+    if (total is not None and size != total) or (
+        expected_size is not None and size != expected_size
+    ):
+        raise SteamshipError(
+            message=f"Download from signed url {url} is incomplete: got {size} of {expected_size or total} bytes.",
+            suggestion="Retry the download with `resume=True` to continue where it left off.",
+        )
+    if expected_checksum is not None:
+        checksum = _file_checksum(part_file, checksum_algorithm, chunk_size)
+        if checksum.lower() != expected_checksum.lower():
+            part_file.unlink()
+            raise SteamshipError(
+                message=f"Download from signed url {url} is corrupt: {checksum_algorithm} checksum {checksum} does not match {expected_checksum}."
+            )
+
+    os.replace(part_file, to_file)
+    logging.debug(f"Wrote contents of: {url} to {to_file}")
     return Path(to_file)
 
 
-def upload_to_signed_url(url: str, _bytes: Optional[bytes] = None, filepath: Optional[Path] = None):
+def upload_to_signed_url(
+    url: str,
+    _bytes: Optional[bytes] = None,
+    filepath: Optional[Path] = None,
+    transport: Optional[TransportConfig] = None,
+    on_progress: Optional[ProgressCallback] = None,
+):
     """
     Uploads either the bytes or filepath contents to the provided Signed URL.
+
+    Files are streamed from disk with a known `Content-Length`, so their size is not limited by available memory.
+    Transient failures (connection errors and 429/502/503/504 responses) are retried, rewinding the upload, per
+    the retry policy of `transport`. If provided, `on_progress` is called with `(bytes_sent, total_bytes)`.
     """
 
     url = apply_localstack_url_fix(url)
     if _bytes is not None:
         logging.info(f"Uploading provided bytes to: {url}")
+        with io.BytesIO(_bytes) as body:
+            _put_to_signed_url(url, body, filepath, transport, on_progress)
     elif filepath is not None:
         logging.info(f"Uploading file at {filepath} to: {url}")
-        with open(filepath, "rb") as f:
-            _bytes = f.read()
+        with open(filepath, "rb") as body:
+            _put_to_signed_url(url, body, filepath, transport, on_progress)
     else:
         raise SteamshipError(
             message="Unable to upload data to signed URL -- neither a filepath nor bytes were provided.",
             suggestion="Please provide either the `bytes` or the `filepath` argument",
         )
 
-    http_response = requests.put(
-        url, data=_bytes, headers={"Content-Type": "application/octet-stream"}
-    )
+
+def _put_to_signed_url(
+    url: str,
+    body: BinaryIO,
+    filepath: Optional[Path],
+    transport: Optional[TransportConfig],
+    on_progress: Optional[ProgressCallback],
+):
+    if on_progress is not None:
+        body = ProgressReader(body, on_progress)
+
+    with create_session(transport or TransportConfig()) as session:
+        http_response = session.put(
+            url, data=body, headers={"Content-Type": "application/octet-stream"}
+        )
 
     # S3 returns 204 upon success; we include 200 here for safety.
     if http_response.status_code not in [200, 204]:
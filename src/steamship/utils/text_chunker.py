@@ -1,4 +1,21 @@
 import logging
+import re
+from collections import deque
+from typing import Deque, Iterable, Iterator, Tuple, Union
+
+from steamship.utils.context_length import get_encoding
+
+TextSource = Union[str, Iterable[str]]
+"""Text to chunk: a string, an iterable of string pieces (e.g. a generator), or a text file opened for reading."""
+
+SEGMENT_BOUNDARIES = {
+    "paragraph": re.compile(r"(?=\n[ \t]*\n)(?<!\n)"),
+    "sentence": re.compile(r"(?<=[.!?])(?=\s)|(?=\n[ \t]*\n)(?<!\n)"),
+    "word": re.compile(r"(?<=\S)(?=\s)"),
+}
+"""Where `split_segments` may split text. Splits fall before whitespace, which begins the following segment."""
+
+READ_SIZE = 64 * 1024
 
 
 def chunk_text(text: str, chunk_size: int = 200, chunk_overlap: int = 50):
@@ -19,3 +36,117 @@ def chunk_text(text: str, chunk_size: int = 200, chunk_overlap: int = 50):
 
     for i in range(0, len(text), step_size):
         yield text[i : i + chunk_size]
+
+
+def _pieces(text: TextSource) -> Iterator[str]:
+    if isinstance(text, str):
+        return (text[i : i + READ_SIZE] for i in range(0, len(text), READ_SIZE))
+    if hasattr(text, "read"):
+        return iter(lambda: text.read(READ_SIZE), "")
+    return iter(text)
+
+
+def split_segments(
+    text: TextSource, boundary: str = "sentence", max_segment_chars: int = 8192
+) -> Iterator[str]:
+    """Split text into consecutive segments ending at `boundary` ("paragraph", "sentence" or "word").
+
+    Joining the segments reproduces the text. The text is read incrementally, holding at most one segment in memory;
+    a segment longer than `max_segment_chars` (e.g. a run of text without punctuation) is cut at that length.
+    """
+    if boundary not in SEGMENT_BOUNDARIES:
+        raise ValueError(f"boundary must be one of {list(SEGMENT_BOUNDARIES)}, not {boundary}")
+    pattern = SEGMENT_BOUNDARIES[boundary]
+
+    buffer = ""
+    for piece in _pieces(text):
+        buffer += piece
+        segments = pattern.split(buffer)
+        # The last segment may continue in the next piece.
+        buffer = segments.pop()
+        yield from (segment for segment in segments if segment)
+        while len(buffer) > max_segment_chars:
+            yield buffer[:max_segment_chars]
+            buffer = buffer[max_segment_chars:]
+    if buffer:
+        yield buffer
+
+
+def _token_parts(encoding, segment: str, max_tokens: int) -> Iterator[Tuple[str, int]]:
+    """Yield `segment` with its token count, split into pieces of `max_tokens` tokens if it is longer."""
+    tokens = encoding.encode(segment)
+    if len(tokens) <= max_tokens:
+        yield segment, len(tokens)
+        return
+    for i in range(0, len(tokens), max_tokens):
+        part = tokens[i : i + max_tokens]
+        yield encoding.decode(part), len(part)
+
+
+def _checked_token_window(max_tokens: int, overlap_tokens: int) -> Tuple[int, int]:
+    if max_tokens < 1:
+        logging.warning(f"max_tokens was {max_tokens}. Setting to 200")
+        max_tokens = 200
+
+    if overlap_tokens < 0:
+        logging.warning(f"overlap_tokens was {overlap_tokens}. Setting to 0")
+        overlap_tokens = 0
+
+    if overlap_tokens >= max_tokens:
+        logging.warning(f"overlap_tokens was {overlap_tokens}. Setting to {max_tokens - 1}")
+        overlap_tokens = max_tokens - 1
+
+    return max_tokens, overlap_tokens
+
+
+def _join(window: Deque[Tuple[str, int]]) -> str:
+    return "".join(segment for segment, _ in window).strip()
+
+
+def chunk_text_by_tokens(
+    text: TextSource,
+    max_tokens: int = 200,
+    overlap_tokens: int = 0,
+    boundary: str = "sentence",
+    tiktoken_encoder: str = "p50k_base",
+) -> Iterator[str]:
+    """Chunk text for embedding into chunks of at most `max_tokens` tokens, snapped to `boundary`.
+
+    Chunks are built from whole segments (see `split_segments`), so they only split sentences (or paragraphs, or
+    words) that are longer than `max_tokens` on their own. Each chunk starts with the trailing segments of the
+    previous one that fit into `overlap_tokens`. Token counts are summed per segment, so they may differ by a token or
+    so per segment from those of the chunk as a whole.
+
+    The text may be a string, an iterable of strings or a text file, and is read incrementally: memory use is bounded
+    by the chunk size rather than the size of the text.
+    """
+    max_tokens, overlap_tokens = _checked_token_window(max_tokens, overlap_tokens)
+    encoding = get_encoding(tiktoken_encoder)
+    window: Deque[Tuple[str, int]] = deque()
+    window_tokens = 0
+    has_new_text = False
+
+    for segment in split_segments(text, boundary=boundary):
+        for part, part_tokens in _token_parts(encoding, segment, max_tokens):
+            if has_new_text and window_tokens + part_tokens > max_tokens:
+                chunk = _join(window)
+                if chunk:
+                    yield chunk
+                has_new_text = False
+
+                overlap: Deque[Tuple[str, int]] = deque()
+                overlap_size = 0
+                while window and overlap_size + window[-1][1] <= overlap_tokens:
+                    overlap.appendleft(window.pop())
+                    overlap_size += overlap[0][1]
+                window, window_tokens = overlap, overlap_size
+
+            while window and window_tokens + part_tokens > max_tokens:
+                window_tokens -= window.popleft()[1]
+            window.append((part, part_tokens))
+            window_tokens += part_tokens
+            has_new_text = True
+
+    chunk = _join(window) if has_new_text else ""
+    if chunk:
+        yield chunk
@@ -1,8 +1,10 @@
 import pytest
+from steamship_tests.utils.fake_client import FakeSteamship
 
 from steamship import Block, File, MimeTypes, Steamship
-from steamship.agents.schema import Action
+from steamship.agents.schema import Action, FinishAction
 from steamship.agents.schema.cache import ActionCache, LLMCache
+from steamship.utils.lru_cache import LRUCache
 
 
 @pytest.mark.usefixtures("client")
@@ -73,3 +75,120 @@ def test_action_cache(client: Steamship):
     cache.update(key=key, value=text_and_image)
     cache.clear()
     assert not cache.lookup(key)
+
+
+def test_action_cache_local_tier():
+    client = FakeSteamship.create()
+    engine = client.engine
+    local = LRUCache()
+    cache = ActionCache.get_or_create(client=client, context_keys={"id": "test"})
+    cache.local_cache = local
+
+    key = Action(tool="fake_tool", input=[Block(text="input")])
+    assert cache.lookup(key) is None
+    cache.update(key=key, value=[Block(text="output")])
+
+    # Repeated lookups, even from a new instance in the same process, skip the network
+    engine.calls.clear()
+    for _ in range(3):
+        other = ActionCache.get_or_create(client=client, context_keys={"id": "test"})
+        other.local_cache = local
+        blocks = other.lookup(key)
+        assert [block.text for block in blocks] == ["output"]
+        blocks[0].text = "mutated"
+    assert engine.calls == []
+    assert local.hits == 3
+
+    # A miss in the local tier is served by, and then cached from, the persistent store
+    local.clear()
+    assert cache.lookup(key)[0].text == "output"
+    assert engine.count("file/query") == 1
+    assert cache.lookup(key)[0].text == "output"
+    assert engine.count("file/query") == 1
+
+    cache.delete(key)
+    assert cache.lookup(key) is None
+    cache.update(key=key, value=[Block(text="output")])
+    cache.clear()
+    assert cache.lookup(key) is None
+
+
+def test_llm_cache_local_tier():
+    client = FakeSteamship.create()
+    engine = client.engine
+    cache = LLMCache.get_or_create(client=client, context_keys={"id": "test"})
+    cache.local_cache = LRUCache()
+
+    key = [Block(text="prompt")]
+    cache.update(key=key, value=FinishAction(output=[Block(text="done")]))
+    engine.calls.clear()
+
+    action = cache.lookup(key)
+    assert isinstance(action, FinishAction)
+    assert action.output[0].text == "done"
+    assert action.output[0].mime_type == MimeTypes.TXT
+    action.output.append(Block(text="extra"))
+    assert len(cache.lookup(key).output) == 1
+    assert engine.calls == []
+
+    # Workspaces do not share entries
+    other_client = FakeSteamship.create(engine)
+    other_client.config.workspace_id = "other-workspace"
+    other = LLMCache.get_or_create(client=other_client, context_keys={"id": "test"})
+    other.local_cache = cache.local_cache
+    assert other.lookup(key).output[0].text == "done"
+    assert engine.count("file/query") == 1
+
+
+def test_local_tiers_bind_blocks_to_the_reading_client():
+    client = FakeSteamship.create()
+    local = LRUCache()
+    action_cache = ActionCache.get_or_create(client=client, context_keys={"id": "test"})
+    action_cache.local_cache = local
+    llm_cache = LLMCache.get_or_create(client=client, context_keys={"id": "test"})
+    llm_cache.local_cache = local
+    action = Action(tool="fake_tool", input=[Block(text="input")])
+    action_cache.update(key=action, value=[Block(text="output")])
+    llm_cache.update(key=[Block(text="prompt")], value=FinishAction(output=[Block(text="done")]))
+
+    # A later request in the same worker, with its own client, is served from the shared local tier
+    request_client = FakeSteamship.create(client.engine)
+    client.engine.calls.clear()
+    action_cache = ActionCache.get_or_create(client=request_client, context_keys={"id": "test"})
+    action_cache.local_cache = local
+    llm_cache = LLMCache.get_or_create(client=request_client, context_keys={"id": "test"})
+    llm_cache.local_cache = local
+
+    assert all(block.client is request_client for block in action_cache.lookup(action))
+    cached = llm_cache.lookup([Block(text="prompt")])
+    assert all(block.client is request_client for block in cached.output)
+    assert client.engine.calls == []
+
+
+@pytest.mark.parametrize("inline_blocks", [False, True])
+def test_action_cache_rehydrates_blocks_in_batch(inline_blocks: bool):
+    client = FakeSteamship.create()
+    engine = client.engine
+    file = File.create(
+        client, blocks=[Block(text=f"block {i}", mime_type=MimeTypes.TXT) for i in range(5)]
+    )
+    cache = ActionCache.get_or_create(
+        client=client, context_keys={"id": "test"}, inline_blocks=inline_blocks
+    )
+    cache.local_cache = LRUCache()
+
+    key = Action(tool="fake_tool", input=[Block(text="input")])
+    value = [*file.blocks, file.blocks[0], Block(text="ephemeral")]
+    cache.update(key=key, value=value)
+    cache.local_cache.clear()
+
+    blocks = cache.lookup(key)
+    assert [block.text for block in blocks] == [
+        *(f"block {i}" for i in range(5)),
+        "block 0",
+        "ephemeral",
+    ]
+    assert [block.id for block in blocks[:6]] == [block.id for block in value[:6]]
+    assert all(block.client is not None for block in blocks[:6])
+    # Each distinct block is fetched once, or not at all when stored inline
+    assert engine.count("block/get") == (0 if inline_blocks else 5)
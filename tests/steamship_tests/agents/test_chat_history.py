@@ -1,8 +1,21 @@
+import logging
+import threading
+from typing import List, Optional
+
 import pytest
+from steamship_tests.utils.fake_client import FakeSteamship
 
-from steamship import Steamship
-from steamship.agents.schema.chathistory import ChatHistory
-from steamship.data.tags.tag_constants import ChatTag, TagKind
+from steamship import Block, File, MimeTypes, Steamship, Tag, Task
+from steamship.agents.logging import AgentLogging
+from steamship.agents.schema.chathistory import (
+    ChatHistory,
+    ChatHistoryLoggingHandler,
+    _MessageIndex,
+)
+from steamship.agents.schema.message_selectors import MessageSelector
+from steamship.agents.schema.text_splitters import FixedSizeTextSplitter
+from steamship.data.plugin.index_plugin_instance import SearchResult, SearchResults
+from steamship.data.tags.tag_constants import ChatTag, RoleTag, TagKind
 from steamship.data.tags.tag_utils import get_tag
 
 
@@ -46,3 +59,389 @@ def test_chat_history_index_init(client: Steamship):
 
     coding_search = chat_history.search("coding").wait()
     assert coding_search.items[0].tag.text == "And I like programming agents"
+
+
+def test_chat_history_refresh_keeps_unchanged_messages():
+    client = FakeSteamship.create()
+    engine = client.engine
+    history = ChatHistory.get_or_create(client, {"id": "refresh"}, searchable=False)
+
+    # Appending to an empty history needs no refresh
+    first = history.append_user_message("hello")
+    second = history.append_assistant_message("hi there")
+    assert engine.count("file/get") == 0
+    assert [message.text for message in history.messages] == ["hello", "hi there"]
+
+    # A message appended by another writer is picked up; the messages already held are kept as they are
+    other = ChatHistory(File.get(client, history.file.id), embedding_index=None)
+    other.append_user_message("from elsewhere")
+    assert history._refresh_messages() == [history.messages[2]]
+    assert history.messages[0] is first
+    assert history.messages[1] is second
+    assert history.messages[2].text == "from elsewhere"
+    assert history.messages[2].client is not None
+    assert history._refresh_messages() == []
+
+    # As is a tag added to an existing message
+    Tag.create(client, file_id=history.file.id, block_id=first.id, kind="feedback", name="good")
+    changed = history._refresh_messages()
+    assert [message.id for message in changed] == [first.id]
+    assert history.messages[0] is not first
+    assert [tag.kind for tag in history.messages[0].tags][-1] == "feedback"
+
+
+def test_file_refresh_adopts_fetched_fields():
+    client = FakeSteamship.create()
+    file = File.create(client, blocks=[Block(text="a")], tags=[Tag(kind="file-tag")])
+    Block.create(client, file_id=file.id, text="b")
+
+    file.refresh()
+    assert [block.text for block in file.blocks] == ["a", "b"]
+    assert [tag.kind for tag in file.tags] == ["file-tag"]
+    assert all(block.client is file.client for block in file.blocks)
+
+
+def test_chat_history_role_index(monkeypatch):
+    client = FakeSteamship.create()
+    history = ChatHistory.get_or_create(client, {"id": "roles"}, searchable=False)
+    assert history.last_user_message is None
+    assert history.messages_since_last(RoleTag.USER) == []
+
+    system = history.append_system_message("be helpful")
+    user_1 = history.append_user_message("first")
+    assistant = history.append_assistant_message("answer")
+    user_2 = history.append_user_message("second")
+    history.append_agent_message("thinking")
+    # Agents also append to the file directly
+    selection = history.file.append_block(
+        text="call", tags=[Tag(kind=TagKind.FUNCTION_SELECTION, name="tool")]
+    )
+
+    assert history.last_system_message is system
+    assert history.last_agent_message is assistant
+    assert history.last_user_message is user_2
+    assert history.messages_with_role(RoleTag.USER) == [user_1, user_2]
+    assert history.messages_with_tag(TagKind.FUNCTION_SELECTION) == [selection]
+    assert history.messages_with_tag(TagKind.FUNCTION_SELECTION, "other") == []
+    assert [m.text for m in history.messages_since_last(RoleTag.USER)] == ["thinking", "call"]
+
+    # New messages are indexed incrementally, and a refresh only re-reads the tags of changed messages
+    indexed = []
+    keys_for = _MessageIndex._keys_for
+    monkeypatch.setattr(
+        _MessageIndex,
+        "_keys_for",
+        staticmethod(lambda block: indexed.append(block) or keys_for(block)),
+    )
+    user_3 = history.append_user_message("third")
+    assert history.last_user_message is user_3
+    assert indexed == [user_3]
+
+    Tag.create(client, file_id=history.file.id, block_id=system.id, kind="feedback", name="good")
+    history.refresh()
+    assert history.last_user_message is user_3
+    assert [block.id for block in indexed[1:]] == [system.id]
+    assert [m.id for m in history.messages_with_tag("feedback")] == [system.id]
+
+
+def test_chat_history_refresh_updates_role_index():
+    client = FakeSteamship.create()
+    history = ChatHistory.get_or_create(client, {"id": "refresh-index"}, searchable=False)
+    first = history.append_user_message("first")
+    history.append_assistant_message("answer")
+    assert history.messages_with_tag("feedback") == []
+
+    # A tag added to a message that is held (and indexed) locally, as well as in Steamship
+    tag = Tag.create(client, file_id=history.file.id, block_id=first.id, kind="feedback")
+    first.tags.append(tag)
+    history.refresh()
+    assert history.messages[0] is first
+    assert history.messages_with_tag("feedback") == [first]
+
+    # A message replaced by another writer is re-read along with the changes refresh reports
+    Tag.create(client, file_id=history.file.id, block_id=first.id, kind="rating", name="good")
+    history.refresh()
+    assert [m.id for m in history.messages_with_tag("rating", "good")] == [first.id]
+    assert [m.id for m in history.messages_with_tag("feedback")] == [first.id]
+
+
+class ExplicitMessages(MessageSelector):
+    ids: List[str]
+
+    def get_messages(self, messages: List[Block]) -> List[Block]:
+        return [message for message in messages if message.id in self.ids]
+
+
+class FakeEmbeddingIndex:
+    """Records inserted tags and "searches" them by returning the most recently inserted first."""
+
+    def __init__(self):
+        self.tags: List[Tag] = []
+        self.calls: List[str] = []
+
+    def insert(self, tags):
+        self.calls.append("insert")
+        self.tags.extend(tags if isinstance(tags, list) else [tags])
+
+    def reset(self):
+        self.calls.append("reset")
+        self.tags = []
+
+    def search(self, query: str, k: Optional[int] = None) -> Task[SearchResults]:
+        self.calls.append(f"search:{k}")
+        items = [SearchResult(tag=tag, score=1.0) for tag in self.tags[::-1][:k]]
+        return Task(output=SearchResults(items=items), state="succeeded")
+
+
+def test_chat_history_delete_messages_leaves_index():
+    client = FakeSteamship.create()
+    history = ChatHistory.get_or_create(client, {"id": "delete"}, searchable=False)
+    index = FakeEmbeddingIndex()
+    history.embedding_index = index
+    history.text_splitter = FixedSizeTextSplitter(chunk_size=1000)
+    messages = [history.append_user_message(f"message {i}") for i in range(6)]
+    index.calls.clear()
+    engine_calls = len(client.engine.calls)
+
+    # Deleting touches only the deleted messages: no index reset, no re-inserts, no re-fetch of the file
+    history.delete_messages(ExplicitMessages(ids=[messages[5].id, messages[4].id]))
+    assert index.calls == []
+    assert client.engine.calls[engine_calls:] == ["block/delete", "block/delete"]
+    assert [m.id for m in history.messages] == [m.id for m in messages[:4]]
+
+    # Search skips the deleted messages' items, searching deeper when they crowd out the results
+    engine_calls = len(client.engine.calls)
+    results = history.search("message", k=2).wait()
+    assert [item.tag.block_id for item in results.items] == [messages[3].id, messages[2].id]
+    assert index.calls == ["search:2", "search:4"]
+    # Their items are unknown to the history, which refreshes once to tell them from messages added elsewhere
+    assert client.engine.calls[engine_calls:] == ["file/get"]
+
+    # As does a history opened later (e.g. by the next request) on the same file
+    fresh = ChatHistory(File.get(client, history.file.id), embedding_index=index)
+    results = fresh.search("message", k=2).wait()
+    assert [item.tag.block_id for item in results.items] == [messages[3].id, messages[2].id]
+
+    # Messages added by another writer since the history was fetched are still found
+    other = ChatHistory(File.get(client, history.file.id), embedding_index=index)
+    other.text_splitter = history.text_splitter
+    elsewhere = other.append_user_message("message from elsewhere")
+    results = history.search("message", k=2).wait()
+    assert [item.tag.block_id for item in results.items] == [elsewhere.id, messages[3].id]
+
+    # Reindexing drops them with a single insert
+    index.calls.clear()
+    history.reindex()
+    assert index.calls == ["reset", "insert"]
+    assert {tag.block_id for tag in index.tags} == {m.id for m in messages[:4]} | {elsewhere.id}
+    history.search("message", k=2)
+    assert index.calls[-1] == "search:2"
+
+
+def test_chat_history_creates_chunk_tags_with_message():
+    client = FakeSteamship.create()
+    engine = client.engine
+    history = ChatHistory.get_or_create(client, {"id": "chunks"}, searchable=False)
+    index = FakeEmbeddingIndex()
+    history.embedding_index = index
+    history.text_splitter = FixedSizeTextSplitter(chunk_size=10)
+    engine.calls.clear()
+
+    text = "a long message that spans several chunks"
+    message = history.append_user_message(text)
+
+    # One request creates the block and all of its chunk tags, and one embeds them
+    assert engine.calls == ["block/create"]
+    assert index.calls == ["insert"]
+    chunks = [tag for tag in message.tags if tag.name == ChatTag.CHUNK]
+    assert len(chunks) == 5
+    assert all(tag.id is not None and tag.block_id == message.id for tag in chunks)
+    assert "".join(tag.text for tag in chunks) == text
+    assert [tag.text for tag in index.tags] == [tag.text for tag in chunks if tag.text]
+
+    # Status messages are neither chunked nor embedded
+    history.append_agent_message("thinking")
+    assert engine.calls == ["block/create", "block/create"]
+    assert index.calls == ["insert"]
+
+
+class BlockingEmbeddingIndex(FakeEmbeddingIndex):
+    """Holds every insert until `release` is set, recording the size of each batch."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.batches: List[int] = []
+
+    def insert(self, tags):
+        assert self.release.wait(timeout=5)
+        self.batches.append(len(tags))
+        super().insert(tags)
+
+
+def test_chat_history_deferred_indexing():
+    client = FakeSteamship.create()
+    history = ChatHistory.get_or_create(client, {"id": "deferred"}, searchable=False)
+    index = BlockingEmbeddingIndex()
+    history.embedding_index = index
+    history.deferred_indexing = True
+    history.text_splitter = FixedSizeTextSplitter(chunk_size=1000)
+
+    # Appends return while the index is still blocked
+    for i in range(4):
+        history.append_user_message(f"message {i}")
+    assert index.tags == []
+
+    # Searching flushes the queue first; chunks queued behind the first insert are batched together
+    index.release.set()
+    results = history.search("message", k=4).wait()
+    assert sum(index.batches) == 4 and len(index.batches) <= 2
+    assert [item.tag.text for item in results.items] == [f"message {i}" for i in range(3, -1, -1)]
+
+    history.append_user_message("message 4")
+    history.flush_index()
+    assert [tag.text for tag in index.tags][-1] == "message 4"
+
+
+class FailingEmbeddingIndex(FakeEmbeddingIndex):
+    """Fails the first `failures` inserts, recording the thread each insert runs on."""
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+        self.threads: List[str] = []
+
+    def insert(self, tags):
+        self.threads.append(threading.current_thread().name)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("insert failed")
+        super().insert(tags)
+
+
+def test_chat_history_flush_index_retries_on_worker():
+    client = FakeSteamship.create()
+    history = ChatHistory.get_or_create(client, {"id": "flush"}, searchable=False)
+    index = FailingEmbeddingIndex(failures=1)
+    history.embedding_index = index
+    history.deferred_indexing = True
+
+    # A failed insert is retried once, on the indexing thread rather than the caller's
+    history.append_user_message("message 0")
+    history.flush_index()
+    assert [tag.text for tag in index.tags] == ["message 0"]
+    assert len(index.threads) == 2
+    assert all(name.startswith("chat-history-index") for name in index.threads)
+
+    # A second failure is raised, keeping the chunks queued for the next flush
+    index.failures = 2
+    history.append_user_message("message 1")
+    with pytest.raises(RuntimeError):
+        history.flush_index()
+    assert [tag.text for tag in history._index_queue] == ["message 1"]
+
+    # Closing flushes the queue and stops the indexing thread
+    executor = history._index_executor
+    history.close()
+    assert [tag.text for tag in index.tags] == ["message 0", "message 1"]
+    assert history._index_executor is None
+    assert not any(thread.is_alive() for thread in executor._threads)
+
+
+def test_text_splitter_chunk_text_to_tags():
+    client = FakeSteamship.create()
+    file = File.create(client, blocks=[Block(text="0123456789abc", mime_type=MimeTypes.TXT)])
+    block = file.blocks[0]
+
+    tags = FixedSizeTextSplitter(chunk_size=5).chunk_text_to_tags(block, kind="chunk")
+    assert [(tag.start_idx, tag.end_idx, tag.text) for tag in tags] == [
+        (0, 5, "01234"),
+        (5, 10, "56789"),
+        (10, 13, "abc"),
+    ]
+    assert client.engine.count("tag/create") == 3
+
+
+def test_buffered_logging_handler():
+    client = FakeSteamship.create()
+    history = ChatHistory.get_or_create(client, {"id": "buffered"}, searchable=False)
+    handler = ChatHistoryLoggingHandler(chat_history=history, buffered=True)
+    logger = logging.getLogger("test_buffered_logging_handler")
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+
+    release = threading.Event()
+    block_create = client.engine.block_create
+
+    def slow_block_create(data):
+        assert release.wait(timeout=5)
+        return block_create(data)
+
+    client.engine.block_create = slow_block_create
+    try:
+        # Logging returns while the appends are still blocked
+        for i in range(5):
+            logger.info(
+                f"status {i}",
+                extra={
+                    AgentLogging.MESSAGE_AUTHOR: AgentLogging.AGENT,
+                    AgentLogging.MESSAGE_TYPE: AgentLogging.MESSAGE,
+                },
+            )
+        assert history.messages == []
+
+        release.set()
+        handler.flush()
+        assert [message.text for message in history.messages] == [f"status {i}" for i in range(5)]
+    finally:
+        release.set()
+        logger.removeHandler(handler)
+        handler.close()
+    assert handler._worker is None
+
+
+def test_buffered_status_messages_precede_later_appends():
+    client = FakeSteamship.create()
+    history = ChatHistory.get_or_create(client, {"id": "ordering"}, searchable=False)
+    handler = ChatHistoryLoggingHandler(chat_history=history, buffered=True)
+    logger = logging.getLogger("test_buffered_status_messages_precede_later_appends")
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+
+    release = threading.Event()
+    block_create = client.engine.block_create
+
+    def slow_block_create(data):
+        if threading.current_thread() is handler._worker:
+            assert release.wait(timeout=5)
+        return block_create(data)
+
+    client.engine.block_create = slow_block_create
+    try:
+        for i in range(3):
+            logger.info(
+                f"status {i}",
+                extra={
+                    AgentLogging.MESSAGE_AUTHOR: AgentLogging.AGENT,
+                    AgentLogging.MESSAGE_TYPE: AgentLogging.MESSAGE,
+                },
+            )
+        # Appends on this thread wait for the queued status messages
+        threading.Timer(0.05, release.set).start()
+        history.append_assistant_message("answer")
+        history.append_block(text="function output")
+        history.append_request_complete_message()
+        assert [message.text for message in history.messages] == [
+            "status 0",
+            "status 1",
+            "status 2",
+            "answer",
+            "function output",
+            "",
+        ]
+        assert [message.index_in_file for message in history.messages] == list(range(6))
+    finally:
+        release.set()
+        logger.removeHandler(handler)
+        handler.close()
+    assert history._status_handlers == []
@@ -0,0 +1,103 @@
+from typing import List
+
+from steamship import Block, MimeTypes
+from steamship.agents.schema import Action, FinishAction
+from steamship.agents.schema.semantic_cache import SemanticLLMCache
+
+VOCABULARY = ["weather", "paris", "london", "today", "what", "is", "the", "tell", "me", "a", "joke"]
+
+
+def bag_of_words(text: str) -> List[float]:
+    words = text.lower().replace("?", "").split()
+    return [float(words.count(word)) for word in VOCABULARY]
+
+
+class CountingEmbedder:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text: str) -> List[float]:
+        self.calls += 1
+        return bag_of_words(text)
+
+
+def test_semantic_cache_matches_similar_prompts():
+    embed = CountingEmbedder()
+    cache = SemanticLLMCache(embed=embed, threshold=0.8)
+    key = [Block(text="What is the weather in Paris today?")]
+
+    assert cache.lookup(key) is None
+    cache.update(key=key, value=Action(tool="weather", input=[Block(text="Paris")]))
+    # The embedding computed by the missed lookup is reused by the update
+    assert embed.calls == 1
+
+    action = cache.lookup([Block(text="the weather in Paris today?")])
+    assert action.tool == "weather"
+    assert action.input[0].text == "Paris"
+    assert cache.lookup([Block(text="Tell me a joke")]) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # Returned actions are copies
+    action.input.append(Block(text="extra"))
+    assert len(cache.lookup(key).input) == 1
+
+
+def test_semantic_cache_ignores_non_text_inputs():
+    embed = CountingEmbedder()
+    cache = SemanticLLMCache(embed=embed)
+    key = [Block(text="caption this"), Block(id="image", mime_type=MimeTypes.PNG)]
+
+    cache.update(key=key, value=FinishAction(output=[Block(text="done")]))
+    assert cache.lookup(key) is None
+    assert len(cache) == 0
+    assert embed.calls == 0
+
+
+def test_semantic_cache_evicts_least_recently_matched():
+    cache = SemanticLLMCache(embed=bag_of_words, threshold=0.99, maxsize=2)
+    paris, london, joke = (
+        [Block(text="weather paris")],
+        [Block(text="weather london")],
+        [Block(text="tell me a joke")],
+    )
+    cache.update(key=paris, value=Action(tool="paris", input=[]))
+    cache.update(key=london, value=Action(tool="london", input=[]))
+    assert cache.lookup(paris).tool == "paris"
+
+    cache.update(key=joke, value=Action(tool="joke", input=[]))
+    assert len(cache) == 2
+    assert cache.lookup(london) is None
+    assert cache.lookup(paris).tool == "paris"
+    assert cache.lookup(joke).tool == "joke"
+
+    cache.clear()
+    assert cache.lookup(paris) is None
+
+
+def test_semantic_cache_only_matches_within_scope():
+    cache = SemanticLLMCache(embed=bag_of_words, threshold=0.99)
+    key = [Block(text="weather paris")]
+    cache.update(key=key, value=Action(tool="paris", input=[]), scope="chat-1")
+
+    assert cache.lookup(key, scope="chat-1").tool == "paris"
+    assert cache.lookup(key, scope="chat-2") is None
+    assert cache.lookup(key) is None
+
+    cache.update(key=key, value=Action(tool="other", input=[]), scope="chat-2")
+    assert len(cache) == 2
+    assert cache.lookup(key, scope="chat-1").tool == "paris"
+    assert cache.lookup(key, scope="chat-2").tool == "other"
+
+
+def test_semantic_cache_miss_does_not_refresh_nearest_entry():
+    cache = SemanticLLMCache(embed=bag_of_words, threshold=0.99, maxsize=2)
+    paris, london = [Block(text="weather paris")], [Block(text="weather london")]
+    cache.update(key=paris, value=Action(tool="paris", input=[]))
+    cache.update(key=london, value=Action(tool="london", input=[]))
+
+    # Closest to paris, but not close enough to match it
+    assert cache.lookup([Block(text="what is the weather in paris")]) is None
+
+    cache.update(key=[Block(text="tell me a joke")], value=Action(tool="joke", input=[]))
+    assert cache.lookup(paris) is None
+    assert cache.lookup(london).tool == "london"
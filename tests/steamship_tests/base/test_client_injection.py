@@ -0,0 +1,46 @@
+from steamship import Block, File
+from steamship.base.client import Client, _injection_plan
+from steamship.data.file import ListFileResponse
+
+
+def _file_data(file_id: str) -> dict:
+    return {
+        "id": file_id,
+        "tags": [{"id": "file-tag", "kind": "k"}],
+        "blocks": [
+            {"id": f"{file_id}-block", "text": "hi", "tags": [{"id": "block-tag", "kind": "k"}]}
+        ],
+    }
+
+
+def test_client_added_to_nested_models():
+    client = Client.construct()
+    data = client._add_client_to_response(
+        ListFileResponse, {"files": [_file_data("a"), _file_data("b")]}
+    )
+
+    assert data["client"] is client
+    for file in data["files"]:
+        assert file["client"] is client
+        assert file["tags"][0]["client"] is client
+        assert file["blocks"][0]["client"] is client
+
+    # Pydantic copies models during validation, so the parsed models hold copies of the client
+    response = ListFileResponse.parse_obj(data)
+    assert isinstance(response.files[1].blocks[0].client, Client)
+    assert isinstance(response.files[1].tags[0].client, Client)
+
+
+def test_client_added_through_wrapper_key():
+    client = Client.construct()
+    data = client._add_client_to_response(File, {"file": _file_data("a")})
+
+    assert "client" not in data
+    assert data["file"]["client"] is client
+    assert data["file"]["blocks"][0]["client"] is client
+
+
+def test_injection_plan_is_cached():
+    assert _injection_plan(Block) is _injection_plan(Block)
+    assert _injection_plan(str).is_noop
+    assert _injection_plan(None).is_noop
@@ -7,6 +7,7 @@ from pydantic import ValidationError
 
 from steamship import Configuration, SteamshipError
 from steamship.base.configuration import DEFAULT_API_BASE, DEFAULT_APP_BASE, DEFAULT_WEB_BASE
+from steamship.base.transport import JitteredRetry, TransportConfig, create_session
 
 TEST_WEB_BASE = "https://app.test.com/"
 TEST_APP_BASE = "https://test.run/"
@@ -60,3 +61,39 @@ def test_empty_api_key() -> None:
         with pytest.raises(SteamshipError):
             # Note: We're referencing a non existing profile to make sure the api key is not loaded from the default profile in steamship.json
             Configuration(api_key=None, profile="non-existing-profile")
+
+
+def test_transport_config_from_dict() -> None:
+    configuration = Configuration(
+        api_key="test-key",
+        transport={"poolMaxsize": 64, "maxRetries": 5, "keepAlive": False},
+    )
+    assert isinstance(configuration.transport, TransportConfig)
+    assert configuration.transport.pool_maxsize == 64
+    assert configuration.transport.max_retries == 5
+    assert configuration.transport.keep_alive is False
+
+    # Unspecified fields keep their defaults
+    assert configuration.transport.retry_status_codes == [429, 502, 503, 504]
+
+
+def test_transport_session_policy() -> None:
+    transport = TransportConfig(pool_maxsize=32, max_retries=4, keep_alive=False)
+    session = create_session(transport)
+
+    adapter = session.get_adapter("https://api.steamship.com/api/v1/")
+    assert adapter._pool_maxsize == 32
+    assert isinstance(adapter.max_retries, JitteredRetry)
+    assert adapter.max_retries.total == 4
+    assert 503 in adapter.max_retries.status_forcelist
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert session.headers["Connection"] == "close"
+
+
+def test_jittered_retry_backoff() -> None:
+    retry = JitteredRetry(total=5, backoff_factor=1, backoff_jitter=0.5)
+    assert retry.get_backoff_time() == 0
+
+    retry = retry.increment(method="GET", url="/").increment(method="GET", url="/")
+    assert retry.backoff_jitter == 0.5
+    assert 2 <= retry.get_backoff_time() <= 2.5
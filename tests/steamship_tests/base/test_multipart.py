@@ -0,0 +1,58 @@
+import io
+
+import requests
+import urllib3.filepost
+
+from steamship.base.client import Client
+from steamship.base.multipart import MultipartStream, ProgressReader
+
+BOUNDARY = "test-boundary"
+
+
+def _files(content):
+    data = {"handle": "my-file", "publicData": False, "tags": [{"kind": "k", "value": 1}]}
+    return Client._prepare_multipart_data(data, ("file-part", content, "multipart/form-data"))
+
+
+def test_multipart_stream_matches_requests_encoding(monkeypatch):
+    content = bytes(range(256)) * 1000
+    monkeypatch.setattr(urllib3.filepost, "choose_boundary", lambda: BOUNDARY)
+    expected, content_type = requests.models.RequestEncodingMixin._encode_files(_files(content), {})
+
+    stream = MultipartStream(_files(io.BytesIO(content)), boundary=BOUNDARY)
+    assert stream.content_type == content_type
+    assert len(stream) == len(expected)
+
+    # Read in small pieces, as the HTTP connection does, to exercise segment boundaries
+    chunks = []
+    while True:
+        chunk = stream.read(1000)
+        if not chunk:
+            break
+        assert len(chunk) <= 1000
+        chunks.append(chunk)
+    assert b"".join(chunks) == expected
+
+
+def test_multipart_stream_sent_with_content_length():
+    stream = MultipartStream(_files(io.BytesIO(b"x" * 5000)))
+    request = requests.Request("POST", "http://localhost/", data=stream).prepare()
+    assert request.headers["Content-Length"] == str(len(stream))
+    assert "Transfer-Encoding" not in request.headers
+
+
+def test_multipart_stream_only_for_file_like_content():
+    assert MultipartStream.is_streamable(_files(io.BytesIO(b"abc")))
+    assert not MultipartStream.is_streamable(_files(b"abc"))
+
+
+def test_progress_reader_reports_progress():
+    progress = []
+    reader = ProgressReader(
+        io.BytesIO(b"a" * 2500), lambda sent, total: progress.append((sent, total))
+    )
+    stream = MultipartStream({"file": ("file-part", reader, "multipart/form-data")})
+    while stream.read(1000):
+        pass
+    assert progress[-1] == (2500, 2500)
+    assert [sent for sent, _ in progress] == sorted(sent for sent, _ in progress)
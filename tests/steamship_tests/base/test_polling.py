@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+from steamship.base.configuration import Configuration
+from steamship.base.polling import PollingStrategy, resolve_polling_strategy
+from steamship.base.tasks import Task, TaskState
+
+
+def test_polling_strategy_backs_off_to_cap():
+    polling = PollingStrategy(initial_delay_s=0.05, backoff_factor=2, max_delay_s=0.3)
+    delays = []
+    delay_s = None
+    for _ in range(5):
+        delay_s = polling.next_delay(delay_s)
+        delays.append(delay_s)
+    assert delays == [0.05, 0.1, 0.2, 0.3, 0.3]
+
+
+def test_polling_strategy_honors_hint():
+    polling = PollingStrategy(initial_delay_s=0.05, max_delay_s=1)
+    # A server hint may lengthen, but never shorten, the delay -- even beyond the usual cap
+    assert polling.next_delay(None, hint_s=5) == 5
+    assert polling.next_delay(0.5, hint_s=0.01) == 1
+
+
+def test_fixed_polling_strategy():
+    polling = PollingStrategy.fixed(2)
+    assert polling.next_delay() == 2
+    assert polling.next_delay(2) == 2
+
+
+def test_resolve_polling_strategy_precedence():
+    configured = PollingStrategy(initial_delay_s=0.2)
+    config = Configuration(api_key="test-key", polling=configured)
+
+    class FakeClient:
+        def __init__(self, config):
+            self.config = config
+
+    client = FakeClient(config)
+    override = PollingStrategy(initial_delay_s=3)
+    assert resolve_polling_strategy(client, override, retry_delay_s=1) is override
+    assert resolve_polling_strategy(client, retry_delay_s=1) == PollingStrategy.fixed(1)
+    assert resolve_polling_strategy(client) == configured
+    assert resolve_polling_strategy(None) == PollingStrategy()
+
+
+def test_task_wait_uses_polling_strategy():
+    task = Task(task_id="t", state=TaskState.running)
+    refreshes = []
+
+    def refresh(self):
+        refreshes.append(1)
+        if len(refreshes) == 4:
+            self.state = TaskState.succeeded
+
+    polling = PollingStrategy(initial_delay_s=0.01, backoff_factor=3, max_delay_s=0.05)
+    with patch.object(Task, "refresh", refresh), patch("steamship.base.tasks.time.sleep") as sleep:
+        task.wait(polling=polling)
+    assert [call.args[0] for call in sleep.call_args_list] == [0.01, 0.03, 0.05, 0.05]
@@ -5,7 +5,7 @@ from steamship_tests.utils.fixtures import get_steamship_client
 
 from steamship import SteamshipError
 from steamship.base.model import CamelModel
-from steamship.base.tasks import TaskState
+from steamship.base.tasks import Task, TaskState
 
 
 class NoOpResult(CamelModel):
@@ -107,3 +107,66 @@ def test_task_update():
     # The output is the new output. The remote state was updated by the client before the refresh returned
     assert result_task.status_message == status
     assert result_task.status_message != orig_status
+
+
+def _fake_refresh(completions: dict):
+    """Build a `Task.refresh` replacement which completes each task after a given number of polls."""
+    polls = {}
+
+    def refresh(self):
+        polls[self.task_id] = polls.get(self.task_id, 0) + 1
+        if polls[self.task_id] >= completions[self.task_id]:
+            self.state = TaskState.succeeded
+            self.output = self.task_id
+
+    return refresh, polls
+
+
+def test_task_as_completed_yields_in_completion_order(monkeypatch):
+    refresh, polls = _fake_refresh({"slow": 3, "fast": 1, "medium": 2})
+    monkeypatch.setattr(Task, "refresh", refresh)
+    done = Task(task_id="done", state=TaskState.succeeded)
+    tasks = [
+        Task(task_id=task_id, state=TaskState.waiting) for task_id in ["slow", "fast", "medium"]
+    ]
+
+    completed = Task.as_completed([done, *tasks], retry_delay_s=0)
+
+    assert [task.task_id for task in completed] == ["done", "fast", "medium", "slow"]
+    # Completed tasks drop out of the polled set
+    assert polls == {"slow": 3, "fast": 1, "medium": 2}
+
+
+def test_task_wait_all_preserves_order(monkeypatch):
+    refresh, _ = _fake_refresh({"a": 2, "b": 1})
+    monkeypatch.setattr(Task, "refresh", refresh)
+    tasks = [Task(task_id="a", state=TaskState.running), Task(task_id="b", state=TaskState.waiting)]
+
+    assert Task.wait_all(tasks, retry_delay_s=0) == ["a", "b"]
+
+
+def test_task_wait_all_timeout(monkeypatch):
+    refresh, _ = _fake_refresh({"a": 1, "never": 10**6})
+    monkeypatch.setattr(Task, "refresh", refresh)
+    tasks = [
+        Task(task_id="a", state=TaskState.waiting),
+        Task(task_id="never", state=TaskState.waiting),
+    ]
+
+    with pytest.raises(SteamshipError, match="never"):
+        Task.wait_all(tasks, max_timeout_s=0.05, retry_delay_s=0.01)
+    assert tasks[0].state == TaskState.succeeded
+
+
+def test_task_map_output_applies_once_succeeded(monkeypatch):
+    def refresh(self):
+        self.update(Task(task_id=self.task_id, state=TaskState.succeeded, output="done"))
+
+    monkeypatch.setattr(Task, "refresh", refresh)
+
+    task = Task(task_id="pending", state=TaskState.running).map_output(str.upper)
+    assert task.output is None
+    assert task.wait(retry_delay_s=0) == "DONE"
+
+    # Tasks which have already succeeded are transformed immediately
+    assert Task(state=TaskState.succeeded, output="ok").map_output(str.upper).output == "OK"
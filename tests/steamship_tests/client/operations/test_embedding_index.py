@@ -1,9 +1,26 @@
+import asyncio
+import json
+import threading
+
 import pytest
+import requests
+from steamship_tests.utils.fake_client import FakeSteamship
 from steamship_tests.utils.fixtures import get_steamship_client
 from steamship_tests.utils.random import random_index, random_name
 
-from steamship import SteamshipError, Tag
-from steamship.data.embeddings import EmbeddedItem
+from steamship import AsyncSteamship, Configuration, SteamshipError, Tag
+from steamship.base.tasks import Task, TaskState
+from steamship.data.embeddings import (
+    EmbeddedItem,
+    EmbeddingIndex,
+    IndexInsertResponse,
+    IndexItemId,
+    PartialInsertError,
+    QueryResult,
+    QueryResults,
+)
+from steamship.data.plugin.index_plugin_instance import EmbeddingIndexPluginInstance
+from steamship.data.search import Hit
 
 _TEST_EMBEDDER = "test-embedder"
 
@@ -145,6 +162,182 @@ def test_insert_many():
         assert "_block_id" not in item0.value
 
 
+def test_insert_many_in_batches():
+    client = FakeSteamship.create()
+    client.config.transport.backoff_factor = 0
+    lock = threading.Lock()
+    sent = []
+    failed = []
+
+    def item_create(data):
+        with lock:
+            sent.append(([item["value"] for item in data["items"]], data["reindex"]))
+            # The first attempt at the batch starting with item 20 fails to connect
+            if data["items"][0]["value"] == "item 20" and not failed:
+                failed.append(True)
+                raise requests.ConnectionError("transient failure")
+        return {
+            "itemIds": [
+                {"indexId": data["indexId"], "id": f"id-{item['value']}"} for item in data["items"]
+            ]
+        }
+
+    setattr(client.engine, "embedding-index_item_create", item_create)
+    index = EmbeddingIndex(client=client, id="index-1")
+    items = [f"item {i}" for i in range(45)]
+
+    response = index.insert_many(items, max_batch_items=10, max_workers=3, batch_retries=1)
+
+    # Ids come back in the order of the items, despite batches being sent concurrently
+    assert [item_id.id for item_id in response.item_ids] == [f"id-{item}" for item in items]
+    batches = [values for values, _ in sent]
+    assert sorted(batches) == sorted([items[i : i + 10] for i in range(0, 45, 10)] + [items[20:30]])
+    # Only the last batch, sent once every other batch is in, reindexes
+    assert sent[-1] == (items[40:], True)
+    assert all(not reindex for _, reindex in sent[:-1])
+
+    # Batches are also limited by size
+    sent.clear()
+    index.insert_many(["x" * 1000] * 4, max_batch_bytes=2600)
+    assert [len(values) for values, _ in sent] == [2, 2]
+
+    with pytest.raises(SteamshipError, match="item 1 of length"):
+        index.insert_many(["ok", "x" * 6000])
+
+
+def test_insert_many_reports_partial_failure():
+    client = FakeSteamship.create()
+    client.config.transport.backoff_factor = 0
+    requests = []
+
+    def item_create(data):
+        values = [item["value"] for item in data["items"]]
+        requests.append(values)
+        if values[0] == "item 10":
+            raise KeyError("persistent failure")
+        return {"itemIds": [{"indexId": data["indexId"], "id": f"id-{value}"} for value in values]}
+
+    setattr(client.engine, "embedding-index_item_create", item_create)
+    index = EmbeddingIndex(client=client, id="index-1")
+    items = [f"item {i}" for i in range(35)]
+
+    with pytest.raises(PartialInsertError, match="Inserted 20 of 35 items") as error:
+        index.insert_many(items, max_batch_items=10, max_workers=1, batch_retries=1)
+
+    # The other leading batches are inserted, but the last batch, which would reindex, is not sent
+    assert error.value.inserted_items == list(range(10)) + list(range(20, 30))
+    assert [item_id.id for item_id in error.value.item_ids] == [
+        f"id-item {i}" for i in error.value.inserted_items
+    ]
+    assert items[30:] not in requests
+    # Errors that are not transient are not retried
+    assert requests.count(items[10:20]) == 1
+
+    # A failure of the only batch is raised as it is
+    with pytest.raises(SteamshipError) as error:
+        index.insert_many(items[10:20])
+    assert not isinstance(error.value, PartialInsertError)
+
+
+def test_insert_many_retries_only_transient_errors():
+    client = FakeSteamship.create()
+    client.config.transport.backoff_factor = 0
+    attempts = []
+    statuses = [503, 429, None]
+
+    def item_create(data):
+        attempts.append(data["items"][0]["value"])
+        status = statuses.pop(0)
+        if status is not None:
+            error = SteamshipError(message=f"HTTP {status}")
+            error.http_status = status
+            raise error
+        return {"itemIds": [{"indexId": data["indexId"], "id": "id-1"}]}
+
+    setattr(client.engine, "embedding-index_item_create", item_create)
+    index = EmbeddingIndex(client=client, id="index-1")
+
+    # Not retried by default, as a batch may be written before its request fails
+    with pytest.raises(SteamshipError, match="HTTP 503"):
+        index.insert_many(["item"])
+    assert len(attempts) == 1
+
+    # 5xx, 429 and connection errors are retried when asked to
+    response = index.insert_many(["item"], batch_retries=2)
+    assert [item_id.id for item_id in response.item_ids] == ["id-1"]
+    assert len(attempts) == 3
+
+    # Other error responses are not
+    statuses[:] = [400, None]
+    with pytest.raises(SteamshipError, match="HTTP 400"):
+        index.insert_many(["item"], batch_retries=2)
+    assert len(attempts) == 4
+
+
+def test_error_responses_record_http_status():
+    client = FakeSteamship.create()
+    with pytest.raises(SteamshipError) as error:
+        client._process_response({"data": {}}, ok=False, status_code=503)
+    assert error.value.http_status == 503
+
+
+class AsyncIndexSteamship(AsyncSteamship):
+    """An AsyncSteamship answering embedding index inserts itself, recording each batch."""
+
+    async def post(self, operation, payload=None, expect=None, **kwargs):
+        await asyncio.sleep(0)
+        values = [item.value for item in payload.items]
+        ASYNC_INSERTS.append((values, payload.reindex))
+        return IndexInsertResponse(
+            item_ids=[IndexItemId(index_id=payload.index_id, id=f"id-{value}") for value in values]
+        )
+
+
+ASYNC_INSERTS = []
+
+
+def test_insert_many_in_batches_with_async_client():
+    ASYNC_INSERTS.clear()
+    client = AsyncIndexSteamship.construct(
+        config=Configuration(api_key="fake-api-key", workspace_id="ws-1", workspace_handle="ws")
+    )
+    index = EmbeddingIndex(client=client, id="index-1")
+    items = [f"item {i}" for i in range(25)]
+
+    response = asyncio.run(index.insert_many(items, max_batch_items=10))
+
+    assert [item_id.id for item_id in response.item_ids] == [f"id-{item}" for item in items]
+    assert sorted(ASYNC_INSERTS[:2]) == [(items[:10], False), (items[10:20], False)]
+    assert ASYNC_INSERTS[-1] == (items[20:], True)
+
+
+def test_plugin_instance_search_does_not_block(monkeypatch):
+    client = FakeSteamship.create()
+    index = EmbeddingIndex(client=client, id="index-1")
+    plugin_instance = EmbeddingIndexPluginInstance(client=client, id="index-1", index=index)
+
+    def search(self, query, k=1, include_metadata=False):
+        return Task(client=client, task_id=f"search-{query}", state=TaskState.running)
+
+    def refresh(self):
+        metadata = {"_block_id": "block-1", "_file_id": "file-1", "_tag_id": "tag-1"}
+        hit = Hit(id=self.task_id, value="hit text", metadata=json.dumps(metadata))
+        output = QueryResults(items=[QueryResult(value=hit, score=0.5)])
+        self.update(Task(task_id=self.task_id, state=TaskState.succeeded, output=output))
+
+    monkeypatch.setattr(EmbeddingIndex, "search", search)
+    monkeypatch.setattr(Task, "refresh", refresh)
+
+    # Both searches are issued before either completes
+    tasks = [plugin_instance.search(query, k=1) for query in ["a", "b"]]
+    assert all(task.state == TaskState.running for task in tasks)
+
+    results = Task.wait_all(tasks, retry_delay_s=0)
+    assert [result.items[0].tag.id for result in results] == ["search-a", "search-b"]
+    assert results[0].items[0].tag.block_id == "block-1"
+    assert results[0].items[0].score == 0.5
+
+
 def test_duplicate_inserts():
     steamship = get_steamship_client()
     with random_index(steamship, _TEST_EMBEDDER) as index:
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from steamship import (
+    AsyncSteamship,
+    Block,
+    Configuration,
+    File,
+    MimeTypes,
+    PackageInstance,
+    Steamship,
+    Tag,
+    TaskState,
+    Workspace,
+)
+from steamship.base.model import CamelModel
+
+
+class NoOpResult(CamelModel):
+    pass
+
+
+def _async_client_for(client: Steamship) -> AsyncSteamship:
+    return AsyncSteamship(config=client.config, trust_workspace_config=True)
+
+
+@pytest.mark.usefixtures("client")
+def test_async_file_operations(client: Steamship):
+    async def run():
+        async with _async_client_for(client) as async_client:
+            files = await asyncio.gather(
+                *[File.create(async_client, blocks=[Block(text=f"block {i}")]) for i in range(3)]
+            )
+            assert len({file.id for file in files}) == 3
+            assert all(isinstance(file.client, AsyncSteamship) for file in files)
+
+            fetched = await File.get(async_client, _id=files[0].id)
+            assert fetched.blocks[0].text == "block 0"
+
+            tag = await Tag.create(async_client, file_id=fetched.id, kind="async-test")
+            assert tag.file_id == fetched.id
+
+            raw = await File.create(async_client, content="ABC", mime_type=MimeTypes.TXT)
+            assert (await raw.raw()).decode("utf-8") == "ABC"
+
+            for file in [*files, raw]:
+                await file.delete()
+
+    asyncio.run(run())
+
+
+@pytest.mark.usefixtures("client")
+def test_async_background_task(client: Steamship):
+    async def run():
+        async with _async_client_for(client) as async_client:
+            result = await async_client.post("task/noop", expect=NoOpResult)
+            assert isinstance(result, NoOpResult)
+
+            task = await async_client.post("task/noop", expect=NoOpResult, as_background_task=True)
+            assert task.state == TaskState.waiting
+            output = await task.wait_async()
+            assert task.state == TaskState.succeeded
+            assert isinstance(output, NoOpResult)
+
+    asyncio.run(run())
+
+
+class RecordingAsyncSteamship(AsyncSteamship):
+    """An AsyncSteamship which answers every call itself, recording the operations requested."""
+
+    async def call(self, verb, operation, payload=None, expect=None, **kwargs):
+        await asyncio.sleep(0)
+        RECORDED_OPERATIONS.append(operation)
+        if expect is Workspace:
+            return Workspace(client=self, id=payload.id, handle="async-workspace")
+        return {"ok": True}
+
+
+RECORDED_OPERATIONS = []
+
+
+def test_async_package_invoke_loads_workspace_handle():
+    RECORDED_OPERATIONS.clear()
+    async_client = RecordingAsyncSteamship.construct(
+        config=Configuration(api_key="fake-api-key", workspace_id="ws-1", workspace_handle="ws")
+    )
+    instance = PackageInstance(client=async_client, handle="instance", workspace_id="ws-1")
+
+    result = asyncio.run(instance.invoke("/greet", name="you"))
+
+    assert result == {"ok": True}
+    assert RECORDED_OPERATIONS == ["workspace/get", "/async-workspace/instance/greet"]
+    assert instance.workspace_handle == "async-workspace"
@@ -0,0 +1,160 @@
+import copy
+import itertools
+import re
+from typing import Any, Dict, List, Optional
+
+from pydantic import PrivateAttr
+
+from steamship import Configuration, Steamship, SteamshipError
+
+
+class FakeEngine:
+    """An in-memory model of the subset of the Steamship API that files, blocks and tags rely on.
+
+    Each operation is a method named after its path (`file/create` -> `file_create`) which takes the JSON request
+    body and returns the JSON `data` of the response. Every call is recorded in `calls`.
+    """
+
+    def __init__(self):
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.calls: List[str] = []
+        self._ids = itertools.count(1)
+
+    def new_id(self, prefix: str) -> str:
+        return f"{prefix}-{next(self._ids)}"
+
+    def count(self, operation: str) -> int:
+        return self.calls.count(operation)
+
+    def _new_tag(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {**data, "id": self.new_id("tag")}
+
+    def _new_block(self, data: Dict[str, Any], file_id: str, index: int) -> Dict[str, Any]:
+        block_id = self.new_id("block")
+        tags = [
+            self._new_tag({**tag, "fileId": file_id, "blockId": block_id})
+            for tag in data.get("tags") or []
+        ]
+        return {**data, "id": block_id, "fileId": file_id, "index": index, "tags": tags}
+
+    def _blocks(self):
+        for file in self.files.values():
+            yield from file["blocks"]
+
+    def file_create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        file_id = self.new_id("file")
+        file = {
+            "id": file_id,
+            "handle": data.get("handle"),
+            "mimeType": data.get("mimeType"),
+            "tags": [self._new_tag({**tag, "fileId": file_id}) for tag in data.get("tags") or []],
+            "blocks": [
+                self._new_block(block, file_id, index)
+                for index, block in enumerate(data.get("blocks") or [])
+            ],
+        }
+        self.files[file_id] = file
+        return file
+
+    def file_get(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        for file in self.files.values():
+            if file["id"] == data.get("id") or (
+                data.get("handle") and file["handle"] == data["handle"]
+            ):
+                return file
+        raise KeyError(data)
+
+    def file_delete(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return self.files.pop(data["id"])
+
+    def file_query(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        query = data["tagFilterQuery"]
+        kind = re.search(r'kind "([^"]*)"', query)
+        name = re.search(r'name "([^"]*)"', query)
+        files = [
+            file
+            for file in self.files.values()
+            if any(
+                (kind is None or tag.get("kind") == kind.group(1))
+                and (name is None or tag.get("name") == name.group(1))
+                for tag in file["tags"]
+            )
+        ]
+        return {"files": files}
+
+    def block_get(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        for block in self._blocks():
+            if block["id"] == data["id"]:
+                return block
+        raise KeyError(data)
+
+    def block_create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        blocks = self.files[data["fileId"]]["blocks"]
+        index = blocks[-1]["index"] + 1 if blocks else 0
+        block = self._new_block(data, data["fileId"], index)
+        blocks.append(block)
+        return block
+
+    def block_delete(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        for file in self.files.values():
+            for block in file["blocks"]:
+                if block["id"] == data["id"]:
+                    file["blocks"].remove(block)
+                    return block
+        raise KeyError(data)
+
+    def tag_create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        tag = self._new_tag(data)
+        if data.get("blockId"):
+            self.block_get({"id": data["blockId"]})["tags"].append(tag)
+        else:
+            self.files[data["fileId"]]["tags"].append(tag)
+        return tag
+
+    def tag_delete(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        owners = [*self.files.values(), *self._blocks()]
+        for owner in owners:
+            for tag in owner["tags"]:
+                if tag["id"] == data["id"]:
+                    owner["tags"].remove(tag)
+                    return tag
+        raise KeyError(data)
+
+
+class FakeSteamship(Steamship):
+    """A Steamship client whose API calls are answered by an in-memory `FakeEngine`, for offline tests.
+
+    Responses are parsed by the real client code, so models come back with their `client` attached as usual.
+    """
+
+    _engine: FakeEngine = PrivateAttr()
+
+    @classmethod
+    def create(cls, engine: Optional[FakeEngine] = None) -> "FakeSteamship":
+        client = cls.construct(
+            config=Configuration(
+                api_key="fake-api-key", workspace_id="fake-workspace", workspace_handle="fake"
+            )
+        )
+        client._engine = engine or FakeEngine()
+        return client
+
+    @property
+    def engine(self) -> FakeEngine:
+        return self._engine
+
+    def call(self, verb, operation: str, payload=None, file=None, expect=None, **kwargs) -> Any:
+        self._engine.calls.append(operation)
+        data = self._prepare_data(payload)
+        handler = getattr(self._engine, operation.replace("/", "_"))
+        try:
+            response_data = copy.deepcopy(handler(copy.deepcopy(data)))
+        except KeyError as e:
+            raise SteamshipError(message=f"Object not found: {e}")
+        return self._process_response({"data": response_data}, ok=True, expect=expect)
+
+    def post(self, operation: str, payload=None, **kwargs) -> Any:
+        return self.call("POST", operation, payload, **kwargs)
+
+    def get(self, operation: str, payload=None, **kwargs) -> Any:
+        return self.call("GET", operation, payload, **kwargs)
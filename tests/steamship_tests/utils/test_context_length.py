@@ -0,0 +1,117 @@
+from typing import List
+
+import pytest
+
+from steamship import Block, SteamshipError
+from steamship.agents.schema.message_selectors import TokenWindowMessageSelector
+from steamship.data.tags.tag_constants import RoleTag
+from steamship.utils import context_length
+from steamship.utils.context_length import (
+    TOKEN_COUNT_CACHE,
+    filter_blocks_for_prompt_length,
+    retain_system_and_recent_suffix,
+    token_length,
+)
+
+
+class WordEncoding:
+    """Stands in for a tiktoken encoding: one token per word, counting calls to `encode`."""
+
+    def __init__(self):
+        self.encoded: List[str] = []
+
+    def encode(self, text: str) -> List[str]:
+        self.encoded.append(text)
+        return text.split()
+
+
+@pytest.fixture
+def encoding(monkeypatch) -> WordEncoding:
+    encoding = WordEncoding()
+    monkeypatch.setattr(context_length, "get_encoding", lambda name="p50k_base": encoding)
+    TOKEN_COUNT_CACHE.clear()
+    yield encoding
+    TOKEN_COUNT_CACHE.clear()
+
+
+def test_token_length_is_cached_by_text(encoding: WordEncoding):
+    block = Block(id="block-1", text="one two three")
+    assert token_length(block) == 3
+    assert token_length(block) == 3
+    assert encoding.encoded == ["one two three"]
+
+    # A change of text (e.g. while streaming) is measured again
+    block.text = "one two three four"
+    assert token_length(block) == 4
+    assert len(encoding.encoded) == 2
+
+    # As is the same block under a different encoder
+    assert token_length(block, "cl100k_base") == 4
+    assert len(encoding.encoded) == 3
+
+    # Blocks with the same text share a count
+    assert token_length(Block(id="block-2", text="one two three four")) == 4
+    assert len(encoding.encoded) == 3
+
+    # The cache holds digests rather than the texts themselves
+    assert all(block.text not in key for key in TOKEN_COUNT_CACHE._entries)
+
+
+def test_token_length_of_block_without_text(encoding: WordEncoding):
+    with pytest.raises(AttributeError):
+        token_length(Block(id="image"))
+    assert len(TOKEN_COUNT_CACHE) == 0
+
+
+def test_token_window_selector_reuses_counts(encoding: WordEncoding):
+    messages = []
+    for i in range(10):
+        role = RoleTag.USER if i % 2 == 0 else RoleTag.ASSISTANT
+        messages.append(Block(id=f"block-{i}", text=f"message number {i}"))
+        messages[-1].set_chat_role(role)
+    messages.append(Block(id="prompt", text="current prompt"))
+    messages[-1].set_chat_role(RoleTag.USER)
+    selector = TokenWindowMessageSelector(max_tokens=10)
+
+    first = [block.id for block in selector.get_messages(messages)]
+    assert first == ["block-7", "block-8", "block-9"]
+    measured = len(encoding.encoded)
+
+    # Selecting again over the same history is answered from the cache
+    assert [block.id for block in selector.get_messages(messages)] == first
+    assert len(encoding.encoded) == measured
+
+
+def chat(*messages) -> List[Block]:
+    blocks = []
+    for i, (role, words) in enumerate(messages):
+        blocks.append(Block(id=f"block-{i}", index_in_file=i, text=" ".join(["word"] * words)))
+        blocks[-1].set_chat_role(role)
+    return blocks
+
+
+def test_filter_blocks_for_prompt_length(encoding: WordEncoding):
+    blocks = chat(
+        (RoleTag.SYSTEM, 2),
+        (RoleTag.USER, 1),
+        (RoleTag.ASSISTANT, 3),
+        (RoleTag.USER, 8),
+        (RoleTag.ASSISTANT, 2),
+        (RoleTag.USER, 2),
+    )
+    # The 8-token block does not fit, but older blocks that do are still kept
+    assert filter_blocks_for_prompt_length(10, blocks) == [0, 2, 4, 5]
+    # Without gaps, the window stops at the first block that does not fit
+    assert filter_blocks_for_prompt_length(
+        10, blocks, strategy=retain_system_and_recent_suffix
+    ) == [0, 4, 5]
+    assert len(encoding.encoded) == len({block.text for block in blocks})
+
+    # Equal (but distinct) blocks are only retained if selected
+    twins = chat((RoleTag.USER, 5), (RoleTag.USER, 5))
+    assert filter_blocks_for_prompt_length(8, twins) == [1]
+
+    with pytest.raises(SteamshipError, match="system blocks"):
+        filter_blocks_for_prompt_length(1, blocks)
+    with pytest.raises(SteamshipError, match="no non-System blocks"):
+        filter_blocks_for_prompt_length(3, chat((RoleTag.SYSTEM, 2), (RoleTag.USER, 4)))
@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from steamship.utils import json_codec
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def codec(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return json_codec
+
+
+def test_round_trip(codec):
+    obj = {"text": "héllo ✓", "values": [1, 2.5, True, None], "nested": {"a": []}}
+    encoded = codec.dumps_bytes(obj)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == obj
+    assert codec.loads(codec.dumps(obj)) == obj
+    assert json.loads(encoded) == obj
+
+
+def test_non_string_keys_are_coerced(codec):
+    assert codec.loads(codec.dumps({1: "one"})) == {"1": "one"}
+
+
+def test_falls_back_to_stdlib_for_unsupported_values(codec):
+    big = 2**70
+    assert codec.loads(codec.dumps({"big": big})) == {"big": big}
+
+
+def test_invalid_json_raises(codec):
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{not json")
@@ -1,10 +1,13 @@
+import time
 from enum import Enum
 
 import pytest
 from steamship_tests.utils.client import get_steamship_client
+from steamship_tests.utils.fake_client import FakeSteamship
 from steamship_tests.utils.random import random_name
 
-from steamship import Steamship, Workspace
+from steamship import Steamship, SteamshipError, Workspace
+from steamship.utils import kv_store
 from steamship.utils.kv_store import KeyValueStore
 
 
@@ -158,3 +161,194 @@ def test_kv_multi_space_works():
     # Clean up
     Workspace(client=client1, id=client1.config.workspace_id).delete()
     Workspace(client=client2, id=client2.config.workspace_id).delete()
+
+
+def test_cached_key_value_store():
+    client = FakeSteamship.create()
+    engine = client.engine
+    kv = KeyValueStore(client=client, cache=True)
+
+    assert kv.get("FOO") is None
+    kv.set("FOO", {"a": 1})
+    kv.set("BAR", {"b": 2})
+    calls = len(engine.calls)
+
+    # Reads are served from memory
+    assert kv.get("FOO") == {"a": 1}
+    assert kv.get("BAR") == {"b": 2}
+    assert kv.get("BAZ") is None
+    assert sorted(kv.items()) == [("BAR", {"b": 2}), ("FOO", {"a": 1})]
+    assert len(engine.calls) == calls
+
+    # Overwriting is one delete and one create
+    kv.set("FOO", {"a": 3})
+    assert engine.calls[calls:] == ["tag/delete", "tag/create"]
+    assert kv.delete("BAR")
+    assert not kv.delete("BAR")
+    assert engine.calls[calls + 2 :] == ["tag/delete"]
+
+    # An uncached store sees the same state in Steamship
+    uncached = KeyValueStore(client=client)
+    assert uncached.items() == [("FOO", {"a": 3})]
+
+
+def test_cached_key_value_store_invalidation():
+    client = FakeSteamship.create()
+    cached = KeyValueStore(client=client, cache=True)
+    other = KeyValueStore(client=client)
+
+    cached.set("FOO", {"a": 1})
+    other.set("FOO", {"a": 2})
+    assert cached.get("FOO") == {"a": 1}
+    cached.invalidate()
+    assert cached.get("FOO") == {"a": 2}
+
+    # Writes recover when another instance deletes the store's file
+    other.reset()
+    cached.set("BAR", {"b": 1})
+    assert other.get("BAR") == {"b": 1}
+
+
+def test_cached_key_value_store_failed_delete(monkeypatch):
+    client = FakeSteamship.create()
+    kv = KeyValueStore(client=client, cache=True, shards=2)
+    kv.set_many({"FOO": {"a": 1}, "BAR": {"b": 2}})
+
+    def fail(data):
+        raise KeyError(data)
+
+    monkeypatch.setattr(client.engine, "tag_delete", fail)
+    with pytest.raises(SteamshipError):
+        kv.delete("FOO")
+    with pytest.raises(SteamshipError):
+        kv.delete_many(["FOO", "BAR"])
+
+    # The entries are still there, and the cache still says so
+    assert kv.get_many(["FOO", "BAR"]) == {"FOO": {"a": 1}, "BAR": {"b": 2}}
+    assert sorted(KeyValueStore(client=client, shards=2).items()) == sorted(kv.items())
+
+
+def test_cached_key_value_store_failed_set(monkeypatch):
+    client = FakeSteamship.create()
+    kv = KeyValueStore(client=client, cache=True, shards=2)
+    kv.set_many({"FOO": {"a": 1}, "BAR": {"b": 2}})
+
+    def fail(data):
+        raise ConnectionError("connection reset")
+
+    # A failure that is not a SteamshipError is not retried, but must not leave the cache disagreeing with the store
+    monkeypatch.setattr(client.engine, "tag_delete", fail)
+    with pytest.raises(ConnectionError):
+        kv.set("FOO", {"a": 2})
+    with pytest.raises(ConnectionError):
+        kv.set_many({"FOO": {"a": 3}, "BAR": {"b": 3}})
+
+    assert kv.get_many(["FOO", "BAR"]) == {"FOO": {"a": 1}, "BAR": {"b": 2}}
+    assert sorted(KeyValueStore(client=client, shards=2).items()) == sorted(kv.items())
+
+
+def test_cached_key_value_store_ttl(monkeypatch):
+    client = FakeSteamship.create()
+    kv = KeyValueStore(client=client, cache=True, cache_ttl_s=10)
+    kv.set("FOO", {"a": 1})
+    KeyValueStore(client=client).set("FOO", {"a": 2})
+
+    now = time.monotonic()
+    monkeypatch.setattr(kv_store.time, "monotonic", lambda: now + 5)
+    assert kv.get("FOO") == {"a": 1}
+    monkeypatch.setattr(kv_store.time, "monotonic", lambda: now + 11)
+    assert kv.get("FOO") == {"a": 2}
+
+
+@pytest.mark.parametrize("shards", [1, 4])
+def test_key_value_store_batch_operations(shards: int):
+    client = FakeSteamship.create()
+    engine = client.engine
+    kv = KeyValueStore(client=client, shards=shards)
+    values = {f"key-{i}": {"i": i} for i in range(20)}
+
+    # Shards that do not exist yet are created with their entries in one request each
+    kv.set_many(values)
+    assert engine.count("file/create") == shards
+    assert engine.count("tag/create") == 0
+    assert len(engine.files) == shards
+
+    assert kv.get_many(["key-1", "key-2", "missing"]) == {
+        "key-1": {"i": 1},
+        "key-2": {"i": 2},
+        "missing": None,
+    }
+    assert sorted(kv.items()) == sorted(values.items())
+    assert all(kv.get(key) == value for key, value in values.items())
+
+    # Existing shards are updated in place
+    kv.set_many({"key-1": {"i": 100}, "new": {"i": -1}})
+    assert engine.count("file/create") == shards
+    assert engine.count("tag/delete") == 1
+    assert engine.count("tag/create") == 2
+    assert kv.get("key-1") == {"i": 100}
+    assert kv.get("new") == {"i": -1}
+
+    assert kv.delete_many(["key-1", "key-2", "missing"]) == {
+        "key-1": True,
+        "key-2": True,
+        "missing": False,
+    }
+    assert kv.get_many(["key-1", "key-2"]) == {"key-1": None, "key-2": None}
+    assert len(kv.items()) == 19
+
+    kv.reset()
+    assert engine.files == {}
+    assert kv.items() == []
+
+
+def test_reading_an_empty_key_value_store_creates_no_files():
+    client = FakeSteamship.create()
+    kv = KeyValueStore(client=client, shards=4)
+
+    assert kv.items() == []
+    assert kv.get_many(["FOO", "BAR"]) == {"FOO": None, "BAR": None}
+    assert client.engine.files == {}
+    assert client.engine.count("file/create") == 0
+
+
+def test_sharded_key_value_store_touches_one_shard():
+    client = FakeSteamship.create()
+    engine = client.engine
+    kv = KeyValueStore(client=client, shards=8)
+    kv.set_many({f"key-{i}": {"i": i} for i in range(100)})
+
+    # Each shard holds a fraction of the entries, and a single-key read transfers only that shard
+    assert all(len(file["tags"]) < 40 for file in engine.files.values())
+    engine.calls.clear()
+    assert kv.get("key-42") == {"i": 42}
+    assert kv.items(filter_keys=["key-7"]) == [("key-7", {"i": 7})]
+    assert engine.calls == ["file/query", "file/query"]
+
+    # Another instance with the same layout finds every key
+    other = KeyValueStore(client=client, shards=8)
+    assert other.get_many([f"key-{i}" for i in range(100)]) == {
+        f"key-{i}": {"i": i} for i in range(100)
+    }
+
+
+def test_cached_key_value_store_batch_operations():
+    client = FakeSteamship.create()
+    engine = client.engine
+    kv = KeyValueStore(client=client, shards=4, cache=True)
+    kv.set_many({f"key-{i}": {"i": i} for i in range(10)})
+
+    engine.calls.clear()
+    assert kv.get_many(["key-1", "key-2"]) == {"key-1": {"i": 1}, "key-2": {"i": 2}}
+    assert len(kv.items()) == 10
+    assert engine.calls == []
+
+    # A batch write recovers when another instance resets the store
+    KeyValueStore(client=client, shards=4).reset()
+    kv.set_many({"key-1": {"i": 1}})
+    assert KeyValueStore(client=client, shards=4).items() == [("key-1", {"i": 1})]
+
+
+def test_key_value_store_rejects_zero_shards():
+    with pytest.raises(SteamshipError):
+        KeyValueStore(client=FakeSteamship.create(), shards=0)
@@ -0,0 +1,48 @@
+from steamship.utils import lru_cache
+from steamship.utils.lru_cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats == {"size": 2, "hits": 3, "misses": 1, "evictions": 1, "expirations": 0}
+
+
+def test_lru_cache_expiry(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(lru_cache.time, "monotonic", lambda: now)
+    cache = LRUCache(ttl_s=10)
+    cache.put("a", 1)
+
+    now += 5
+    assert cache.get("a") == 1
+    now += 6
+    assert cache.get("a", "default") == "default"
+    assert len(cache) == 0
+    assert cache.expirations == 1
+
+
+def test_lru_cache_pop_and_clear():
+    cache = LRUCache()
+    for key in [("x", 1), ("x", 2), ("y", 1)]:
+        cache.put(key, key)
+
+    assert cache.pop(("x", 1))
+    assert not cache.pop(("x", 1))
+    cache.clear(lambda key: key[0] == "x")
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
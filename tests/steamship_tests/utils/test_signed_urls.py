@@ -1,14 +1,22 @@
+import functools
+import hashlib
+import io
 import os
 import shutil
 import tempfile
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+import pytest
 from steamship_tests import TEST_ASSETS_PATH
 from steamship_tests.utils.fixtures import get_steamship_client
 from steamship_tests.utils.random import random_name
 
-from steamship import Workspace
+from steamship import SteamshipError, Workspace
+from steamship.base.transport import TransportConfig
 from steamship.data.workspace import SignedUrl
+from steamship.utils import signed_urls
 from steamship.utils.signed_urls import download_from_signed_url, upload_to_signed_url
 from steamship.utils.zip_archives import zip_folder
 
@@ -152,3 +160,198 @@ def test_upload_download():
             f1c = f1.read()
             f2c = f2.read()
             assert f1c == f2c
+
+
+class _RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Serves files like S3 does for signed URLs: with `Accept-Ranges` and single-range `Range` support."""
+
+    ranges_requested = []
+    put_failures = 0
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return None
+        data = Path(path).read_bytes()
+        range_header = self.headers.get("Range")
+        if range_header:
+            start, _, end = range_header.removeprefix("bytes=").partition("-")
+            start, end = int(start), int(end) if end else len(data) - 1
+            _RangeRequestHandler.ranges_requested.append((start, end))
+            if start >= len(data):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(data)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return io.BytesIO(b"")
+            end = min(end, len(data) - 1)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+            data = data[start : end + 1]
+        else:
+            self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        return io.BytesIO(data)
+
+    def do_PUT(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if _RangeRequestHandler.put_failures > 0:
+            _RangeRequestHandler.put_failures -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        Path(self.translate_path(self.path)).write_bytes(body)
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def file_server(tmp_path):
+    served = tmp_path / "served"
+    served.mkdir()
+    handler = functools.partial(_RangeRequestHandler, directory=str(served))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _RangeRequestHandler.ranges_requested = []
+    _RangeRequestHandler.put_failures = 0
+    yield served, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_download_streams_to_file(file_server, tmp_path):
+    served, base_url = file_server
+    content = os.urandom(300_000)
+    (served / "object.bin").write_bytes(content)
+
+    progress = []
+    to_file = tmp_path / "out" / "object.bin"
+    download_from_signed_url(
+        f"{base_url}/object.bin",
+        to_file=to_file,
+        chunk_size=10_000,
+        expected_checksum=hashlib.md5(content).hexdigest(),
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+    assert to_file.read_bytes() == content
+    assert progress[-1] == (len(content), len(content))
+    assert not (tmp_path / "out" / "object.bin.part").exists()
+
+
+def test_download_in_parallel_ranges(file_server, tmp_path):
+    served, base_url = file_server
+    content = os.urandom(250_000)
+    (served / "object.bin").write_bytes(content)
+
+    to_file = tmp_path / "object.bin"
+    download_from_signed_url(
+        f"{base_url}/object.bin", to_file=to_file, max_workers=4, part_size=100_000
+    )
+    assert to_file.read_bytes() == content
+    assert sorted(_RangeRequestHandler.ranges_requested) == [
+        (0, 99_999),
+        (100_000, 199_999),
+        (200_000, 249_999),
+    ]
+
+
+def test_interrupted_parallel_download_is_not_resumed(file_server, tmp_path, monkeypatch):
+    served, base_url = file_server
+    content = os.urandom(250_000)
+    (served / "object.bin").write_bytes(content)
+    to_file = tmp_path / "object.bin"
+
+    # A hard crash part way leaves the pre-sized file behind without cleaning it up
+    def crash(url, path, total, *args):
+        with open(path, "wb") as f:
+            f.truncate(total)
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr(signed_urls, "_download_ranges", crash)
+    with pytest.raises(KeyboardInterrupt):
+        download_from_signed_url(
+            f"{base_url}/object.bin", to_file=to_file, max_workers=4, part_size=100_000
+        )
+    monkeypatch.undo()
+    assert not (tmp_path / "object.bin.part").exists()
+
+    # So resuming starts over rather than taking the zero-filled file as complete
+    download_from_signed_url(f"{base_url}/object.bin", to_file=to_file, resume=True)
+    assert to_file.read_bytes() == content
+
+
+def test_download_resumes_partial_file(file_server, tmp_path):
+    served, base_url = file_server
+    content = os.urandom(100_000)
+    (served / "object.bin").write_bytes(content)
+
+    to_file = tmp_path / "object.bin"
+    (tmp_path / "object.bin.part").write_bytes(content[:40_000])
+    download_from_signed_url(f"{base_url}/object.bin", to_file=to_file, resume=True)
+    assert to_file.read_bytes() == content
+    assert _RangeRequestHandler.ranges_requested == [(40_000, 99_999)]
+
+    # A fully downloaded part file needs no more data
+    (tmp_path / "object.bin.part").write_bytes(content)
+    download_from_signed_url(f"{base_url}/object.bin", to_file=to_file, resume=True)
+    assert to_file.read_bytes() == content
+
+
+def test_download_verification_failures(file_server, tmp_path):
+    served, base_url = file_server
+    (served / "object.bin").write_bytes(b"contents")
+
+    with pytest.raises(SteamshipError, match="checksum"):
+        download_from_signed_url(
+            f"{base_url}/object.bin", to_file=tmp_path / "a.bin", expected_checksum="0" * 32
+        )
+    assert not (tmp_path / "a.bin").exists()
+
+    with pytest.raises(SteamshipError, match="incomplete"):
+        download_from_signed_url(
+            f"{base_url}/object.bin", to_file=tmp_path / "b.bin", expected_size=3
+        )
+
+    with pytest.raises(SteamshipError):
+        download_from_signed_url(f"{base_url}/missing.bin", to_file=tmp_path / "c.bin")
+
+
+def test_upload_streams_file_and_retries(file_server, tmp_path):
+    served, base_url = file_server
+    content = os.urandom(200_000)
+    upload_path = tmp_path / "upload.bin"
+    upload_path.write_bytes(content)
+
+    # The first attempt fails transiently; the upload is rewound and retried
+    _RangeRequestHandler.put_failures = 1
+    progress = []
+    upload_to_signed_url(
+        f"{base_url}/uploaded.bin",
+        filepath=upload_path,
+        transport=TransportConfig(backoff_factor=0, backoff_jitter=0),
+        on_progress=lambda sent, total: progress.append((sent, total)),
+    )
+    assert (served / "uploaded.bin").read_bytes() == content
+    assert progress[-1] == (len(content), len(content))
+
+    upload_to_signed_url(f"{base_url}/bytes.bin", _bytes=b"some bytes")
+    assert (served / "bytes.bin").read_bytes() == b"some bytes"
+
+
+def test_upload_failure(file_server, tmp_path):
+    _, base_url = file_server
+    _RangeRequestHandler.put_failures = 10
+    with pytest.raises(SteamshipError, match="503"):
+        upload_to_signed_url(
+            f"{base_url}/uploaded.bin",
+            _bytes=b"x",
+            transport=TransportConfig(max_retries=1, backoff_factor=0, backoff_jitter=0),
+        )
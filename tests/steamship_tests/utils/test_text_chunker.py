@@ -1,4 +1,10 @@
-from steamship.utils.text_chunker import chunk_text
+import io
+from typing import List
+
+import pytest
+
+from steamship.utils import text_chunker
+from steamship.utils.text_chunker import chunk_text, chunk_text_by_tokens, split_segments
 
 
 def test_text_chunker():
@@ -16,3 +22,60 @@ def test_text_chunker():
     chunked = list(chunk_text("12345", chunk_size=3, chunk_overlap=2))
     assert len(chunked) == 5
     assert chunked == ["123", "234", "345", "45", "5"]
+
+
+class CharEncoding:
+    """Stands in for a tiktoken encoding: one token per character."""
+
+    def encode(self, text: str) -> List[str]:
+        return list(text)
+
+    def decode(self, tokens: List[str]) -> str:
+        return "".join(tokens)
+
+
+@pytest.fixture
+def char_encoding(monkeypatch):
+    monkeypatch.setattr(text_chunker, "get_encoding", lambda name="p50k_base": CharEncoding())
+
+
+def test_split_segments_streams_text():
+    text = "One. Two!  Three?\n\nNew paragraph\n\n\nend"
+    pieces = [text[i : i + 3] for i in range(0, len(text), 3)]
+
+    sentences = list(split_segments(iter(pieces)))
+    assert sentences == ["One.", " Two!", "  Three?", "\n\nNew paragraph", "\n\n\nend"]
+    assert list(split_segments(io.StringIO(text))) == sentences
+    assert list(split_segments(text, boundary="paragraph")) == [
+        "One. Two!  Three?",
+        "\n\nNew paragraph",
+        "\n\n\nend",
+    ]
+    assert "".join(split_segments(text, boundary="word")) == text
+    assert list(split_segments("x" * 10, max_segment_chars=4)) == ["xxxx", "xxxx", "xx"]
+
+
+def test_chunk_text_by_tokens(char_encoding):
+    text = "Aaaa. Bbbbbb. Cc. Ddddddddddddddddd."
+    chunks = list(chunk_text_by_tokens(text, max_tokens=14))
+    # Chunks end on sentence boundaries; the over-long sentence is split by tokens
+    assert chunks == ["Aaaa. Bbbbbb.", "Cc.", "Ddddddddddddd", "dddd."]
+    assert all(len(chunk) <= 14 for chunk in chunks)
+
+    # Overlapping chunks repeat the trailing sentences that fit into the overlap
+    overlapped = list(chunk_text_by_tokens("Aa. Bb. Cc. Dd. Ee.", max_tokens=8, overlap_tokens=4))
+    assert overlapped == ["Aa. Bb.", "Bb. Cc.", "Cc. Dd.", "Dd. Ee."]
+
+
+def test_chunk_text_by_tokens_reads_incrementally(char_encoding):
+    read = []
+
+    def sentences():
+        for i in range(1000):
+            read.append(i)
+            yield f"Sentence {i:03d}. "
+
+    chunks = chunk_text_by_tokens(sentences(), max_tokens=30)
+    assert next(chunks) == "Sentence 000. Sentence 001."
+    assert len(read) < 10
+    assert len(list(chunks)) == 499